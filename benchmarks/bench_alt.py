@@ -0,0 +1,75 @@
+"""
+Compara nós fixados (settled) por dijkstra e por astar_alt.
+
+Uso:
+    python -m benchmarks.bench_alt [lado_grade] [k_landmarks] [n_consultas]
+
+Roda sobre o grafo do Recife e sobre uma grade sintética lado×lado com
+pesos aleatórios. Um nó é contado como fixado quando o algoritmo expande
+seus vizinhos (uma chamada a get_vizinhos).
+"""
+import random
+import sys
+
+from src.graphs.graph import Graph
+from src.graphs.algorithms import dijkstra
+from src.graphs.alt import preprocessar_landmarks, astar_alt
+from src.graphs.io import carregar_grafo_recife
+
+
+class _Contador:
+    """Proxy que conta expansões de nós sem alterar os algoritmos."""
+
+    def __init__(self, G):
+        self._G = G
+        self.nodes = G.nodes
+        self.get_peso = G.get_peso
+        self.fixados = 0
+
+    def get_vizinhos(self, u):
+        self.fixados += 1
+        return self._G.get_vizinhos(u)
+
+
+def grade(lado: int, seed: int = 7) -> Graph:
+    rng = random.Random(seed)
+    G = Graph()
+    for i in range(lado):
+        for j in range(lado):
+            G.adicionar_no(f"{i},{j}")
+    for i in range(lado):
+        for j in range(lado):
+            if i + 1 < lado:
+                G.adicionar_aresta(f"{i},{j}", f"{i+1},{j}", rng.uniform(1, 2))
+            if j + 1 < lado:
+                G.adicionar_aresta(f"{i},{j}", f"{i},{j+1}", rng.uniform(1, 2))
+    return G
+
+
+def comparar(nome, G, k, n_consultas, seed=1):
+    rng = random.Random(seed)
+    L = preprocessar_landmarks(G, k)
+    nos = list(G.nodes.keys())
+    tot_d = tot_a = 0
+    for _ in range(n_consultas):
+        o, d = rng.choice(nos), rng.choice(nos)
+        cd, ca = _Contador(G), _Contador(G)
+        c1, _ = dijkstra(cd, o, d)
+        c2, _ = astar_alt(ca, o, d, L)
+        assert abs(c1 - c2) < 1e-9 or c1 == c2
+        tot_d += cd.fixados
+        tot_a += ca.fixados
+    print(f"{nome:<14} k={k:<3} consultas={n_consultas:<5} "
+          f"dijkstra={tot_d / n_consultas:9.1f}  alt={tot_a / n_consultas:9.1f}  "
+          f"razão={tot_d / max(1, tot_a):5.2f}x")
+
+
+def main(lado=100, k=8, n_consultas=200):
+    G, _ = carregar_grafo_recife("data/bairros_unique.csv", "data/adjacencia_bairros.csv")
+    comparar("recife", G, k, n_consultas)
+    comparar(f"grade {lado}x{lado}", grade(lado), k, n_consultas)
+
+
+if __name__ == "__main__":
+    args = [int(a) for a in sys.argv[1:]]
+    main(*args)
@@ -0,0 +1,40 @@
+"""
+Benchmark das centralidades (centrality.centralidades).
+
+Uso:
+    python -m benchmarks.bench_centrality [n_arestas] [amostra] [processos]
+
+Gera um grafo sintético e mede as centralidades amostradas ('amostra'
+fontes) em um processo e em 'processos' processos, reportando a cota de
+erro de Hoeffding e a projeção do tempo exato (proporcional às fontes).
+"""
+import sys
+import time
+
+from benchmarks.bench_graph import grafo_sintetico
+from src.graphs.centrality import centralidades
+from src.graphs.csr import CSRGraph
+from src.graphs.graph import Graph
+
+
+def main(n_arestas: int = 50_000, amostra: int = 200, processos: int = 4):
+    nomes, arestas = grafo_sintetico(n_arestas)
+    G = Graph()
+    for n in nomes:
+        G.adicionar_no(n)
+    for u, v, w in arestas:
+        G.adicionar_aresta(u, v, w)
+    C = CSRGraph.from_graph(G)
+    print(f"nós={len(nomes)} arestas={G.get_tamanho()} amostra={amostra}")
+
+    for p in (1, processos):
+        t0 = time.perf_counter()
+        res = centralidades(C, amostra=amostra, processos=p)
+        dt = time.perf_counter() - t0
+        print(f"processos={p:<3} tempo={dt:.2f} s  exato≈{dt * len(nomes) / res['fontes']:.0f} s  "
+              f"erro(intermediacao)={res['erro']['intermediacao']:.3f}")
+
+
+if __name__ == "__main__":
+    args = [int(x) for x in sys.argv[1:]]
+    main(*args)
@@ -0,0 +1,56 @@
+"""
+Benchmark de construção e consulta do Graph em um grafo sintético.
+
+Uso:
+    python -m benchmarks.bench_graph [n_arestas]
+
+Mede: inserção em massa (adicionar_aresta), consulta de pesos (get_peso)
+e uma execução completa de dijkstra.
+"""
+import random
+import sys
+import time
+
+from src.graphs.graph import Graph
+from src.graphs.algorithms import dijkstra
+
+
+def grafo_sintetico(n_arestas: int, seed: int = 42):
+    rng = random.Random(seed)
+    n_nos = max(2, n_arestas // 10)
+    nomes = [f"n{i}" for i in range(n_nos)]
+    pares = [
+        (nomes[rng.randrange(n_nos)], nomes[rng.randrange(n_nos)], rng.random())
+        for _ in range(n_arestas)
+    ]
+    return nomes, pares
+
+
+def main(n_arestas: int = 1_000_000):
+    nomes, pares = grafo_sintetico(n_arestas)
+
+    t0 = time.perf_counter()
+    G = Graph()
+    for n in nomes:
+        G.adicionar_no(n)
+    for u, v, w in pares:
+        G.adicionar_aresta(u, v, w)
+    t_build = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    for u, v, _ in pares:
+        G.get_peso(u, v)
+    t_peso = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    dijkstra(G, nomes[0], nomes[-1])
+    t_dij = time.perf_counter() - t0
+
+    print(f"nós={G.get_ordem()} arestas={G.get_tamanho()}")
+    print(f"construção  : {t_build:8.3f} s")
+    print(f"get_peso x{len(pares)}: {t_peso:8.3f} s")
+    print(f"dijkstra    : {t_dij:8.3f} s")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
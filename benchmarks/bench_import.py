@@ -0,0 +1,60 @@
+"""
+Benchmark do tempo de importação de cada ponto de entrada.
+
+Uso:
+    python -m benchmarks.bench_import [saida.json]
+
+Roda `python -X importtime -c "import <módulo>"` num processo novo por
+ponto de entrada e registra o tempo acumulado do módulo e quais
+dependências pesadas (pandas, numpy, matplotlib, pyvis) foram carregadas.
+Com um caminho de saída, grava também os resultados em JSON.
+"""
+import json
+import subprocess
+import sys
+
+ENTRADAS = [
+    "src.graphs.graph",
+    "src.graphs.algorithms",
+    "src.graphs.io",
+    "src.graphs.csr",
+    "src.graphs.snapshot",
+    "src.viz",
+    "src.solve",
+]
+PESADOS = ("pandas", "numpy", "matplotlib", "pyvis")
+
+
+def medir(modulo: str) -> dict:
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {modulo}"],
+        capture_output=True, text=True, check=True,
+    )
+    # linhas: "import time:   self [us] | cumulative | imported package"
+    acumulado, carregados = {}, set()
+    for linha in proc.stderr.splitlines():
+        if not linha.startswith("import time:") or "cumulative" in linha:
+            continue
+        _, cumul, nome = linha[len("import time:"):].split("|")
+        nome = nome.strip()
+        acumulado[nome] = int(cumul)
+        carregados.add(nome.split(".")[0])
+    return {
+        "modulo": modulo,
+        "total_ms": acumulado.get(modulo, 0) / 1000,
+        "pesados": [p for p in PESADOS if p in carregados],
+    }
+
+
+def main(saida: str | None = None):
+    resultados = [medir(m) for m in ENTRADAS]
+    for r in resultados:
+        print(f"{r['modulo']:<24} {r['total_ms']:8.1f} ms  pesados={','.join(r['pesados']) or '-'}")
+    if saida:
+        with open(saida, "w", encoding="utf-8") as f:
+            json.dump(resultados, f, ensure_ascii=False, indent=2)
+    return resultados
+
+
+if __name__ == "__main__":
+    main(*sys.argv[1:])
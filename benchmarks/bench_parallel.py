@@ -0,0 +1,53 @@
+"""
+Benchmark do roteamento em lote paralelo (RoteadorParalelo).
+
+Uso:
+    python -m benchmarks.bench_parallel [n_pares] [n_arestas] [processos...]
+
+Gera um grafo sintético e n_pares pares OD com muitas origens distintas,
+mede rotas_em_lote (um processo) e o RoteadorParalelo para cada número de
+processos pedido (padrão: 1, 2, 4, ... até os.cpu_count()), reportando o
+ganho em relação ao sequencial. O tempo do paralelo inclui publicar o grafo.
+"""
+import os
+import random
+import sys
+import time
+
+from benchmarks.bench_graph import grafo_sintetico
+from src.graphs.algorithms import rotas_em_lote
+from src.graphs.graph import Graph
+from src.graphs.parallel import RoteadorParalelo
+
+
+def main(n_pares: int = 5_000, n_arestas: int = 100_000, *processos: int):
+    nomes, arestas = grafo_sintetico(n_arestas)
+    G = Graph()
+    for n in nomes:
+        G.adicionar_no(n)
+    for u, v, w in arestas:
+        G.adicionar_aresta(u, v, w)
+
+    rng = random.Random(1)
+    origens = rng.sample(nomes, min(len(nomes), max(1, n_pares // 20)))
+    pares = [(rng.choice(origens), rng.choice(nomes)) for _ in range(n_pares)]
+
+    t0 = time.perf_counter()
+    rotas_em_lote(G, pares)
+    t_seq = time.perf_counter() - t0
+    print(f"pares={n_pares} origens={len(origens)} sequencial={t_seq:.2f} s")
+
+    if not processos:
+        cpus = os.cpu_count() or 1
+        processos = tuple(p for p in (1, 2, 4, 8, 16, 32, 64) if p <= cpus) or (1,)
+    for p in processos:
+        t0 = time.perf_counter()
+        with RoteadorParalelo(G, processos=p) as R:
+            R.rotas(pares)
+        dt = time.perf_counter() - t0
+        print(f"processos={p:<3} tempo={dt:.2f} s  ganho={t_seq / dt:.2f}x")
+
+
+if __name__ == "__main__":
+    args = [int(x) for x in sys.argv[1:]]
+    main(*args)
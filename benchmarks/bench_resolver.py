@@ -0,0 +1,60 @@
+"""
+Benchmark da resolução de nomes de bairro (ResolvedorBairros).
+
+Uso:
+    python -m benchmarks.bench_resolver [n_textos]
+
+Gera n_textos variações de texto livre (caixa, acentos, hífens, espaços,
+erros de digitação) dos bairros do Recife e compara padronizar_nome linha
+a linha (NFKD por linha) com ResolvedorBairros.resolver_muitos.
+"""
+import random
+import sys
+import time
+
+from src.graphs.io import carregar_grafo_recife_csv
+from src.graphs.resolver import ResolvedorBairros, padronizar_nome
+
+PATH_NODES = "data/bairros_unique.csv"
+PATH_EDGES = "data/adjacencia_bairros.csv"
+
+
+def _variacao(rng: random.Random, nome: str) -> str:
+    r = rng.random()
+    if r < 0.3:
+        return nome.upper()
+    if r < 0.5:
+        return f"  {nome.lower()} "
+    if r < 0.7:
+        return nome.replace(" ", "-")
+    if r < 0.8 and len(nome) > 4:
+        i = rng.randrange(1, len(nome) - 1)
+        return nome[:i] + nome[i + 1:]     # erro de digitação
+    return nome
+
+
+def main(n_textos: int = 1_000_000):
+    G, _ = carregar_grafo_recife_csv(PATH_NODES, PATH_EDGES)
+    nomes = sorted(G.nodes)
+    rng = random.Random(0)
+    textos = [_variacao(rng, rng.choice(nomes)) for _ in range(n_textos)]
+
+    t0 = time.perf_counter()
+    linha_a_linha = [padronizar_nome(t) for t in textos]
+    t_linha = time.perf_counter() - t0
+    exatos = sum(n in G.nodes for n in linha_a_linha)
+
+    t0 = time.perf_counter()
+    R = ResolvedorBairros(G.nodes)
+    resolvidos = R.resolver_muitos(textos)
+    t_lote = time.perf_counter() - t0
+    achados = sum(r is not None for r in resolvidos)
+
+    print(f"textos={n_textos} distintos={len(set(textos))}")
+    print(f"padronizar_nome por linha: {t_linha:.2f} s  resolvidos={exatos}")
+    print(f"resolver_muitos:           {t_lote:.2f} s  resolvidos={achados}")
+
+
+if __name__ == "__main__":
+    args = [int(x) for x in sys.argv[1:]]
+    main(*args)
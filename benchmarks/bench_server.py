@@ -0,0 +1,87 @@
+"""
+Gerador de carga para o servidor residente (python -m src.cli servir).
+
+Uso:
+    python -m benchmarks.bench_server [n_clientes] [pedidos_por_cliente] [socket]
+
+Sem 'socket', sobe o servidor num subprocesso com um socket Unix
+temporário. Cada cliente mantém um pedido em voo por vez (90% rotas,
+5% BFS, 5% métricas) e mede a latência de ida e volta. Reporta p50/p99
+e a vazão (QPS) agregada.
+"""
+import asyncio
+import json
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
+
+from src.cli import PATH_EDGES, PATH_NODES
+from src.graphs.io import carregar_grafo_recife_csv
+
+
+def _percentil(valores: list[float], p: float) -> float:
+    ordenados = sorted(valores)
+    return ordenados[min(len(ordenados) - 1, int(p / 100 * len(ordenados)))]
+
+
+async def _cliente(sock: str, nos: list[str], n: int, seed: int) -> list[float]:
+    rng = random.Random(seed)
+    reader, writer = await asyncio.open_unix_connection(sock)
+    latencias = []
+    for i in range(n):
+        r = rng.random()
+        if r < 0.90:
+            pedido = {"op": "rota", "origem": rng.choice(nos), "destino": rng.choice(nos)}
+        elif r < 0.95:
+            pedido = {"op": "bfs", "origem": rng.choice(nos)}
+        else:
+            pedido = {"op": "metricas"}
+        pedido["id"] = i
+        t0 = time.perf_counter()
+        writer.write(json.dumps(pedido).encode() + b"\n")
+        await writer.drain()
+        resposta = json.loads(await reader.readline())
+        latencias.append(time.perf_counter() - t0)
+        assert "erro" not in resposta, resposta
+    writer.close()
+    return latencias
+
+
+async def _carga(sock: str, nos: list[str], n_clientes: int, n_pedidos: int):
+    t0 = time.perf_counter()
+    por_cliente = await asyncio.gather(
+        *(_cliente(sock, nos, n_pedidos, seed) for seed in range(n_clientes))
+    )
+    return [x for lat in por_cliente for x in lat], time.perf_counter() - t0
+
+
+def main(n_clientes: int = 32, n_pedidos: int = 200, sock: str | None = None):
+    G, _ = carregar_grafo_recife_csv(PATH_NODES, PATH_EDGES)
+    nos = sorted(G.nodes)
+
+    servidor = None
+    if sock is None:
+        sock = os.path.join(tempfile.mkdtemp(), "grafos.sock")
+        servidor = subprocess.Popen([sys.executable, "-m", "src.cli", "servir", "--unix", sock],
+                                    stdout=subprocess.DEVNULL)
+        while not os.path.exists(sock):
+            if servidor.poll() is not None:
+                raise SystemExit("servidor terminou antes de abrir o socket")
+            time.sleep(0.05)
+    try:
+        latencias, total = asyncio.run(_carga(sock, nos, int(n_clientes), int(n_pedidos)))
+    finally:
+        if servidor is not None:
+            servidor.terminate()
+            servidor.wait()
+
+    print(f"clientes={n_clientes} pedidos={len(latencias)} "
+          f"p50={_percentil(latencias, 50) * 1e3:.2f} ms p99={_percentil(latencias, 99) * 1e3:.2f} ms "
+          f"QPS={len(latencias) / total:.0f}")
+
+
+if __name__ == "__main__":
+    main(*sys.argv[1:])
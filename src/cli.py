@@ -0,0 +1,240 @@
+# src/cli.py
+"""
+Servidor residente de consultas ao grafo do Recife.
+
+Carrega o grafo uma única vez e atende, por um socket Unix ou TCP local,
+pedidos em JSON (um objeto por linha; a resposta é uma linha JSON com o
+mesmo "id"). Operações:
+
+  {"op": "rota", "origem": ..., "destino": ...}  -> {"custo", "caminho"}
+  {"op": "bfs", "origem": ...}                   -> {"camadas": [[nós do nível 0], ...]}
+  {"op": "metricas"}                             -> ordem, tamanho, densidade, grau_maximo
+  {"op": "top_k", "k": 10}                       -> {"top": [[bairro, grau], ...]}
+  {"op": "microrregioes"}                        -> métricas por microrregião
+  {"op": "cache"}                                -> contadores do cache de rotas
+
+Rotas e BFS passam antes por um CacheRotas (LRU por versão do grafo); as
+rotas que faltam e chegam juntas são agrupadas em lotes (rotas_em_lote: um
+Dijkstra por origem distinta); consultas mais longas rodam num executor,
+então um cliente lento não trava os demais.
+
+O grafo vem do snapshot binário (snapshot.carregar_grafo_recife_cache),
+refeito a partir dos CSVs só quando eles mudam; --sem-snapshot lê os CSVs.
+
+Uso:
+    python -m src.cli servir --unix /tmp/grafos.sock
+    python -m src.cli servir --porta 8765
+"""
+import argparse
+import asyncio
+import json
+from concurrent.futures import ThreadPoolExecutor
+
+from .graphs.algorithms import rotas_em_lote
+from .graphs.cache import CacheRotas
+from .graphs.io import carregar_grafo_recife_csv
+
+DATA_DIR = 'data'
+PATH_NODES = f"{DATA_DIR}/bairros_unique.csv"
+PATH_EDGES = f"{DATA_DIR}/adjacencia_bairros.csv"
+
+
+def _custo_json(custo: float):
+    # JSON não tem infinito: destino inalcançável vira null
+    return None if custo == float("inf") else custo
+
+
+def _rotas_isoladas(G, pares) -> list:
+    """
+    rotas_em_lote; se o lote falhar, refaz par a par para que um pedido
+    ruim não derrube os demais. Cada item é (custo, caminho) ou a exceção.
+    """
+    try:
+        return rotas_em_lote(G, pares)
+    except Exception:
+        saida = []
+        for par in pares:
+            try:
+                saida.append(rotas_em_lote(G, [par])[0])
+            except Exception as e:
+                saida.append(e)
+        return saida
+
+
+class ServidorRotas:
+    """
+    Atende consultas sobre um grafo já carregado.
+    'janela' (s) e 'max_lote' controlam o agrupamento de pedidos de rota.
+    """
+
+    def __init__(self, G, janela: float = 0.002, max_lote: int = 512, trabalhadores: int = 4,
+                 cache: CacheRotas | None = None):
+        self.G = G
+        self.cache = cache if cache is not None else CacheRotas(G)
+        self.janela = janela
+        self.max_lote = max_lote
+        self._executor = ThreadPoolExecutor(max_workers=trabalhadores)
+        self._fila: asyncio.Queue | None = None
+        self._lotes: asyncio.Task | None = None
+
+    async def iniciar(self, unix: str | None = None, host: str = "127.0.0.1", porta: int = 8765):
+        """Abre o socket e começa a agrupar rotas. Retorna o asyncio.Server."""
+        self._fila = asyncio.Queue()
+        self._lotes = asyncio.create_task(self._agrupar_rotas())
+        if unix:
+            return await asyncio.start_unix_server(self._cliente, path=unix)
+        return await asyncio.start_server(self._cliente, host=host, port=porta)
+
+    async def fechar(self) -> None:
+        if self._lotes is not None:
+            self._lotes.cancel()
+        self._executor.shutdown(wait=False)
+
+
+    # ---- conexão ----
+
+    async def _cliente(self, reader, writer):
+        pendentes = set()
+        try:
+            while linha := await reader.readline():
+                if not linha.strip():
+                    continue
+                # cada pedido vira uma tarefa: respostas podem sair fora de ordem (use "id")
+                t = asyncio.create_task(self._responder(linha, writer))
+                pendentes.add(t)
+                t.add_done_callback(pendentes.discard)
+            if pendentes:
+                await asyncio.gather(*pendentes)
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def _responder(self, linha: bytes, writer) -> None:
+        pedido = {}
+        try:
+            pedido = json.loads(linha)
+            resposta = await self.tratar(pedido)
+        except Exception as e:
+            resposta = {"erro": f"{type(e).__name__}: {e}"}
+        if isinstance(pedido, dict) and "id" in pedido:
+            resposta["id"] = pedido["id"]
+        writer.write(json.dumps(resposta, ensure_ascii=False).encode("utf-8") + b"\n")
+        await writer.drain()
+
+
+    # ---- operações ----
+
+    async def tratar(self, pedido: dict) -> dict:
+        op = pedido.get("op")
+        G = self.G
+        if op == "rota":
+            origem, destino = pedido["origem"], pedido["destino"]
+            if not isinstance(origem, str) or not isinstance(destino, str):
+                raise TypeError("'origem' e 'destino' devem ser strings")
+            rota = self.cache.rota_em_cache(origem, destino)
+            if rota is None:
+                versao = self.cache.versao_atual()
+                fut = asyncio.get_running_loop().create_future()
+                await self._fila.put((origem, destino, fut))
+                rota = self.cache.guardar_rota(versao, origem, destino, *await fut)
+            custo, caminho = rota
+            return {"custo": _custo_json(custo), "caminho": caminho}
+        if op == "bfs":
+            ordem, _, prof = await self._no_executor(self.cache.bfs_layers, pedido["origem"])
+            camadas: list[list[str]] = []
+            for n in ordem:
+                if prof[n] == len(camadas):
+                    camadas.append([])
+                camadas[prof[n]].append(n)
+            return {"camadas": camadas}
+        if op == "metricas":
+            return {
+                "ordem": G.get_ordem(),
+                "tamanho": G.get_tamanho(),
+                "densidade": G.get_densidade(),
+                "grau_maximo": G.get_grau_maximo(),
+            }
+        if op == "cache":
+            return self.cache.estatisticas()
+        if op == "top_k":
+            return {"top": [list(par) for par in G.top_k_grau(int(pedido.get("k", 10)))]}
+        if op == "microrregioes":
+            grupos = G.metricas_grupos()
+            return {"microrregioes": [{"microrregiao": int(g), **m} for g, m in sorted(grupos.items())]}
+        raise ValueError(f"operação desconhecida: {op!r}")
+
+    async def _no_executor(self, f, *args):
+        return await asyncio.get_running_loop().run_in_executor(self._executor, f, *args)
+
+    async def _agrupar_rotas(self) -> None:
+        """Junta os pedidos de rota que chegam dentro de 'janela' e os resolve em lote."""
+        loop = asyncio.get_running_loop()
+        while True:
+            lote = [await self._fila.get()]
+            limite = loop.time() + self.janela
+            while len(lote) < self.max_lote:
+                resta = limite - loop.time()
+                if resta <= 0:
+                    break
+                try:
+                    lote.append(await asyncio.wait_for(self._fila.get(), resta))
+                except asyncio.TimeoutError:
+                    break
+            pares = [(o, d) for o, d, _ in lote]
+            try:
+                rotas = await self._no_executor(_rotas_isoladas, self.G, pares)
+            except Exception as e:
+                rotas = [e] * len(lote)
+            for (_, _, fut), rota in zip(lote, rotas):
+                if fut.done():
+                    continue
+                if isinstance(rota, Exception):
+                    fut.set_exception(rota)
+                else:
+                    fut.set_result(rota)
+
+
+async def servir(G, unix: str | None = None, host: str = "127.0.0.1", porta: int = 8765, **opcoes) -> None:
+    servidor = ServidorRotas(G, **opcoes)
+    srv = await servidor.iniciar(unix=unix, host=host, porta=porta)
+    onde = unix or f"{host}:{porta}"
+    print(f"Servindo consultas em {onde} ({G.get_ordem()} nós, {G.get_tamanho()} arestas).", flush=True)
+    try:
+        async with srv:
+            await srv.serve_forever()
+    finally:
+        await servidor.fechar()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m src.cli")
+    sub = parser.add_subparsers(dest="comando", required=True)
+    p = sub.add_parser("servir", help="servidor residente de consultas ao grafo")
+    p.add_argument("--unix", help="caminho do socket Unix (padrão: TCP local)")
+    p.add_argument("--host", default="127.0.0.1")
+    p.add_argument("--porta", type=int, default=8765)
+    p.add_argument("--nos", default=PATH_NODES)
+    p.add_argument("--arestas", default=PATH_EDGES)
+    p.add_argument("--janela-ms", type=float, default=2.0, help="espera máxima para agrupar rotas")
+    p.add_argument("--snapshot", help="diretório do snapshot binário (padrão: junto das arestas)")
+    p.add_argument("--sem-snapshot", action="store_true", help="sempre relê os CSVs")
+    args = parser.parse_args(argv)
+
+    if args.sem_snapshot:
+        G, _ = carregar_grafo_recife_csv(args.nos, args.arestas)
+    else:
+        # CSR mapeado do disco enquanto os CSVs conferirem com a impressão gravada
+        from .graphs.snapshot import carregar_grafo_recife_cache
+        G, _ = carregar_grafo_recife_cache(args.nos, args.arestas, args.snapshot)
+    if G is None:
+        raise SystemExit(1)
+    try:
+        asyncio.run(servir(G, unix=args.unix, host=args.host, porta=args.porta,
+                           janela=args.janela_ms / 1000))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
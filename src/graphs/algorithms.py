@@ -45,6 +45,298 @@ def dijkstra(G, origem: str, destino: str):
     path.reverse()
     return float(dist[destino]), path
 
+def dijkstra_arvore(G, origem: str, alvos=None):
+    """
+    Dijkstra de fonte única: constrói a árvore de menores caminhos a partir
+    de 'origem'. Se 'alvos' for dado, para assim que todos forem fixados.
+    Retorna (dist, prev), contendo apenas os nós alcançados.
+    """
+    if origem not in G.nodes:
+        return {}, {}
+
+    dist = {origem: 0.0}
+    prev = {origem: None}
+    fixados = set()
+    faltam = None if alvos is None else {a for a in alvos if a in G.nodes}
+    pq = [(0.0, origem)]
+
+    while pq:
+        d, u = heapq.heappop(pq)
+        if u in fixados:
+            continue
+        fixados.add(u)
+        if faltam is not None:
+            faltam.discard(u)
+            if not faltam:
+                break
+
+        for v in G.get_vizinhos(u):
+            nd = d + float(G.get_peso(u, v))
+            if nd < dist.get(v, float("inf")):
+                dist[v] = nd
+                prev[v] = u
+                heapq.heappush(pq, (nd, v))
+
+    return dist, prev
+
+
+def caminho_da_arvore(dist: dict, prev: dict, destino: str):
+    """
+    Lê (custo, caminho) de 'destino' numa árvore gerada por dijkstra_arvore.
+    Retorna (inf, []) se o destino não foi alcançado.
+    """
+    if destino not in dist:
+        return float("inf"), []
+    path = []
+    cur = destino
+    while cur is not None:
+        path.append(cur)
+        cur = prev[cur]
+    path.reverse()
+    return float(dist[destino]), path
+
+
+def rotas_em_lote(G, pares):
+    """
+    Menores caminhos para uma lista de pares (origem, destino).
+    Agrupa os pares por origem e roda um único Dijkstra de fonte única por
+    origem distinta, respondendo todos os destinos pela árvore resultante.
+    Retorna uma lista de (custo_total, caminho), na mesma ordem de 'pares'.
+    """
+    por_origem: dict[str, list[int]] = {}
+    pares = list(pares)
+    for i, (origem, _) in enumerate(pares):
+        por_origem.setdefault(origem, []).append(i)
+
+    resultados = [None] * len(pares)
+    for origem, idxs in por_origem.items():
+        destinos = {pares[i][1] for i in idxs}
+        dist, prev = dijkstra_arvore(G, origem, alvos=destinos)
+        for i in idxs:
+            resultados[i] = caminho_da_arvore(dist, prev, pares[i][1])
+    return resultados
+
+
+def _custo_caminho(G, caminho) -> float:
+    # soma na ordem do caminho, como dijkstra acumula: custos idênticos bit a bit
+    custo = 0.0
+    for a, b in zip(caminho, caminho[1:]):
+        custo += float(G.get_peso(a, b))
+    return custo
+
+
+def _desvio_a_estrela(G, s: str, t: str, h: dict, bloqueados: set, proibidos_s: set):
+    """
+    A* de 's' a 't' com uma máscara sobre o grafo (sem copiá-lo): ignora os
+    nós em 'bloqueados' e as arestas (s, v) com v em 'proibidos_s'.
+    'h' é a distância de cada nó até 't' no grafo inteiro; remover nós e
+    arestas só aumenta distâncias, então a heurística segue consistente.
+    Retorna (custo, caminho) ou None se 't' ficou inalcançável.
+    """
+    dist = {s: 0.0}
+    prev = {s: None}
+    fixados = set()
+    pq = [(h[s], 0.0, s)]
+    while pq:
+        _, d, u = heapq.heappop(pq)
+        if u in fixados:
+            continue
+        fixados.add(u)
+        if u == t:
+            return caminho_da_arvore(dist, prev, t)
+        for v in G.get_vizinhos(u):
+            if v in bloqueados or v not in h or (u == s and v in proibidos_s):
+                continue
+            nd = d + float(G.get_peso(u, v))
+            if nd < dist.get(v, float("inf")):
+                dist[v] = nd
+                prev[v] = u
+                heapq.heappush(pq, (nd + h[v], nd, v))
+    return None
+
+
+def k_menores_caminhos(G, origem: str, destino: str, k: int | None = None):
+    """
+    Os 'k' menores caminhos simples (sem repetir nó) de 'origem' a 'destino',
+    pelo algoritmo de Yen. Gerador: produz (custo_total, caminho_em_lista),
+    no mesmo formato de dijkstra, em ordem crescente de custo, calculando
+    cada caminho só quando pedido. Com k=None segue até esgotar os caminhos.
+
+    Uma única árvore de menores caminhos a partir de 'destino' é reaproveitada
+    em todos os desvios: se o ramo da árvore a partir do nó de desvio não
+    toca a máscara, ele já é o desvio ótimo; senão, a distância na árvore
+    serve de heurística para um A* mascarado. O grafo nunca é copiado.
+    Assume grafo não direcionado (como Graph).
+    """
+    if origem not in G.nodes or destino not in G.nodes:
+        return
+    ate_destino, proximo = dijkstra_arvore(G, destino)
+    if origem not in ate_destino:
+        return
+
+    def _ramo_da_arvore(u):
+        caminho = [u]
+        while caminho[-1] != destino:
+            caminho.append(proximo[caminho[-1]])
+        return caminho
+
+    achados: list[list[str]] = []
+    candidatos: list = []        # heap de (custo, caminho)
+    vistos: set[tuple] = set()
+    primeiro = _ramo_da_arvore(origem)
+    atual = (_custo_caminho(G, primeiro), primeiro)
+    vistos.add(tuple(atual[1]))
+
+    while k is None or len(achados) < k:
+        custo, caminho = atual
+        achados.append(caminho)
+        yield custo, list(caminho)
+        if k is not None and len(achados) >= k:
+            return
+
+        for i, desvio in enumerate(caminho[:-1]):
+            raiz = caminho[:i + 1]
+            bloqueados = set(raiz[:-1])
+            proibidos = {p[i + 1] for p in achados if len(p) > i + 1 and p[:i + 1] == raiz}
+
+            resto = _ramo_da_arvore(desvio)
+            if resto[1] in proibidos or not bloqueados.isdisjoint(resto):
+                achado = _desvio_a_estrela(G, desvio, destino, ate_destino, bloqueados, proibidos)
+                if achado is None:
+                    continue
+                resto = achado[1]
+            novo = raiz[:-1] + resto
+            chave = tuple(novo)
+            if chave not in vistos:
+                vistos.add(chave)
+                heapq.heappush(candidatos, (_custo_caminho(G, novo), novo))
+
+        if not candidatos:
+            return
+        atual = heapq.heappop(candidatos)
+
+
+class CicloNegativoError(ValueError):
+    """Há um ciclo de custo negativo alcançável a partir da origem."""
+
+    def __init__(self, ciclo: list[str]):
+        self.ciclo = ciclo
+        super().__init__(f"Ciclo negativo alcançável: {' -> '.join(ciclo)}")
+
+
+def _extrair_ciclo(prev: dict, v):
+    """Segue 'prev' a partir de v até repetir um nó; retorna o ciclo em ordem."""
+    visto = {}
+    cur = v
+    while cur is not None and cur not in visto:
+        visto[cur] = len(visto)
+        cur = prev.get(cur)
+    if cur is None:
+        return []
+    ciclo = [n for n, _ in sorted(visto.items(), key=lambda kv: kv[1]) if visto[n] >= visto[cur]]
+    ciclo.reverse()
+    return ciclo + [ciclo[0]]
+
+
+def _bellman_ford_fila(G, origem: str):
+    """SPFA: só reexamina nós cuja distância mudou (fila FIFO)."""
+    n = len(G.nodes)
+    dist = {origem: 0.0}
+    prev = {origem: None}
+    arestas = {origem: 0}   # nº de arestas no caminho atual até o nó
+    fila = deque([origem])
+    na_fila = {origem}
+
+    while fila:
+        u = fila.popleft()
+        na_fila.discard(u)
+        du = dist[u]
+        for v in G.get_vizinhos(u):
+            nd = du + float(G.get_peso(u, v))
+            if nd < dist.get(v, float("inf")):
+                dist[v] = nd
+                prev[v] = u
+                arestas[v] = arestas[u] + 1
+                if arestas[v] >= n:
+                    raise CicloNegativoError(_extrair_ciclo(prev, v))
+                if v not in na_fila:
+                    na_fila.add(v)
+                    fila.append(v)
+
+    return dist, prev
+
+
+def _bellman_ford_vetorizado(G, origem: str):
+    """
+    Uma rodada = relaxação de todas as arestas numa passada NumPy sobre os
+    arrays CSR. Para quando uma rodada não muda nada.
+    """
+    import numpy as np
+    from .csr import CSRGraph
+
+    C = G if isinstance(G, CSRGraph) else CSRGraph.from_graph(G)
+    n = C.get_ordem()
+    graus = np.diff(C.indptr)
+    linha = np.repeat(np.arange(n, dtype=np.int32), graus)
+    com_viz = graus > 0
+    inicio = C.indptr[:-1][com_viz]
+
+    dist = np.full(n, np.inf)
+    dist[C.ids[origem]] = 0.0
+    prev = np.full(n, -1, dtype=np.int64)
+
+    for _ in range(n):
+        # grafo simétrico: as entradas da linha v são as arestas que chegam em v;
+        # fmin ignora pesos NaN (como a comparação nd < dist em dijkstra)
+        cand = dist[C.indices] + C.weights
+        novo = dist.copy()
+        if len(inicio):
+            novo[com_viz] = np.fmin(dist[com_viz], np.fmin.reduceat(cand, inicio))
+        mudou = novo < dist
+        if not mudou.any():
+            break
+        e = mudou[linha] & (cand == novo[linha])
+        prev[linha[e]] = C.indices[e]
+        dist = novo
+    else:
+        nomes = C.nomes
+        prev_nomes = {nomes[i]: (nomes[p] if p >= 0 else None) for i, p in enumerate(prev.tolist())}
+        raise CicloNegativoError(_extrair_ciclo(prev_nomes, nomes[int(np.argmax(mudou))]))
+
+    nomes = C.nomes
+    alcancados = np.flatnonzero(np.isfinite(dist)).tolist()
+    dist_d = {nomes[i]: float(dist[i]) for i in alcancados}
+    prev_d = {nomes[i]: (nomes[prev[i]] if prev[i] >= 0 else None) for i in alcancados}
+    return dist_d, prev_d
+
+
+def bellman_ford_arvore(G, origem: str, modo: str = "fila"):
+    """
+    Bellman–Ford de fonte única; aceita pesos negativos.
+      - modo="fila": SPFA (fila FIFO, só reprocessa nós alterados)
+      - modo="vetorizado": rodadas NumPy sobre todas as arestas (CSR)
+    Retorna (dist, prev) apenas com os nós alcançados, como dijkstra_arvore.
+    Levanta CicloNegativoError se houver ciclo negativo alcançável. Em grafo
+    não-direcionado, qualquer aresta negativa alcançável já forma um (u-v-u).
+    """
+    if origem not in G.nodes:
+        return {}, {}
+    if modo == "fila":
+        return _bellman_ford_fila(G, origem)
+    if modo == "vetorizado":
+        return _bellman_ford_vetorizado(G, origem)
+    raise ValueError("`modo` deve ser 'fila' ou 'vetorizado'.")
+
+
+def bellman_ford(G, origem: str, destino: str, modo: str = "fila"):
+    """
+    Menor caminho com pesos possivelmente negativos.
+    Retorna: (custo_total, caminho_em_lista), como dijkstra.
+    """
+    dist, prev = bellman_ford_arvore(G, origem, modo)
+    return caminho_da_arvore(dist, prev, destino)
+
+
 def bfs_layers(G, source: str):
     """
     BFS clássico a partir de 'source'.
@@ -56,6 +348,17 @@ def bfs_layers(G, source: str):
     if source not in G.nodes:
         raise KeyError(f"Nó de origem '{source}' não existe no grafo.")
 
+    if getattr(G, "indptr", None) is not None:
+        # CSRGraph: BFS por níveis sobre os arrays (mesma profundidade; dentro
+        # do nível, ordem e pais seguem as linhas do CSR — ver bfs_arrays)
+        ordem, pai, prof = bfs_arrays(G, source)
+        nomes = G.nomes
+        visit_order = [nomes[i] for i in ordem.tolist()]
+        pai_l, prof_l = pai.tolist(), prof.tolist()
+        parent = {nomes[i]: (nomes[pai_l[i]] if pai_l[i] >= 0 else None) for i in ordem.tolist()}
+        depth = {nomes[i]: prof_l[i] for i in ordem.tolist()}
+        return visit_order, parent, depth
+
     visit_order: list[str] = []
     parent: dict[str, str | None] = {source: None}
     depth: dict[str, int] = {source: 0}
@@ -75,23 +378,148 @@ def bfs_layers(G, source: str):
     return visit_order, parent, depth
 
 
-def dfs_preorder(G, source: str):
+def _expandir(C, nos):
+    """Concatena as linhas CSR de 'nos': retorna (dono, vizinho) por entrada."""
+    import numpy as np
+
+    cont = C.indptr[nos + 1] - C.indptr[nos]
+    total = int(cont.sum())
+    donos = np.repeat(nos, cont)
+    desloc = np.arange(total) - np.repeat(np.cumsum(cont) - cont, cont)
+    return donos, C.indices[np.repeat(C.indptr[nos], cont) + desloc]
+
+
+def bfs_arrays(C, source: str, alpha: float = 14.0, beta: float = 24.0):
     """
-    DFS recursiva simples: retorna a ordem de visita (pré-ordem).
-    Útil para testes e explorações.
+    BFS por níveis com otimização de direção (top-down / bottom-up) sobre
+    um CSRGraph. Cada nível é expandido numa passada vetorizada.
+      - top-down: expande as arestas da fronteira
+      - bottom-up: cada nó não visitado procura um pai na fronteira
+    Troca para bottom-up quando as arestas da fronteira passam de
+    (arestas dos não visitados) / alpha, e volta quando a fronteira fica
+    menor que n / beta. Visitados ficam num bitmap (array bool).
+
+    Os dois modos dão a mesma ordem e os mesmos pais do BFS clássico sobre
+    o próprio CSRGraph (linhas ordenadas por id). Em relação a bfs_layers
+    sobre o Graph equivalente, só a profundidade de cada nó (e portanto o
+    conjunto de nós de cada nível) é garantida: dentro de um nível a ordem
+    e a escolha do pai seguem a ordem das linhas do CSR, não a de inserção.
+
+    Retorna (ordem, pai, profundidade) como arrays NumPy indexados por id:
+      - ordem: ids na ordem de descoberta (por nível)
+      - pai: id do predecessor (-1 na origem e nos não alcançados)
+      - profundidade: nº de arestas até source (-1 se não alcançado)
     """
-    if source not in G.nodes:
+    import numpy as np
+
+    if source not in C.ids:
         raise KeyError(f"Nó de origem '{source}' não existe no grafo.")
 
-    order: list[str] = []
-    seen = set()
+    n = C.get_ordem()
+    s = C.ids[source]
+    graus = np.diff(C.indptr)
+    visitado = np.zeros(n, dtype=bool)
+    pai = np.full(n, -1, dtype=np.int32)
+    prof = np.full(n, -1, dtype=np.int32)
+    visitado[s] = True
+    prof[s] = 0
 
-    def _dfs(u: str):
-        seen.add(u)
-        order.append(u)
-        for v in G.get_vizinhos(u):
+    fronteira = np.array([s], dtype=np.int64)
+    niveis = [fronteira]
+    arestas_nao_visitadas = int(graus.sum() - graus[s])
+    bottom_up = False
+    nivel = 0
+
+    while len(fronteira):
+        arestas_fronteira = int(graus[fronteira].sum())
+        if not bottom_up and arestas_fronteira > arestas_nao_visitadas / alpha:
+            bottom_up = True
+        elif bottom_up and len(fronteira) < n / beta:
+            bottom_up = False
+
+        if bottom_up:
+            posicao = np.full(n, -1, dtype=np.int64)
+            posicao[fronteira] = np.arange(len(fronteira))
+            donos, viz = _expandir(C, np.flatnonzero(~visitado))
+            m = posicao[viz] >= 0
+            cand, cand_pai = donos[m], viz[m]
+            # pai = o vizinho que vem primeiro na fronteira (o que o top-down acharia)
+            o = np.lexsort((posicao[cand_pai], cand))
+            novos, primeiro = np.unique(cand[o], return_index=True)
+            pais = cand_pai[o][primeiro]
+            # ordem do top-down: pela posição do pai, depois pela linha (ids ordenados)
+            o = np.lexsort((novos, posicao[pais]))
+            novos, pais = novos[o], pais[o]
+        else:
+            donos, viz = _expandir(C, fronteira)
+            m = ~visitado[viz]
+            unicos, primeiro = np.unique(viz[m], return_index=True)
+            ordem = np.argsort(primeiro, kind="stable")
+            novos = unicos[ordem]
+            pais = donos[m][primeiro[ordem]]
+
+        nivel += 1
+        visitado[novos] = True
+        pai[novos] = pais
+        prof[novos] = nivel
+        arestas_nao_visitadas -= int(graus[novos].sum())
+        fronteira = novos.astype(np.int64)
+        niveis.append(fronteira)
+
+    return np.concatenate(niveis).astype(np.int32), pai, prof
+
+
+DESCOBERTA = "descoberta"
+TERMINO = "termino"
+
+
+def _dfs_eventos(G, source: str):
+    seen = {source}
+    yield DESCOBERTA, source
+    pilha = [(source, iter(G.get_vizinhos(source)))]
+    while pilha:
+        u, vizinhos = pilha[-1]
+        for v in vizinhos:
             if v not in seen:
-                _dfs(v)
+                seen.add(v)
+                yield DESCOBERTA, v
+                pilha.append((v, iter(G.get_vizinhos(v))))
+                break
+        else:
+            pilha.pop()
+            yield TERMINO, u
 
-    _dfs(source)
-    return order
\ No newline at end of file
+
+def dfs_eventos(G, source: str):
+    """
+    DFS iterativa (pilha explícita, sem limite de recursão) como gerador
+    de eventos (tipo, nó), com tipo DESCOBERTA ou TERMINO. Visita os
+    vizinhos na mesma ordem da versão recursiva; o consumidor pode parar
+    a qualquer momento sem pagar pela travessia inteira.
+    """
+    if source not in G.nodes:
+        raise KeyError(f"Nó de origem '{source}' não existe no grafo.")
+    return _dfs_eventos(G, source)
+
+
+def dfs_iter(G, source: str, ordem: str = "pre"):
+    """
+    Gera os nós da DFS a partir de 'source' sob demanda.
+      - ordem="pre": na descoberta (pré-ordem)
+      - ordem="pos": no término (pós-ordem)
+    """
+    if ordem == "pre":
+        alvo = DESCOBERTA
+    elif ordem == "pos":
+        alvo = TERMINO
+    else:
+        raise ValueError("`ordem` deve ser 'pre' ou 'pos'.")
+    return (u for tipo, u in dfs_eventos(G, source) if tipo == alvo)
+
+
+def dfs_preorder(G, source: str):
+    """
+    DFS simples: retorna a ordem de visita (pré-ordem).
+    Útil para testes e explorações. Ver dfs_iter para a versão sob demanda.
+    """
+    return list(dfs_iter(G, source, "pre"))
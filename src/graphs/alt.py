@@ -0,0 +1,132 @@
+import heapq
+
+import numpy as np
+
+from .algorithms import dijkstra_arvore
+
+
+class Landmarks:
+    """
+    Pré-processamento ALT (A*, landmarks, desigualdade triangular).
+
+    Guarda, para cada landmark L, o array de distâncias d(L, v) a todos os
+    nós (matriz n×k, inf se inalcançável). Como o grafo é não-direcionado,
+    d(L, v) = d(v, L): o mesmo array serve às cotas "de" e "para" L.
+
+    Cota inferior para qualquer peso não-negativo:
+        d(v, t) >= max_L |d(L, t) - d(L, v)|
+    """
+
+    def __init__(self, nomes: list[str], escolhidos: list[str], dist: np.ndarray):
+        self.nomes = list(nomes)
+        self.ids = {n: i for i, n in enumerate(self.nomes)}
+        self.escolhidos = list(escolhidos)
+        self.dist = np.asarray(dist, dtype=np.float64)   # (n, k)
+
+    def cota(self, v: str, destino: str) -> float:
+        """Cota inferior de d(v, destino); inf se estão em componentes distintas."""
+        return _cota(self.dist[self.ids[v]], self.dist[self.ids[destino]])
+
+
+def _cota(dv: np.ndarray, dt: np.ndarray) -> float:
+    with np.errstate(invalid="ignore"):
+        diff = np.abs(dt - dv)
+    # landmark que não alcança nenhum dos dois não informa nada (inf - inf)
+    diff[np.isnan(diff)] = 0.0
+    return float(diff.max()) if len(diff) else 0.0
+
+
+def preprocessar_landmarks(G, k: int = 8) -> Landmarks:
+    """
+    Escolhe k landmarks pela heurística 'farthest': o primeiro é o nó mais
+    distante de um nó arbitrário e cada próximo maximiza a distância mínima
+    aos já escolhidos (nós de outras componentes têm prioridade).
+    Roda um Dijkstra de fonte única por landmark.
+    """
+    nomes = list(G.nodes.keys())
+    ids = {n: i for i, n in enumerate(nomes)}
+    k = max(0, min(k, len(nomes)))
+    dist = np.full((len(nomes), k), np.inf, dtype=np.float64)
+    if k == 0:
+        return Landmarks(nomes, [], dist)
+
+    def _coluna(origem):
+        d, _ = dijkstra_arvore(G, origem)
+        col = np.full(len(nomes), np.inf)
+        col[[ids[v] for v in d]] = list(d.values())
+        return col
+
+    inicio = _coluna(nomes[0])
+    finitos = np.where(np.isfinite(inicio), inicio, -1.0)
+    proximo = int(np.argmax(finitos))
+
+    escolhidos: list[str] = []
+    minimo = np.full(len(nomes), np.inf)
+    for c in range(k):
+        escolhidos.append(nomes[proximo])
+        dist[:, c] = _coluna(nomes[proximo])
+        minimo = np.minimum(minimo, dist[:, c])
+        minimo[proximo] = -1.0
+        for L in escolhidos:
+            minimo[ids[L]] = -1.0
+        proximo = int(np.argmax(minimo))
+
+    return Landmarks(nomes, escolhidos, dist)
+
+
+def astar_alt(G, origem: str, destino: str, landmarks: Landmarks):
+    """
+    A* ponto-a-ponto guiado pelas cotas dos landmarks.
+    Mesma API e retorno de dijkstra: (custo_total, caminho_em_lista).
+    """
+    INF = float("inf")
+    if origem not in G.nodes or destino not in G.nodes:
+        return INF, []
+
+    ids = landmarks.ids
+    D = landmarks.dist
+    dt = D[ids[destino]]
+    h: dict[str, float] = {}
+
+    def _h(v):
+        x = h.get(v)
+        if x is None:
+            x = h[v] = _cota(D[ids[v]], dt)
+        return x
+
+    if _h(origem) == INF:
+        return INF, []
+
+    dist = {origem: 0.0}
+    prev = {origem: None}
+    fixados = set()
+    pq = [(_h(origem), 0.0, origem)]
+
+    while pq:
+        _, d, u = heapq.heappop(pq)
+        if u in fixados:
+            continue
+        fixados.add(u)
+        if u == destino:
+            break
+
+        for v in G.get_vizinhos(u):
+            nd = d + float(G.get_peso(u, v))
+            if nd < dist.get(v, INF):
+                hv = _h(v)
+                if hv == INF:
+                    continue
+                dist[v] = nd
+                prev[v] = u
+                heapq.heappush(pq, (nd + hv, nd, v))
+
+    if destino not in fixados:
+        return INF, []
+
+    path = []
+    cur = destino
+    while cur is not None:
+        path.append(cur)
+        cur = prev[cur]
+    path.reverse()
+    return float(dist[destino]), path
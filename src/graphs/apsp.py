@@ -0,0 +1,125 @@
+import json
+import os
+
+import numpy as np
+
+from .algorithms import dijkstra_arvore
+from .csr import CSRGraph
+
+ARQ_DIST = "dist.npy"
+ARQ_PROX = "next.npy"
+ARQ_NOS = "nos.json"
+
+
+def _floyd_warshall(C: CSRGraph):
+    """Floyd–Warshall vetorizado (uma operação NumPy n×n por pivô k)."""
+    n = C.get_ordem()
+    linhas = np.repeat(np.arange(n, dtype=np.int32), np.diff(C.indptr))
+
+    dist = np.full((n, n), np.inf, dtype=np.float64)
+    prox = np.full((n, n), -1, dtype=np.int32)
+    # arestas com peso NaN são ignoradas, como em dijkstra
+    ok = ~np.isnan(C.weights)
+    dist[linhas[ok], C.indices[ok]] = C.weights[ok]
+    prox[linhas[ok], C.indices[ok]] = C.indices[ok]
+    diag = np.arange(n)
+    dist[diag, diag] = 0.0
+    prox[diag, diag] = diag
+
+    for k in range(n):
+        cand = dist[:, k, None] + dist[None, k, :]
+        melhor = cand < dist
+        if not melhor.any():
+            continue
+        dist[melhor] = cand[melhor]
+        prox[melhor] = np.broadcast_to(prox[:, k, None], (n, n))[melhor]
+
+    return dist, prox
+
+
+def _dijkstra_repetido(C: CSRGraph):
+    """Um Dijkstra de fonte única por nó; o próximo salto sai da árvore."""
+    n = C.get_ordem()
+    ids = C.ids
+    dist = np.full((n, n), np.inf, dtype=np.float64)
+    prox = np.full((n, n), -1, dtype=np.int32)
+
+    for origem, i in ids.items():
+        d, prev = dijkstra_arvore(C, origem)
+        salto = {origem: origem}
+        for v in prev:
+            pilha = []
+            x = v
+            while x not in salto:
+                pilha.append(x)
+                x = prev[x]
+            s = salto[x]
+            for y in reversed(pilha):
+                if prev[y] == origem:
+                    s = y
+                salto[y] = s
+        alvos = np.fromiter((ids[v] for v in d), dtype=np.int64, count=len(d))
+        dist[i, alvos] = list(d.values())
+        prox[i, alvos] = [ids[salto[v]] for v in d]
+
+    return dist, prox
+
+
+def precomputar_todos_pares(G, diretorio: str, metodo: str = "floyd") -> str:
+    """
+    Pré-computa as matrizes de todos os pares e as grava em 'diretorio':
+      - dist.npy: float32 n×n, custo do menor caminho (inf se inalcançável)
+      - next.npy: int32 n×n, próximo salto de i rumo a j (-1 se inalcançável)
+      - nos.json: nomes dos nós na ordem dos ids
+    metodo: "floyd" (Floyd–Warshall vetorizado) ou "dijkstra" (repetido).
+    Retorna o diretório gravado.
+    """
+    C = G if isinstance(G, CSRGraph) else CSRGraph.from_graph(G)
+    if metodo == "floyd":
+        dist, prox = _floyd_warshall(C)
+    elif metodo == "dijkstra":
+        dist, prox = _dijkstra_repetido(C)
+    else:
+        raise ValueError("`metodo` deve ser 'floyd' ou 'dijkstra'.")
+
+    os.makedirs(diretorio, exist_ok=True)
+    np.save(os.path.join(diretorio, ARQ_DIST), dist.astype(np.float32))
+    np.save(os.path.join(diretorio, ARQ_PROX), prox)
+    with open(os.path.join(diretorio, ARQ_NOS), "w", encoding="utf-8") as f:
+        json.dump(C.nomes, f, ensure_ascii=False)
+    return diretorio
+
+
+class TabelaRotas:
+    """
+    Consulta de rotas sobre as matrizes gravadas por precomputar_todos_pares.
+    Os .npy são abertos com mmap (somente leitura): uma consulta é uma
+    leitura de tabela mais o desenrolar do caminho, sem busca.
+    """
+
+    def __init__(self, diretorio: str):
+        self.dist = np.load(os.path.join(diretorio, ARQ_DIST), mmap_mode="r")
+        self.prox = np.load(os.path.join(diretorio, ARQ_PROX), mmap_mode="r")
+        with open(os.path.join(diretorio, ARQ_NOS), "r", encoding="utf-8") as f:
+            self.nomes: list[str] = json.load(f)
+        self.ids = {n: i for i, n in enumerate(self.nomes)}
+
+    def custo(self, origem: str, destino: str) -> float:
+        i, j = self.ids.get(origem), self.ids.get(destino)
+        if i is None or j is None:
+            return float("inf")
+        return float(self.dist[i, j])
+
+    def rota(self, origem: str, destino: str):
+        """Retorna (custo_total, caminho_em_lista), como dijkstra."""
+        i, j = self.ids.get(origem), self.ids.get(destino)
+        if i is None or j is None or self.prox[i, j] < 0:
+            return float("inf"), []
+
+        custo = float(self.dist[i, j])
+        linha = self.prox[:, j]
+        path = [self.nomes[i]]
+        while i != j:
+            i = int(linha[i])
+            path.append(self.nomes[i])
+        return custo, path
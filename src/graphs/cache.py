@@ -0,0 +1,167 @@
+import sys
+import threading
+import time
+from collections import OrderedDict
+
+from .algorithms import bfs_layers, dijkstra
+
+
+def _tamanho(obj) -> int:
+    """Estimativa em bytes de um resultado (listas/tuplas/dicts de str e números)."""
+    total = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        for k, v in obj.items():
+            total += _tamanho(k) + _tamanho(v)
+    elif isinstance(obj, (list, tuple)):
+        for x in obj:
+            total += _tamanho(x)
+    return total
+
+
+class CacheRotas:
+    """
+    Cache LRU (com TTL opcional) na frente de dijkstra e bfs_layers para um grafo.
+
+    Chave: (versão do grafo, algoritmo, origem, destino). Graph.versao sobe a
+    cada mutação, então uma entrada de outra versão nunca é servida; ao notar
+    a versão nova, o cache descarta de uma vez todas as entradas antigas.
+    Grafos sem 'versao' (ex.: CSRGraph, imutável) são tratados como versão 0.
+
+    Limites: 'max_entradas' e/ou 'max_bytes' (tamanho estimado dos resultados);
+    ao estourar, sai a entrada usada há mais tempo. 'ttl' (s) expira entradas
+    antigas mesmo sem mutação. Contadores em estatisticas(). Seguro para uso
+    a partir de várias threads (ex.: executor do servidor em src/cli.py).
+    """
+
+    def __init__(self, G, max_entradas: int | None = 10_000, max_bytes: int | None = None,
+                 ttl: float | None = None):
+        self.G = G
+        self.max_entradas = max_entradas
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._entradas: OrderedDict = OrderedDict()   # chave -> (valor, bytes, instante)
+        self._bytes = 0
+        self._versao = self.versao_atual()
+        self._trava = threading.Lock()
+        self.acertos = 0
+        self.faltas = 0
+        self.despejos = 0
+        self.expiradas = 0
+        self.invalidadas = 0
+
+    def versao_atual(self) -> int:
+        """Versão atual do grafo; leia antes de calcular uma rota para guardar_rota."""
+        return getattr(self.G, "versao", 0)
+
+
+    # ---- consultas ----
+
+    def dijkstra(self, origem: str, destino: str):
+        """Como algorithms.dijkstra: (custo_total, caminho_em_lista)."""
+        achado = self.rota_em_cache(origem, destino)
+        if achado is None:
+            versao = self.versao_atual()
+            custo, caminho = dijkstra(self.G, origem, destino)
+            return self.guardar_rota(versao, origem, destino, custo, caminho)
+        return achado
+
+    def rota_em_cache(self, origem: str, destino: str):
+        """(custo, caminho) já calculado na versão atual do grafo, ou None."""
+        achado = self._buscar((self.versao_atual(), "dijkstra", origem, destino))
+        if achado is None:
+            return None
+        custo, caminho = achado
+        return custo, list(caminho)
+
+    def guardar_rota(self, versao: int, origem: str, destino: str, custo: float, caminho):
+        """
+        Guarda uma rota calculada fora (ex.: por rotas_em_lote) e a devolve.
+        'versao' é versao_atual() lida antes do cálculo: se o grafo mudou no
+        meio, a rota é devolvida mas não guardada.
+        """
+        self._guardar((versao, "dijkstra", origem, destino), (custo, tuple(caminho)))
+        return custo, list(caminho)
+
+    def bfs_layers(self, source: str):
+        """Como algorithms.bfs_layers: (ordem_visita, pai, profundidade)."""
+        chave = (self.versao_atual(), "bfs", source, None)
+        achado = self._buscar(chave)
+        if achado is None:
+            ordem, pai, prof = bfs_layers(self.G, source)
+            achado = self._guardar(chave, (tuple(ordem), pai, prof))
+        ordem, pai, prof = achado
+        # cópias: o chamador pode alterar o resultado sem sujar o cache
+        return list(ordem), dict(pai), dict(prof)
+
+    def estatisticas(self) -> dict:
+        return {
+            "entradas": len(self._entradas),
+            "bytes": self._bytes,
+            "acertos": self.acertos,
+            "faltas": self.faltas,
+            "despejos": self.despejos,
+            "expiradas": self.expiradas,
+            "invalidadas": self.invalidadas,
+        }
+
+    def limpar(self) -> None:
+        with self._trava:
+            self._entradas.clear()
+            self._bytes = 0
+
+
+    # ---- armazenamento ----
+
+    def _buscar(self, chave):
+        with self._trava:
+            return self._buscar_travado(chave)
+
+    def _sincronizar(self, versao: int) -> bool:
+        """Acompanha a versão do grafo; False se 'versao' já foi superada."""
+        if versao > self._versao:
+            # o grafo mudou: nenhuma entrada guardada é mais válida
+            self.invalidadas += len(self._entradas)
+            self._entradas.clear()
+            self._bytes = 0
+            self._versao = versao
+        return versao == self._versao
+
+    def _buscar_travado(self, chave):
+        if not self._sincronizar(chave[0]):
+            self.faltas += 1
+            return None
+
+        item = self._entradas.get(chave)
+        if item is not None and self.ttl is not None and time.monotonic() - item[2] >= self.ttl:
+            self._remover(chave)
+            self.expiradas += 1
+            item = None
+        if item is None:
+            self.faltas += 1
+            return None
+        self._entradas.move_to_end(chave)
+        self.acertos += 1
+        return item[0]
+
+    def _guardar(self, chave, valor):
+        n = _tamanho(valor)
+        with self._trava:
+            if (chave[0] != self.versao_atual() or not self._sincronizar(chave[0])
+                    or (self.max_bytes is not None and n > self.max_bytes)):
+                return valor   # calculado numa versão já superada, ou maior que o cache inteiro
+            if chave in self._entradas:
+                self._remover(chave)
+            self._guardar_travado(chave, valor, n)
+        return valor
+
+    def _guardar_travado(self, chave, valor, n):
+        self._entradas[chave] = (valor, n, time.monotonic())
+        self._bytes += n
+        while ((self.max_entradas is not None and len(self._entradas) > self.max_entradas)
+               or (self.max_bytes is not None and self._bytes > self.max_bytes)):
+            self._remover(next(iter(self._entradas)))
+            self.despejos += 1
+
+    def _remover(self, chave) -> None:
+        _, n, _ = self._entradas.pop(chave)
+        self._bytes -= n
@@ -0,0 +1,205 @@
+import heapq
+import math
+import random
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+from .csr import CSRGraph
+from . import parallel
+
+
+def _brandes_fonte(indptr, indices, weights, s: int, ponderado: bool):
+    """
+    Caminhos mínimos de fonte única com contagem de caminhos (Brandes).
+    BFS se não ponderado, Dijkstra (peso como distância) se ponderado;
+    laços são ignorados e, no modo ponderado, arestas com peso NaN também.
+    Retorna (ordem de fixação, dist, sigma, pred), só com nós alcançados.
+    """
+    dist = {s: 0.0}
+    sigma = {s: 1}
+    pred = {s: []}
+    ordem = []
+    if not ponderado:
+        fila = deque([s])
+        while fila:
+            u = fila.popleft()
+            ordem.append(u)
+            du = dist[u] + 1.0
+            for k in range(indptr[u], indptr[u + 1]):
+                v = indices[k]
+                if v not in dist:
+                    dist[v] = du
+                    sigma[v] = 0
+                    pred[v] = []
+                    fila.append(v)
+                if dist[v] == du:
+                    sigma[v] += sigma[u]
+                    pred[v].append(u)
+        return ordem, dist, sigma, pred
+
+    fixados = set()
+    pq = [(0.0, s)]
+    while pq:
+        d, u = heapq.heappop(pq)
+        if u in fixados:
+            continue
+        fixados.add(u)
+        ordem.append(u)
+        for k in range(indptr[u], indptr[u + 1]):
+            v = indices[k]
+            if v in fixados:
+                continue
+            w = weights[k]
+            if w != w:
+                continue
+            nd = d + w
+            dv = dist.get(v)
+            if dv is None or nd < dv:
+                dist[v] = nd
+                sigma[v] = sigma[u]
+                pred[v] = [u]
+                heapq.heappush(pq, (nd, v))
+            elif nd == dv:
+                sigma[v] += sigma[u]
+                pred[v].append(u)
+    return ordem, dist, sigma, pred
+
+
+def _acumular(indptr, indices, weights, n: int, fontes, ponderado: bool):
+    """
+    Soma, para cada nó v, as contribuições das 'fontes':
+      inter[v]   = soma de delta_s(v) (dependência de Brandes)
+      soma[v]    = soma de d(s, v)
+      alcance[v] = número de fontes que alcançam v (inclusive v)
+      harm[v]    = soma de 1/d(s, v), s != v
+    Como o grafo é não-direcionado, d(s, v) = d(v, s).
+    """
+    inter = [0.0] * n
+    soma = [0.0] * n
+    alcance = [0] * n
+    harm = [0.0] * n
+    for s in fontes:
+        ordem, dist, sigma, pred = _brandes_fonte(indptr, indices, weights, s, ponderado)
+        delta = dict.fromkeys(ordem, 0.0)
+        for w in reversed(ordem):
+            coef = (1.0 + delta[w]) / sigma[w]
+            for v in pred[w]:
+                delta[v] += sigma[v] * coef
+            if w != s:
+                inter[w] += delta[w]
+        for v, d in dist.items():
+            soma[v] += d
+            alcance[v] += 1
+            if d > 0:
+                harm[v] += 1.0 / d
+    return inter, soma, alcance, harm
+
+
+def _acumular_tarefa(args):
+    fontes, ponderado = args
+    T = parallel._TRABALHADOR
+    n = len(T["indptr"]) - 1
+    return _acumular(T["indptr"], T["indices"], T["weights"], n, fontes, ponderado)
+
+
+def erro_hoeffding(n: int, k: int, faixa: float, confianca: float = 0.95) -> float:
+    """
+    Meia-largura do intervalo de Hoeffding para a média de 'k' amostras
+    (com ou sem reposição) de uma variável em [0, faixa], valendo para os
+    'n' nós ao mesmo tempo (união das cotas) com a 'confianca' dada.
+    """
+    if k <= 0:
+        return math.inf
+    if k >= n:
+        return 0.0
+    return faixa * math.sqrt(math.log(2 * n / (1 - confianca)) / (2 * k))
+
+
+def amostras_para_erro(n: int, epsilon: float, confianca: float = 0.95) -> int:
+    """Fontes amostradas para erro <= epsilon na intermediação normalizada (ver erro_hoeffding)."""
+    if n < 3:
+        return n
+    faixa = n / (n - 1)
+    k = math.ceil(faixa ** 2 * math.log(2 * n / (1 - confianca)) / (2 * epsilon ** 2))
+    return min(n, k)
+
+
+def centralidades(G, ponderado: bool = True, amostra: int | None = None, processos: int | None = None,
+                  semente: int = 0, confianca: float = 0.95, normalizado: bool = True) -> dict:
+    """
+    Intermediação (Brandes), proximidade e centralidade harmônica de todos
+    os nós, com distâncias por 'peso' (ponderado=True) ou em saltos.
+
+      - intermediacao: soma, sobre os pares {s, t}, da fração dos caminhos
+        mínimos s–t que passam pelo nó; normalizada por (n-1)(n-2)/2.
+      - proximidade: (r-1)/soma das distâncias, vezes (r-1)/(n-1), onde r é
+        o número de nós alcançáveis (Wasserman–Faust; vale para grafos
+        desconexos). Sempre em [0, 1].
+      - harmonica: soma de 1/d(v, u) sobre u != v; normalizada por (n-1).
+
+    Exato: uma busca por fonte, O(V·E) no total. Com 'amostra' = k < n,
+    usa k fontes sorteadas (com 'semente') e escala as somas por n/k —
+    estimador sem viés; "erro" traz a meia-largura de Hoeffding, para todos
+    os nós ao mesmo tempo com a 'confianca' dada (ver amostras_para_erro).
+    A proximidade estimada não tem cota própria. Com processos > 1, as
+    fontes são repartidas num pool de processos sobre o CSR em memória
+    compartilhada (como em parallel.RoteadorParalelo).
+
+    Retorna {"intermediacao": {nó: valor}, "proximidade": {...},
+    "harmonica": {...}, "fontes": k, "erro": {"intermediacao", "harmonica"}}.
+    """
+    C = G if isinstance(G, CSRGraph) else CSRGraph.from_graph(G)
+    n = len(C.nomes)
+    fontes = list(range(n))
+    if amostra is not None and amostra < n:
+        fontes = sorted(random.Random(semente).sample(fontes, max(0, amostra)))
+    k = len(fontes)
+
+    processos = processos or 1
+    if processos > 1 and k > 1:
+        inter, soma, alcance, harm = _acumular_em_processos(C, n, fontes, ponderado, processos)
+    else:
+        inter, soma, alcance, harm = _acumular(
+            C.indptr.tolist(), C.indices.tolist(), C.weights.tolist(), n, fontes, ponderado
+        )
+
+    escala = n / k if k else 0.0
+    # cada par {s, t} é visto das duas pontas
+    norma_inter = (n - 1) * (n - 2) / 2 if normalizado and n > 2 else 1.0
+    norma_harm = (n - 1) if normalizado and n > 1 else 1.0
+    res = {"intermediacao": {}, "proximidade": {}, "harmonica": {}, "fontes": k}
+    for i, nome in enumerate(C.nomes):
+        res["intermediacao"][nome] = inter[i] * escala / 2 / norma_inter
+        res["harmonica"][nome] = harm[i] * escala / norma_harm
+        r, total = alcance[i] * escala, soma[i] * escala
+        res["proximidade"][nome] = ((r - 1) / total) * ((r - 1) / (n - 1)) if total > 0 and n > 1 else 0.0
+
+    # faixas de cada amostra, na escala normalizada
+    faixa = n / (n - 1) if n > 1 else 0.0
+    menor = min((w for w in C.weights.tolist() if w > 0), default=math.inf) if ponderado else 1.0
+    tem_zero = ponderado and bool((C.weights <= 0).any())
+    erro_inter = erro_hoeffding(n, k, faixa, confianca)
+    erro_harm = math.inf if tem_zero and k < n else erro_hoeffding(n, k, faixa / menor, confianca)
+    if not normalizado:
+        erro_inter *= (n - 1) * (n - 2) / 2 if n > 2 else 1.0
+        erro_harm *= n - 1 if n > 1 else 1.0
+    res["erro"] = {"intermediacao": erro_inter, "harmonica": erro_harm}
+    return res
+
+
+def _acumular_em_processos(C, n, fontes, ponderado, processos):
+    blocos, publicados = parallel.publicar_csr(C)
+    try:
+        n_tarefas = min(len(fontes), processos * 4)
+        tarefas = [(fontes[i::n_tarefas], ponderado) for i in range(n_tarefas)]
+        inter, soma, alcance, harm = [0.0] * n, [0.0] * n, [0] * n, [0.0] * n
+        with ProcessPoolExecutor(max_workers=processos, initializer=parallel._iniciar_trabalhador,
+                                 initargs=(publicados,)) as pool:
+            # soma na ordem das tarefas: resultado determinístico
+            for parcial in pool.map(_acumular_tarefa, tarefas):
+                for total, p in zip((inter, soma, alcance, harm), parcial):
+                    for i, x in enumerate(p):
+                        total[i] += x
+    finally:
+        parallel.liberar_blocos(blocos)
+    return inter, soma, alcance, harm
@@ -0,0 +1,236 @@
+import heapq
+
+import numpy as np
+
+from .csr import CSRGraph
+
+
+class ContractionHierarchy:
+    """
+    Hierarquia de contração (CH) para consultas ponto-a-ponto em pesos estáticos.
+
+    Cada nó tem um nível (rank) na ordem de contração. O grafo aumentado
+    (arestas originais + atalhos) é guardado em CSR "para cima": a aresta
+    {a, b} fica só na linha do extremo de menor rank. Para cada entrada,
+    `meio` guarda o nó contraído que o atalho substitui (-1 = aresta original).
+
+    Formato em disco (.npz): nomes, rank, indptr, indices, weights, meio.
+    """
+
+    def __init__(self, nomes, rank, indptr, indices, weights, meio):
+        self.nomes: list[str] = [str(n) for n in nomes]
+        self.ids = {n: i for i, n in enumerate(self.nomes)}
+        self.rank = np.asarray(rank, dtype=np.int32)
+        self.indptr = np.asarray(indptr, dtype=np.int64)
+        self.indices = np.asarray(indices, dtype=np.int32)
+        self.weights = np.asarray(weights, dtype=np.float64)
+        self.meio = np.asarray(meio, dtype=np.int32)
+
+        # listas Python para a busca (evita escalares NumPy no laço quente)
+        ptr = self.indptr.tolist()
+        idx, w, m = self.indices.tolist(), self.weights.tolist(), self.meio.tolist()
+        self._acima = [
+            {idx[k]: (w[k], m[k]) for k in range(ptr[i], ptr[i + 1])}
+            for i in range(len(self.nomes))
+        ]
+
+
+    def salvar(self, caminho: str) -> None:
+        np.savez(
+            caminho,
+            nomes=np.array(self.nomes, dtype=str),
+            rank=self.rank,
+            indptr=self.indptr,
+            indices=self.indices,
+            weights=self.weights,
+            meio=self.meio,
+        )
+
+    @classmethod
+    def carregar(cls, caminho: str) -> "ContractionHierarchy":
+        with np.load(caminho, allow_pickle=False) as z:
+            return cls(z["nomes"], z["rank"], z["indptr"], z["indices"], z["weights"], z["meio"])
+
+
+    def consultar(self, origem: str, destino: str):
+        """
+        Busca bidirecional só por arestas "para cima".
+        Retorna (custo_total, caminho_em_lista), como dijkstra, com atalhos desempacotados.
+        """
+        INF = float("inf")
+        s, t = self.ids.get(origem), self.ids.get(destino)
+        if s is None or t is None:
+            return INF, []
+        if s == t:
+            return 0.0, [origem]
+
+        acima = self._acima
+        dist = ({s: 0.0}, {t: 0.0})
+        prev = ({s: -1}, {t: -1})
+        pq = ([(0.0, s)], [(0.0, t)])
+        melhor, encontro = INF, -1
+
+        while True:
+            avancou = False
+            for lado in (0, 1):
+                fila = pq[lado]
+                if not fila or fila[0][0] >= melhor:
+                    continue
+                avancou = True
+                d, u = heapq.heappop(fila)
+                if d > dist[lado][u]:
+                    continue
+                outro = dist[1 - lado].get(u)
+                if outro is not None and d + outro < melhor:
+                    melhor, encontro = d + outro, u
+                for v, (w, _) in acima[u].items():
+                    nd = d + w
+                    if nd < dist[lado].get(v, INF):
+                        dist[lado][v] = nd
+                        prev[lado][v] = u
+                        heapq.heappush(fila, (nd, v))
+            if not avancou:
+                break
+
+        if encontro < 0:
+            return INF, []
+
+        ida = []
+        cur = encontro
+        while cur != -1:
+            ida.append(cur)
+            cur = prev[0][cur]
+        ida.reverse()
+        cur = prev[1][encontro]
+        while cur != -1:
+            ida.append(cur)
+            cur = prev[1][cur]
+
+        path = [ida[0]]
+        for a, b in zip(ida, ida[1:]):
+            path.extend(self._desempacotar(a, b))
+        return float(melhor), [self.nomes[i] for i in path]
+
+    def _desempacotar(self, a: int, b: int) -> list[int]:
+        """Nós de a até b (sem a) expandindo atalhos recursivamente."""
+        saida = []
+        pilha = [(a, b)]
+        while pilha:
+            x, y = pilha.pop()
+            lo, hi = (x, y) if self.rank[x] < self.rank[y] else (y, x)
+            m = self._acima[lo][hi][1]
+            if m < 0:
+                saida.append(y)
+            else:
+                pilha.append((m, y))
+                pilha.append((x, m))
+        return saida
+
+
+def _testemunha(adj, u, ignorar, limite, alvos, max_fixados):
+    """Dijkstra local a partir de u, sem passar por 'ignorar', até 'limite'."""
+    dist = {u: 0.0}
+    pq = [(0.0, u)]
+    fixados = 0
+    faltam = set(alvos)
+    while pq and faltam and fixados < max_fixados:
+        d, x = heapq.heappop(pq)
+        if d > dist[x]:
+            continue
+        if d > limite:
+            break
+        fixados += 1
+        faltam.discard(x)
+        for y, w in adj[x].items():
+            if y == ignorar:
+                continue
+            nd = d + w
+            if nd < dist.get(y, float("inf")):
+                dist[y] = nd
+                heapq.heappush(pq, (nd, y))
+    return dist
+
+
+def construir_ch(G, limite_testemunha: int = 64) -> ContractionHierarchy:
+    """
+    Constrói a hierarquia de contração de G (Graph ou CSRGraph).
+
+    Ordem de contração por prioridade preguiçosa:
+        (atalhos necessários - grau) + vizinhos já contraídos
+    Buscas de testemunha são limitadas a 'limite_testemunha' nós fixados;
+    quando o limite estoura o atalho é inserido (sempre correto, só maior).
+    """
+    C = G if isinstance(G, CSRGraph) else CSRGraph.from_graph(G)
+    n = C.get_ordem()
+    ptr, idx, pesos = C.indptr.tolist(), C.indices.tolist(), C.weights.tolist()
+
+    adj: list[dict[int, float]] = [dict() for _ in range(n)]
+    arestas: dict[tuple[int, int], tuple[float, int]] = {}
+    for i in range(n):
+        for k in range(ptr[i], ptr[i + 1]):
+            j, w = idx[k], pesos[k]
+            if i == j or w != w:   # laços e pesos NaN (ignorados por dijkstra)
+                continue
+            adj[i][j] = w
+            if i < j:
+                arestas[(i, j)] = (w, -1)
+
+    contraidos_viz = [0] * n
+
+    def _atalhos(v):
+        viz = list(adj[v].items())
+        novos = []
+        for a, (u, wu) in enumerate(viz):
+            alvos = {w: wu + ww for w, ww in viz[a + 1:]}
+            if not alvos:
+                continue
+            d = _testemunha(adj, u, v, max(alvos.values()), alvos, limite_testemunha)
+            for w, custo in alvos.items():
+                if d.get(w, float("inf")) > custo:
+                    novos.append((u, w, custo))
+        return novos
+
+    def _prioridade(v, atalhos):
+        return len(atalhos) - len(adj[v]) + contraidos_viz[v]
+
+    heap = [(_prioridade(v, _atalhos(v)), v) for v in range(n)]
+    heapq.heapify(heap)
+    rank = np.full(n, -1, dtype=np.int32)
+    nivel = 0
+
+    while heap:
+        _, v = heapq.heappop(heap)
+        if rank[v] >= 0:
+            continue
+        atalhos = _atalhos(v)
+        p = _prioridade(v, atalhos)
+        if heap and p > heap[0][0]:
+            heapq.heappush(heap, (p, v))
+            continue
+
+        for u, w, custo in atalhos:
+            if custo < adj[u].get(w, float("inf")):
+                adj[u][w] = adj[w][u] = custo
+                arestas[(u, w) if u < w else (w, u)] = (custo, v)
+        for u in adj[v]:
+            del adj[u][v]
+            contraidos_viz[u] += 1
+        adj[v] = {}
+        rank[v] = nivel
+        nivel += 1
+
+    linhas: list[list[tuple[int, float, int]]] = [[] for _ in range(n)]
+    for (a, b), (w, m) in arestas.items():
+        lo, hi = (a, b) if rank[a] < rank[b] else (b, a)
+        linhas[lo].append((hi, w, m))
+
+    indptr = np.zeros(n + 1, dtype=np.int64)
+    indices, weights, meio = [], [], []
+    for i, linha in enumerate(linhas):
+        linha.sort()
+        indices.extend(x[0] for x in linha)
+        weights.extend(x[1] for x in linha)
+        meio.extend(x[2] for x in linha)
+        indptr[i + 1] = len(indices)
+
+    return ContractionHierarchy(C.nomes, rank, indptr, indices, weights, meio)
@@ -0,0 +1,170 @@
+from collections.abc import Mapping
+
+import numpy as np
+
+
+class _TabelaNos(Mapping):
+    """
+    Visão somente-leitura nome -> {"microrregiao": int | None} sobre os
+    arrays do CSRGraph, no mesmo formato de Graph.nodes (sem guardar um
+    dict por nó).
+    """
+
+    def __init__(self, ids: dict[str, int], microrregioes: np.ndarray):
+        self._ids = ids
+        self._micro = microrregioes
+
+    def __getitem__(self, nome):
+        m = int(self._micro[self._ids[nome]])
+        return {"microrregiao": None if m < 0 else m}
+
+    def __contains__(self, nome):
+        return nome in self._ids
+
+    def __iter__(self):
+        return iter(self._ids)
+
+    def __len__(self):
+        return len(self._ids)
+
+
+class CSRGraph:
+    """
+    Grafo não-direcionado em formato CSR (compressed sparse row).
+
+    Os nós são internados como ids int32 (posição em `nomes`) e a
+    adjacência fica em três arrays contíguos:
+      - indptr[i]:indptr[i+1] -> fatia de `indices`/`weights` do nó i
+      - indices: vizinhos (ids int32), ordenados dentro de cada linha
+      - weights: peso (float64) de cada entrada de `indices`
+
+    Expõe a mesma API de leitura de Graph (nodes, get_vizinhos, get_peso,
+    get_grau, ...), então dijkstra/bfs_layers/dfs_preorder rodam sobre ele
+    sem alteração. Kernels vetorizados podem usar os arrays diretamente.
+    """
+
+    def __init__(self, nomes, indptr, indices, weights, microrregioes=None):
+        self.nomes: list[str] = list(nomes)
+        self.ids: dict[str, int] = {n: i for i, n in enumerate(self.nomes)}
+        self.indptr = np.asarray(indptr, dtype=np.int64)
+        self.indices = np.asarray(indices, dtype=np.int32)
+        self.weights = np.asarray(weights, dtype=np.float64)
+        if microrregioes is None:
+            microrregioes = np.full(len(self.nomes), -1, dtype=np.int32)
+        self.microrregioes = np.asarray(microrregioes, dtype=np.int32)
+        self.nodes = _TabelaNos(self.ids, self.microrregioes)
+        self._n_lacos = None   # calculado sob demanda (evita varrer arrays mapeados)
+
+
+    @classmethod
+    def from_graph(cls, G) -> "CSRGraph":
+        """Converte um Graph (ou qualquer objeto com a mesma API) para CSR."""
+        nomes = list(G.nodes.keys())
+        ids = {n: i for i, n in enumerate(nomes)}
+
+        graus = np.fromiter((G.get_grau(n) for n in nomes), dtype=np.int64, count=len(nomes))
+        indptr = np.zeros(len(nomes) + 1, dtype=np.int64)
+        np.cumsum(graus, out=indptr[1:])
+        indices = np.empty(indptr[-1], dtype=np.int32)
+        weights = np.empty(indptr[-1], dtype=np.float64)
+
+        for i, n in enumerate(nomes):
+            viz = sorted(ids[v] for v in G.get_vizinhos(n))
+            a, b = indptr[i], indptr[i + 1]
+            indices[a:b] = viz
+            weights[a:b] = [G.get_peso(n, nomes[j]) for j in viz]
+
+        micro = np.fromiter(
+            (_micro_ou_sentinela(G.nodes[n]) for n in nomes), dtype=np.int32, count=len(nomes)
+        )
+        return cls(nomes, indptr, indices, weights, micro)
+
+
+    # ---- API por id (para kernels vetorizados) ----
+
+    def vizinhos_ids(self, i: int) -> np.ndarray:
+        """Fatia (sem cópia) de `indices` com os vizinhos do nó i."""
+        return self.indices[self.indptr[i]:self.indptr[i + 1]]
+
+    def pesos_ids(self, i: int) -> np.ndarray:
+        """Fatia (sem cópia) de `weights` alinhada a vizinhos_ids(i)."""
+        return self.weights[self.indptr[i]:self.indptr[i + 1]]
+
+
+    # ---- API compatível com Graph ----
+
+    def get_peso(self, u: str, v: str) -> float:
+        i, j = self.ids[u], self.ids[v]
+        a, b = self.indptr[i], self.indptr[i + 1]
+        k = a + int(np.searchsorted(self.indices[a:b], j))
+        if k < b and self.indices[k] == j:
+            return float(self.weights[k])
+        return 1.0
+
+    def get_ordem(self):
+        """Retorna a Ordem |V| (número de nós) do grafo."""
+        return len(self.nomes)
+
+    def get_tamanho(self):
+        """Retorna o Tamanho |E| (número de arestas) do grafo."""
+        if self._n_lacos is None:
+            # laços (u, u) aparecem uma única vez na linha de u
+            linhas = np.repeat(np.arange(len(self.nomes), dtype=np.int32), np.diff(self.indptr))
+            self._n_lacos = int(np.count_nonzero(linhas == self.indices))
+        return (len(self.indices) + self._n_lacos) // 2
+
+    def get_grau(self, no):
+        """Retorna o grau de um nó específico."""
+        i = self.ids.get(no)
+        if i is None:
+            return 0
+        return int(self.indptr[i + 1] - self.indptr[i])
+
+    def get_vizinhos(self, no):
+        """Retorna a lista de vizinhos de um nó."""
+        i = self.ids.get(no)
+        if i is None:
+            return []
+        nomes = self.nomes
+        return [nomes[j] for j in self.vizinhos_ids(i).tolist()]
+
+    def get_densidade(self):
+        """Calcula a densidade do grafo não-direcionado."""
+        V = self.get_ordem()
+        E = self.get_tamanho()
+
+        if V < 2:
+            return 0.0
+
+        return (2 * E) / (V * (V - 1))
+
+    def get_grau_maximo(self) -> int:
+        """Maior grau do grafo (0 se vazio)."""
+        return int(np.diff(self.indptr).max()) if len(self.nomes) else 0
+
+    def top_k_grau(self, k: int) -> list[tuple[str, int]]:
+        """Os k nós de maior grau como (nó, grau), desempate pelo nome (como Graph)."""
+        graus = np.diff(self.indptr).tolist()
+        return sorted(zip(self.nomes, graus), key=lambda ng: (-ng[1], ng[0]))[:max(k, 0)]
+
+    def metricas_grupos(self) -> dict:
+        """Métricas por microrregião, no formato de Graph.metricas_grupos."""
+        from .metrics import metricas_por_grupo
+        grupo_de = {n: m for n, m in zip(self.nomes, self.microrregioes.tolist()) if m >= 0}
+        return metricas_por_grupo(self, grupo_de)
+
+    @property
+    def edges(self) -> set[tuple[str, str]]:
+        """Arestas (u, v) com u <= v, como em Graph.edges (montado sob demanda)."""
+        nomes = self.nomes
+        linhas = np.repeat(np.arange(len(nomes), dtype=np.int32), np.diff(self.indptr))
+        mask = linhas <= self.indices
+        return {
+            (nomes[i], nomes[j]) if nomes[i] <= nomes[j] else (nomes[j], nomes[i])
+            for i, j in zip(linhas[mask].tolist(), self.indices[mask].tolist())
+        }
+
+
+def _micro_ou_sentinela(info) -> int:
+    m = info.get("microrregiao") if isinstance(info, dict) else None
+    return -1 if m is None else int(m)
@@ -0,0 +1,167 @@
+import heapq
+
+from .algorithms import caminho_da_arvore, dijkstra_arvore
+
+INF = float("inf")
+
+
+class _Arvore:
+    """Árvore de menores caminhos de uma origem: dist, prev e filhos de cada nó."""
+
+    __slots__ = ("dist", "prev", "filhos")
+
+    def __init__(self, dist: dict, prev: dict):
+        self.dist = dist
+        self.prev = prev
+        self.filhos: dict[str, set] = {}
+        for v, p in prev.items():
+            if p is not None:
+                self.filhos.setdefault(p, set()).add(v)
+
+    def ligar(self, v, pai):
+        antigo = self.prev.get(v)
+        if antigo is not None:
+            self.filhos[antigo].discard(v)
+        self.prev[v] = pai
+        self.filhos.setdefault(pai, set()).add(v)
+
+    def subarvore(self, raiz) -> list:
+        saida, pilha = [], [raiz]
+        while pilha:
+            x = pilha.pop()
+            saida.append(x)
+            pilha.extend(self.filhos.get(x, ()))
+        return saida
+
+
+def _peso(G, u, v) -> float:
+    # aresta ausente ou com peso NaN: não usável (como em dijkstra)
+    if v not in G.get_vizinhos(u):
+        return INF
+    w = float(G.get_peso(u, v))
+    return INF if w != w else w
+
+
+def _propagar(G, arv: _Arvore, pq: list, mudaram: set) -> None:
+    """Dijkstra a partir das entradas já na fila, relaxando só o que melhora."""
+    dist = arv.dist
+    while pq:
+        d, x = heapq.heappop(pq)
+        if d > dist.get(x, INF):
+            continue
+        for y in G.get_vizinhos(x):
+            nd = d + float(G.get_peso(x, y))
+            if nd < dist.get(y, INF):
+                dist[y] = nd
+                arv.ligar(y, x)
+                mudaram.add(y)
+                heapq.heappush(pq, (nd, y))
+
+
+class ArvoresDinamicas:
+    """
+    Árvores de menores caminhos (SSSP) mantidas sob mudanças de peso, no
+    estilo de Ramalingam–Reps: cada atualização repara só a parte afetada
+    de cada árvore registrada, em vez de rodar dijkstra de novo.
+
+      - redução de peso: propaga a partir dos extremos da aresta só pelos
+        nós cuja distância melhora;
+      - aumento de peso: se a aresta é da árvore, invalida a subárvore
+        abaixo dela e a reconstrói a partir da fronteira não afetada.
+
+    Todas as mudanças de peso de G devem passar por atualizar_peso.
+    Peso inf fecha a rua (a aresta deixa de ser usada).
+    """
+
+    def __init__(self, G):
+        self.G = G
+        self.arvores: dict[str, _Arvore] = {}
+
+    def registrar(self, origem: str) -> None:
+        if origem not in self.G.nodes:
+            raise KeyError(f"Nó de origem '{origem}' não existe no grafo.")
+        if origem not in self.arvores:
+            self.arvores[origem] = _Arvore(*dijkstra_arvore(self.G, origem))
+
+    def descartar(self, origem: str) -> None:
+        self.arvores.pop(origem, None)
+
+    def arvore(self, origem: str):
+        """(dist, prev) atuais da origem, no formato de dijkstra_arvore."""
+        arv = self.arvores[origem]
+        return arv.dist, arv.prev
+
+    def rota(self, origem: str, destino: str):
+        """Retorna (custo_total, caminho_em_lista), como dijkstra."""
+        arv = self.arvores[origem]
+        return caminho_da_arvore(arv.dist, arv.prev, destino)
+
+    def atualizar_peso(self, u: str, v: str, novo_peso: float) -> dict[str, set]:
+        """
+        Muda o peso da aresta {u, v} em G (criando-a se não existir) e repara
+        as árvores registradas. Retorna origem -> nós cujo dist ou prev mudou.
+        """
+        G = self.G
+        if u not in G.nodes or v not in G.nodes:
+            raise KeyError(f"Aresta ({u}, {v}) cita nó inexistente no grafo.")
+        antigo = _peso(G, u, v)
+        G.adicionar_aresta(u, v, novo_peso)
+        novo = _peso(G, u, v)
+
+        mudancas = {o: set() for o in self.arvores}
+        if u == v or novo == antigo:
+            return mudancas
+        for origem, arv in self.arvores.items():
+            if novo < antigo:
+                self._reduzir(arv, u, v, novo, mudancas[origem])
+            else:
+                self._aumentar(arv, u, v, mudancas[origem])
+        return mudancas
+
+    def _reduzir(self, arv: _Arvore, u, v, w, mudaram: set) -> None:
+        dist = arv.dist
+        pq = []
+        for a, b in ((u, v), (v, u)):
+            if a in dist and dist[a] + w < dist.get(b, INF):
+                dist[b] = dist[a] + w
+                arv.ligar(b, a)
+                mudaram.add(b)
+                heapq.heappush(pq, (dist[b], b))
+        _propagar(self.G, arv, pq, mudaram)
+
+    def _aumentar(self, arv: _Arvore, u, v, mudaram: set) -> None:
+        if arv.prev.get(v) == u:
+            filho = v
+        elif arv.prev.get(u) == v:
+            filho = u
+        else:
+            return   # aresta fora da árvore: nenhuma distância muda
+
+        G = self.G
+        dist, prev = arv.dist, arv.prev
+        afetados = arv.subarvore(filho)
+        antes = {x: (dist[x], prev[x]) for x in afetados}
+        arv.filhos[prev[filho]].discard(filho)
+        for x in afetados:
+            del dist[x]
+            del prev[x]
+            arv.filhos.pop(x, None)
+
+        # melhor entrada de cada afetado a partir da fronteira não afetada
+        pq = []
+        for x in afetados:
+            melhor, pai = INF, None
+            for y in G.get_vizinhos(x):
+                if y in dist:
+                    nd = dist[y] + float(G.get_peso(y, x))
+                    if nd < melhor:
+                        melhor, pai = nd, y
+            if pai is not None:
+                dist[x] = melhor
+                arv.ligar(x, pai)
+                heapq.heappush(pq, (melhor, x))
+        _propagar(G, arv, pq, set())
+
+        for x, (d, p) in antes.items():
+            if dist.get(x) != d or prev.get(x) != p:
+                mudaram.add(x)
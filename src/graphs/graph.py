@@ -1,46 +1,272 @@
 # Coloque este código em src/graph.py
 
-from collections import defaultdict
+from bisect import bisect_left, insort
+from collections import Counter, defaultdict
+from collections.abc import Mapping, Set as AbstractSet
+
+_SEM_VIZINHOS: dict = {}
+
+
+def _densidade(V: int, E: int) -> float:
+    if V < 2:
+        return 0.0
+    return (2 * E) / (V * (V - 1))
+
 
 class Graph:
     """
     Classe para representar um grafo não-direcionado, usando 
-    lista de adjacência e um conjunto para arestas únicas.
+    mapas de adjacência vizinho -> peso e um conjunto para arestas únicas.
+    Inserção, pertinência e consulta de peso são O(1).
+
+    Estatísticas mantidas a cada mutação (sem recomputar do zero):
+      - nós agrupados por grau (histograma, grau máximo e top-k);
+      - por microrregião: ordem, arestas internas e arestas de corte.
     """
     
     def __init__(self):
-      # nós, lista de adjacência e pesos
+      # nós, mapas de adjacência (com os pesos) e arestas
       self.nodes = {}            # dict[str, dict]  -> {"microrregiao": int | None}
-      self.adjacencia = {}       # dict[str, list[str]]
+      self.adjacencia = {}       # dict[str, dict[str, float]]  u -> {v: peso}
       self.edges = set()         # set[tuple(str,str)] (u,v) ordenado
-      self.pesos = {}            # dict[tuple(str,str), float]
+      self.versao = 0            # contador de mutações (caches comparam para invalidar)
+      # estatísticas incrementais
+      self._por_grau = {}        # dict[int, set[str]]  grau -> nós
+      self._graus = []           # list[int]  graus com algum nó, em ordem crescente
+      self._grau_max = 0
+      self._grupos = {}          # dict[microrregiao, {"ordem","tamanho","corte"}]
 
 
     def adicionar_no(self, nome: str, microrregiao: int | None = None):
         if nome not in self.nodes:
             self.nodes[nome] = {"microrregiao": microrregiao}
-            self.adjacencia[nome] = []
+            self.adjacencia[nome] = {}
+            self._mudar_grau(nome, None, 0)
+            self._entrar_grupo(nome)
+            self.versao += 1
         else:
             # se já existe, apenas atualiza microrregião se vier valor
-            if microrregiao is not None:
-                self.nodes[nome]["microrregiao"] = microrregiao
+            if microrregiao is not None and microrregiao != self.nodes[nome]["microrregiao"]:
+                self._trocar_grupo(nome, microrregiao)
+                self.versao += 1
 
 
     def adicionar_aresta(self, u: str, v: str, peso: float = 1.0):
         if u not in self.nodes or v not in self.nodes:
             return
-        if v not in self.adjacencia[u]:
-            self.adjacencia[u].append(v)
-        if u not in self.adjacencia[v]:
-            self.adjacencia[v].append(u)
-        e = tuple(sorted((u, v)))
-        self.edges.add(e)
-        self.pesos[e] = float(peso)
+        peso = float(peso)
+        nova = v not in self.adjacencia[u]
+        self.adjacencia[u][v] = peso
+        self.adjacencia[v][u] = peso
+        self.edges.add((u, v) if u <= v else (v, u))
+        if nova:
+            self._aresta_mudou(u, v, +1)
+        self.versao += 1
+
+
+    def adicionar_nos_em_lote(self, nomes, microrregioes) -> None:
+        """
+        adicionar_no para cada par (nome, microrregiao), com o mesmo
+        resultado; os nós novos entram no balde de grau 0 de uma vez.
+        """
+        nodes, adjacencia, novos = self.nodes, self.adjacencia, []
+        for nome, microrregiao in zip(nomes, microrregioes):
+            if nome in nodes:
+                self.adicionar_no(nome, microrregiao)
+                continue
+            nodes[nome] = {"microrregiao": microrregiao}
+            adjacencia[nome] = {}
+            self._entrar_grupo(nome)
+            novos.append(nome)
+        if novos:
+            self._mudar_graus_em_lote([(nome, None, 0) for nome in novos])
+            self.versao += len(novos)
+
+
+    def adicionar_arestas_em_lote(self, adjacencia: dict, arestas) -> None:
+        """
+        Instala de uma vez mapas de adjacência já deduplicados e simétricos
+        (u -> {v: peso}) e o conjunto de arestas correspondente, como os
+        montados por io.adicionar_arestas_vetorizado. O resultado equivale
+        a chamar adicionar_aresta em sequência; os nós precisam existir.
+        Os mapas de nós ainda sem vizinhos passam a pertencer ao grafo.
+        """
+        novas = set(arestas)
+        novas -= self.edges
+        self.versao += 1
+        mudancas = []
+        for u, vizinhos in adjacencia.items():
+            viz = self.adjacencia[u]
+            antes = len(viz)
+            if antes:
+                viz.update(vizinhos)
+            else:
+                # nó sem vizinhos (caso da carga inicial): adota o mapa montado, sem copiá-lo
+                self.adjacencia[u] = viz = vizinhos
+            if len(viz) != antes:
+                mudancas.append((u, antes, len(viz)))
+        self._mudar_graus_em_lote(mudancas)
+        self.edges |= novas
+        if self._grupos:
+            # agrega por par de grupos antes de atualizar as contagens
+            grupo = {n: info["microrregiao"] for n, info in self.nodes.items()}
+            pares = Counter((grupo[u], grupo[v]) for u, v in novas if u != v)
+            for (gu, gv), qtd in pares.items():
+                self._contar_grupos(gu, gv, qtd)
+
+
+    def remover_aresta(self, u: str, v: str):
+        """Remove a aresta {u, v}; ignorada se não existir."""
+        viz = self.adjacencia.get(u)
+        if viz is None or v not in viz:
+            return
+        del viz[v]
+        self.adjacencia[v].pop(u, None)
+        self.edges.discard((u, v) if u <= v else (v, u))
+        self._aresta_mudou(u, v, -1)
+        self.versao += 1
+
+
+    def remover_no(self, nome: str):
+        """Remove o nó e todas as arestas incidentes; ignorado se não existir."""
+        if nome not in self.nodes:
+            return
+        for v in list(self.adjacencia[nome]):
+            self.remover_aresta(nome, v)
+        self._mudar_grau(nome, 0, None)
+        self._sair_grupo(nome)
+        del self.nodes[nome]
+        del self.adjacencia[nome]
+        self.versao += 1
+
+
+    # ---- manutenção das estatísticas ----
+
+    def _mudar_grau(self, no, de, para):
+        """Move 'no' do balde de grau 'de' para 'para' (None = fora do grafo)."""
+        if de is not None:
+            balde = self._por_grau[de]
+            balde.discard(no)
+            if not balde:
+                del self._por_grau[de]
+                del self._graus[bisect_left(self._graus, de)]
+        if para is not None:
+            balde = self._por_grau.get(para)
+            if balde is None:
+                balde = self._por_grau[para] = set()
+                insort(self._graus, para)
+            balde.add(no)
+        # a lista só muda quando um balde nasce ou esvazia
+        self._grau_max = self._graus[-1] if self._graus else 0
+
+    def _mudar_graus_em_lote(self, mudancas) -> None:
+        """_mudar_grau para vários (nó, de, para), agrupados por balde; a lista de graus é refeita uma vez."""
+        if not mudancas:
+            return
+        saem, entram = defaultdict(list), defaultdict(list)
+        for no, de, para in mudancas:
+            if de is not None:
+                saem[de].append(no)
+            entram[para].append(no)
+        por_grau = self._por_grau
+        for g, nos in saem.items():
+            balde = por_grau[g]
+            balde.difference_update(nos)
+            if not balde:
+                del por_grau[g]
+        for g, nos in entram.items():
+            por_grau.setdefault(g, set()).update(nos)
+        self._graus = sorted(por_grau)
+        self._grau_max = self._graus[-1] if self._graus else 0
+
+    def _aresta_mudou(self, u, v, sinal):
+        gu = len(self.adjacencia[u])
+        self._mudar_grau(u, gu - sinal, gu)
+        if u != v:
+            gv = len(self.adjacencia[v])
+            self._mudar_grau(v, gv - sinal, gv)
+        self._contar_no_grupo(u, v, sinal)
+
+    def _contar_no_grupo(self, u, v, sinal):
+        # laços não contam, como em metrics.metricas_por_grupo
+        if u != v:
+            self._contar_grupos(self.nodes[u]["microrregiao"], self.nodes[v]["microrregiao"], sinal)
+
+    def _contar_grupos(self, gu, gv, qtd):
+        if gu == gv:
+            if gu is not None:
+                self._grupos[gu]["tamanho"] += qtd
+            return
+        if gu is not None:
+            self._grupos[gu]["corte"] += qtd
+        if gv is not None:
+            self._grupos[gv]["corte"] += qtd
+
+    def _entrar_grupo(self, no):
+        g = self.nodes[no]["microrregiao"]
+        if g is None:
+            return
+        m = self._grupos.get(g)
+        if m is None:
+            m = self._grupos[g] = {"ordem": 0, "tamanho": 0, "corte": 0}
+        m["ordem"] += 1
+
+    def _sair_grupo(self, no):
+        g = self.nodes[no]["microrregiao"]
+        if g is None:
+            return
+        m = self._grupos[g]
+        m["ordem"] -= 1
+        if m["ordem"] == 0:
+            del self._grupos[g]
+
+    def _trocar_grupo(self, no, microrregiao):
+        # O(grau): as arestas do nó saem da contagem antiga e entram na nova
+        for v in self.adjacencia[no]:
+            self._contar_no_grupo(no, v, -1)
+        self._sair_grupo(no)
+        self.nodes[no]["microrregiao"] = microrregiao
+        self._entrar_grupo(no)
+        for v in self.adjacencia[no]:
+            self._contar_no_grupo(no, v, +1)
+
+
+    # ---- consultas das estatísticas ----
+
+    def get_grau_maximo(self) -> int:
+        """Maior grau do grafo (0 se vazio). O(1)."""
+        return self._grau_max
+
+    def histograma_graus(self) -> dict[int, int]:
+        """grau -> número de nós com esse grau, em ordem crescente de grau."""
+        return {g: len(self._por_grau[g]) for g in self._graus}
+
+    def top_k_grau(self, k: int) -> list[tuple[str, int]]:
+        """
+        Os k nós de maior grau como (nó, grau), desempate pelo nome.
+        Desce pela lista ordenada dos graus não vazios a partir do máximo e
+        para ao juntar k nós: não ordena os graus nem varre os nós.
+        """
+        saida = []
+        for g in reversed(self._graus):
+            if len(saida) >= k:
+                break
+            saida.extend((n, g) for n in sorted(self._por_grau[g])[:k - len(saida)])
+        return saida
+
+    def metricas_grupos(self) -> dict:
+        """
+        Métricas por microrregião mantidas incrementalmente, no formato de
+        metrics.metricas_por_grupo: grupo -> {"ordem", "tamanho", "corte", "densidade"}.
+        """
+        return {
+            g: {**m, "densidade": _densidade(m["ordem"], m["tamanho"])}
+            for g, m in self._grupos.items()
+        }
 
 
     def get_peso(self, u: str, v: str) -> float:
-        e = tuple(sorted((u, v)))
-        return float(self.pesos.get(e, 1.0))
+        return self.adjacencia.get(u, _SEM_VIZINHOS).get(v, 1.0)
 
 
 
@@ -54,11 +280,11 @@ class Graph:
 
     def get_grau(self, no):
         """Retorna o grau de um nó específico."""
-        return len(self.adjacencia.get(no, []))
+        return len(self.adjacencia.get(no, _SEM_VIZINHOS))
 
     def get_vizinhos(self, no):
-        """Retorna a lista de vizinhos de um nó."""
-        return self.adjacencia.get(no, [])
+        """Retorna os vizinhos de um nó (visão das chaves do mapa de adjacência)."""
+        return self.adjacencia.get(no, _SEM_VIZINHOS).keys()
 
     def get_densidade(self):
         """Calcula a densidade do grafo não-direcionado."""
@@ -80,8 +306,147 @@ class Graph:
         for u in lista_nos:
             if u not in self.nodes:
                 continue
-            for v in self.adjacencia[u]:
+            for v, peso in self.adjacencia[u].items():
                 if v in H.nodes and u < v:
-                    H.adicionar_aresta(u, v, self.get_peso(u, v))
+                    H.adicionar_aresta(u, v, peso)
         return H
 
+
+
+    def visao_induzida(self, lista_nos) -> "SubgraphView":
+        """Subgrafo induzido sem cópia (ver SubgraphView)."""
+        return SubgraphView(self, lista_nos)
+
+
+class _NosVisao(Mapping):
+    """nodes de uma SubgraphView: os do pai, filtrados pela máscara."""
+
+    def __init__(self, nodes_pai, mascara: dict):
+        self._pai = nodes_pai
+        self._mascara = mascara
+
+    def __getitem__(self, no):
+        if no not in self._mascara:
+            raise KeyError(no)
+        return self._pai[no]
+
+    def __contains__(self, no):
+        return no in self._mascara
+
+    def __iter__(self):
+        return iter(self._mascara)
+
+    def __len__(self):
+        return len(self._mascara)
+
+
+class _VizinhosVisao:
+    """
+    Vizinhos de um nó do pai que caem na máscara, filtrados sob demanda.
+    O laço (no, no) fica de fora, como em criar_subgrafo_induzido.
+    """
+
+    __slots__ = ("_no", "_viz", "_mascara")
+
+    def __init__(self, no, viz, mascara: dict):
+        self._no = no
+        self._viz = viz
+        self._mascara = mascara
+
+    def __iter__(self):
+        m, no = self._mascara, self._no
+        return (v for v in self._viz if v in m and v != no)
+
+    def __contains__(self, v):
+        return v != self._no and v in self._mascara and v in self._viz
+
+    def __len__(self):
+        m, no = self._mascara, self._no
+        return sum(1 for v in self._viz if v in m and v != no)
+
+
+class _ArestasVisao(AbstractSet):
+    """edges de uma SubgraphView: conjunto (u, v), u < v, relido do pai a cada uso."""
+
+    __slots__ = ("_pai", "_mascara")
+
+    def __init__(self, pai, mascara: dict):
+        self._pai = pai
+        self._mascara = mascara
+
+    def __iter__(self):
+        m = self._mascara
+        return ((u, v) for u in m for v in self._pai.get_vizinhos(u) if v in m and u < v)
+
+    def __contains__(self, aresta):
+        try:
+            u, v = aresta
+        except (TypeError, ValueError):
+            return False
+        m = self._mascara
+        return u < v and u in m and v in m and v in self._pai.get_vizinhos(u)
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+
+class SubgraphView:
+    """
+    Subgrafo induzido "zero-cópia": guarda só o grafo pai e a máscara de nós.
+    Vizinhos, graus, pesos e contagens são lidos do pai sob demanda, então
+    a visão reflete mudanças posteriores no pai. Expõe a API de leitura de
+    Graph; dijkstra, bfs_layers e dfs_preorder a aceitam diretamente.
+    """
+
+    def __init__(self, pai, lista_nos):
+        self.pai = pai
+        # dict como conjunto ordenado: preserva a ordem de lista_nos
+        self._mascara = dict.fromkeys(n for n in lista_nos if n in pai.nodes)
+        self.nodes = _NosVisao(pai.nodes, self._mascara)
+
+    @property
+    def versao(self) -> int:
+        """Versão do pai: a visão muda exatamente quando ele muda."""
+        return self.pai.versao
+
+    def get_peso(self, u: str, v: str) -> float:
+        if u in self._mascara and v in self._mascara:
+            return self.pai.get_peso(u, v)
+        return 1.0
+
+    def get_ordem(self):
+        """Retorna a Ordem |V| (número de nós) da visão."""
+        return len(self._mascara)
+
+    def get_tamanho(self):
+        """Retorna o Tamanho |E| (arestas com os dois extremos na máscara, sem laços)."""
+        return len(self.edges)
+
+    def get_grau(self, no):
+        """Retorna o grau de um nó dentro da visão."""
+        return len(self.get_vizinhos(no))
+
+    def get_vizinhos(self, no):
+        """Retorna os vizinhos de um nó dentro da visão (filtrados sob demanda)."""
+        if no not in self._mascara:
+            return ()
+        return _VizinhosVisao(no, self.pai.get_vizinhos(no), self._mascara)
+
+    def get_densidade(self):
+        """Calcula a densidade da visão (mesma fórmula de Graph)."""
+        V = self.get_ordem()
+        E = self.get_tamanho()
+
+        if V < 2:
+            return 0.0
+
+        return (2 * E) / (V * (V - 1))
+
+    @property
+    def edges(self):
+        """
+        Arestas (u, v), u < v, com os dois extremos na máscara: um conjunto
+        reiterável (len, in, comparação com set) lido do pai sob demanda.
+        Laços ficam de fora, como em criar_subgrafo_induzido.
+        """
+        return _ArestasVisao(self.pai, self._mascara)
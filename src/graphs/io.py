@@ -1,10 +1,16 @@
-import pandas as pd
-import unicodedata
+from itertools import islice
+from typing import TYPE_CHECKING
 from .graph import Graph
+from .resolver import ResolvedorBairros, padronizar_nome
 import json
-import unicodedata  # Import necessário para a padronização
+
+# pandas (e NumPy) são importados dentro das funções que os usam: quem só
+# precisa de Graph/algoritmos, ou do leitor csv abaixo, não paga a importação.
+if TYPE_CHECKING:
+    import pandas as pd
 
 def derreter_bairros(caminho_entrada: str, caminho_saida: str) -> None:
+    import pandas as pd
     try:
         df = pd.read_csv(caminho_entrada)
 
@@ -12,15 +18,6 @@ def derreter_bairros(caminho_entrada: str, caminho_saida: str) -> None:
 
         df_melted["microrregiao"] = df_melted["coluna_original"].str.extract(r"(\d)").fillna(0).astype(int)
 
-        def padronizar_nome(nome: str) -> str:
-            nome_padronizado = str(nome).strip().title()
-            nome_padronizado = unicodedata.normalize("NFKD", nome_padronizado).encode("ASCII", "ignore").decode("ASCII")
-            nome_padronizado = nome_padronizado.replace("-", " ")
-            if nome_padronizado.lower() == "setubal":
-                return "Boa Viagem"
-            
-            return nome_padronizado
-
         df_melted["bairro"] = df_melted["bairro"].apply(padronizar_nome)
 
         df_final = df_melted[["bairro", "microrregiao"]].drop_duplicates("bairro").sort_values("bairro")
@@ -34,15 +31,125 @@ def derreter_bairros(caminho_entrada: str, caminho_saida: str) -> None:
         print(f"Ocorreu um erro inesperado: {e}")
 
 
+def adicionar_arestas_vetorizado(grafo: Graph, origens, destinos, pesos=None) -> "pd.DataFrame":
+    """
+    Insere em lote as arestas dadas por colunas (origem, destino, peso).
+    Strip, mapeamento nome -> id, deduplicação e ordenação são feitos com
+    pandas/NumPy; a adjacência é instalada de uma vez. O resultado é o mesmo
+    de chamar adicionar_aresta linha a linha: vizinhos na ordem da primeira
+    aparição e, em arestas repetidas, vale o último peso.
+    Retorna um DataFrame com as linhas rejeitadas (origem/destino que não
+    são nós do grafo), indexado pela posição original da linha.
+    """
+    import numpy as np
+    import pandas as pd
+
+    nomes = pd.Index(list(grafo.nodes.keys()))
+
+    def _ids(coluna):
+        # strip e busca só nos valores distintos; as linhas herdam pelo código
+        codigos, distintos = pd.factorize(pd.Series(coluna), use_na_sentinel=False)
+        limpos = pd.Index(distintos).astype(str).str.strip()
+        return nomes.get_indexer(limpos)[codigos], limpos.to_numpy(dtype=object), codigos
+
+    a, limpos_a, cod_a = _ids(origens)
+    b, limpos_b, cod_b = _ids(destinos)
+    if pesos is None:
+        peso = np.ones(len(a), dtype=np.float64)
+    else:
+        peso = pd.to_numeric(pd.Series(pesos), errors="coerce").to_numpy(dtype=np.float64)
+
+    validas = (a >= 0) & (b >= 0)
+    ruins = np.flatnonzero(~validas)
+    rejeitadas = pd.DataFrame(
+        {"origem": limpos_a[cod_a[ruins]], "destino": limpos_b[cod_b[ruins]], "peso": peso[ruins]},
+        index=ruins,
+    )
+
+    linha = np.flatnonzero(validas)
+    a, b, peso = a[validas], b[validas], peso[validas]
+    if len(linha) == 0:
+        return rejeitadas
+    n = len(nomes)
+
+    # peso final de cada aresta não-direcionada = o da última linha que a cita
+    chave = np.minimum(a, b).astype(np.int64) * n + np.maximum(a, b)
+    ordem = np.argsort(chave, kind="stable")
+    chave_ord = chave[ordem]
+    ultima = np.r_[chave_ord[1:] != chave_ord[:-1], True]
+    chaves_unicas = chave_ord[ultima]
+    peso_final = peso[ordem][ultima]
+    grupo = np.empty(len(chave), dtype=np.int64)      # linha -> aresta única
+    grupo[ordem] = np.r_[0, np.cumsum(ultima[:-1])]
+
+    # entradas dirigidas em ordem de inserção: a linha i gera a->b (seq 2i)
+    # e depois b->a (seq 2i+1); fica a primeira de cada (src, dst), com os
+    # vizinhos de cada src na ordem de seq
+    src = np.column_stack([a, b]).ravel()
+    dst = np.column_stack([b, a]).ravel()
+    dirigida = src.astype(np.int64) * n + dst
+    ordem = np.argsort(dirigida, kind="stable")
+    dirigida_ord = dirigida[ordem]
+    seq = ordem[np.r_[True, dirigida_ord[1:] != dirigida_ord[:-1]]]
+    m = len(src)
+    seq = np.sort(src[seq].astype(np.int64) * m + seq) % m   # por (src, seq)
+    src, dst = src[seq], dst[seq]
+    w = peso_final[grupo[seq // 2]]
+
+    nomes_arr = nomes.to_numpy(dtype=object)
+    dst_nomes = nomes_arr[dst].tolist()
+    w_lista = w.tolist()
+    cortes = np.flatnonzero(np.r_[True, src[1:] != src[:-1], True])
+    entradas = zip(dst_nomes, w_lista)
+    adjacencia = {
+        nome: dict(islice(entradas, g))
+        for nome, g in zip(nomes_arr[src[cortes[:-1]]].tolist(), np.diff(cortes).tolist())
+    }
+
+    u = nomes_arr[chaves_unicas // n]
+    v = nomes_arr[chaves_unicas % n]
+    troca = u > v
+    u[troca], v[troca] = v[troca], u[troca]
+    grafo.adicionar_arestas_em_lote(adjacencia, zip(u.tolist(), v.tolist()))
+    return rejeitadas
+
+
+def construir_grafo(bairros, microrregioes, origens, destinos, pesos=None):
+    """
+    Construção em lote de um Graph a partir de colunas.
+    Retorna (grafo, rejeitadas); ver adicionar_arestas_vetorizado.
+    """
+    grafo = Graph()
+    grafo.adicionar_nos_em_lote(bairros, microrregioes)
+    rejeitadas = adicionar_arestas_vetorizado(grafo, origens, destinos, pesos)
+    return grafo, rejeitadas
+
+
+def _avisar_rejeitadas(grafo: Graph, pares) -> None:
+    """
+    'pares': (origem, destino) das linhas de adjacência rejeitadas.
+    Nomes ausentes (NaN ou vazio, de linhas curtas) não entram na lista.
+    """
+    pares = list(pares)
+    if pares:
+        desconhecidos = sorted(
+            {n for par in pares for n in par if isinstance(n, str) and n and n not in grafo.nodes}
+        )
+        print(f"Aviso: {len(pares)} linha(s) de adjacência ignoradas por citarem "
+              f"bairros desconhecidos (entre: {', '.join(desconhecidos[:10])}).")
+
+
 def carregar_bairros(caminho_csv: str) -> Graph:
+    import pandas as pd
     grafo = Graph()
     try:
         df = pd.read_csv(caminho_csv)
+        micros = df["microrregiao"] if "microrregiao" in df.columns else [None] * len(df)
 
-        for bairro in df["bairro"]:
-            grafo.add_node(bairro)
+        for bairro, microrregiao in zip(df["bairro"], micros):
+            grafo.adicionar_no(bairro, microrregiao)
             
-        print(f"Grafo carregado com {len(grafo)} nós a partir de '{caminho_csv}'.")
+        print(f"Grafo carregado com {grafo.get_ordem()} nós a partir de '{caminho_csv}'.")
 
     except FileNotFoundError:
         print(f"Erro: O arquivo '{caminho_csv}' não foi encontrado. Execute a função derreter_bairros primeiro.")
@@ -52,20 +159,20 @@ def carregar_bairros(caminho_csv: str) -> Graph:
     return grafo
 
 def carregar_arestas(grafo: Graph, caminho_csv: str):
+    import pandas as pd
     df = pd.read_csv(caminho_csv)
+    pesos = df["peso"] if "peso" in df.columns else None
 
-    for _, row in df.iterrows():
-        u = row['bairro_origem'].strip()
-        v = row['bairro_destino'].strip()
-        grafo.add_edges(u,v)
+    rejeitadas = adicionar_arestas_vetorizado(grafo, df["bairro_origem"], df["bairro_destino"], pesos)
+    _avisar_rejeitadas(grafo, zip(rejeitadas["origem"], rejeitadas["destino"]))
 
-    print(f"{grafo.size()} arestas adicionadas ao grafo")
+    print(f"{grafo.get_tamanho()} arestas adicionadas ao grafo")
 
 def calcular_recife_global(grafo: Graph, caminho_saida: str):
     metrica = {
-        "ordem": len(grafo),
-        "tamanho": grafo.size(),
-        "densidade": round(grafo.density(), 4)
+        "ordem": grafo.get_ordem(),
+        "tamanho": grafo.get_tamanho(),
+        "densidade": round(grafo.get_densidade(), 4)
     }
 
     with open(caminho_saida, "w") as f:
@@ -76,17 +183,20 @@ def calcular_recife_global(grafo: Graph, caminho_saida: str):
 
 
 def calcular_metricas_microrregioes(grafo: Graph, caminho_bairros: str, caminho_saida: str):
+    import pandas as pd
+    from .metrics import metricas_por_grupo
+
     df_bairros = pd.read_csv(caminho_bairros)
+    grupos = metricas_por_grupo(grafo, dict(zip(df_bairros["bairro"], df_bairros["microrregiao"])))
     microrregioes_metrics = []
 
-    for micror, group in df_bairros.groupby("microrregiao"):
-        nodes = group["bairro"].tolist()
-        sub = grafo.subgraph(nodes)
+    for micror in sorted(grupos):
+        m = grupos[micror]
         microrregioes_metrics.append({
             "microrregiao": int(micror),
-            "ordem": sub.__len__(),
-            "tamanho": sub.size(),
-            "densidade": round(sub.density(), 4)
+            "ordem": m["ordem"],
+            "tamanho": m["tamanho"],
+            "densidade": round(m["densidade"], 4)
         })
 
     with open(caminho_saida, "w") as f:
@@ -97,20 +207,9 @@ def calcular_metricas_microrregioes(grafo: Graph, caminho_bairros: str, caminho_
 
 def calcular_metricas_ego(grafo: Graph, caminho_saida: str):
     import csv
-    resultados = []
+    from .metrics import metricas_ego
 
-    for bairro in grafo.nodes.keys():
-        vizinhos = grafo.get_vizinhos(bairro)
-        ego_nos = set(vizinhos) | {bairro}
-        ego = grafo.criar_subgrafo_induzido(list(ego_nos))
-
-        resultados.append({
-            "bairro": bairro,
-            "grau": grafo.get_grau(bairro),
-            "ordem_ego": ego.get_ordem(),
-            "tamanho_ego": ego.get_tamanho(),
-            "densidade_ego": ego.get_densidade()
-        })
+    resultados = metricas_ego(grafo)
 
     with open(caminho_saida, "w", newline="", encoding="utf-8") as f:
         writer = csv.DictWriter(
@@ -124,31 +223,50 @@ def calcular_metricas_ego(grafo: Graph, caminho_saida: str):
 
 
 
-def calcular_graus(grafo: Graph, caminho_saida: str):
+COLUNAS_CENTRALIDADE = ("intermediacao", "proximidade", "harmonica")
+
+
+def calcular_graus(grafo: Graph, caminho_saida: str, centralidade: bool = False, **opcoes):
     """
     Gera out/graus.csv no formato exigido pelo PDF: bairro,grau
     (grau = número de interconexões).
+    Com centralidade=True (opcional, custa O(V·E)), acrescenta as colunas
+    intermediacao, proximidade e harmonica (centrality.centralidades;
+    'opcoes' são repassadas a ela, ex.: amostra=..., processos=..., ponderado=False).
     """
     import csv
     linhas = [{"bairro": b, "grau": grafo.get_grau(b)} for b in grafo.nodes.keys()]
+    colunas = ["bairro", "grau"]
+    if centralidade:
+        from .centrality import centralidades
+        res = centralidades(grafo, **opcoes)
+        for linha in linhas:
+            for c in COLUNAS_CENTRALIDADE:
+                linha[c] = res[c][linha["bairro"]]
+        colunas += COLUNAS_CENTRALIDADE
     with open(caminho_saida, "w", newline="", encoding="utf-8") as f:
-        w = csv.DictWriter(f, fieldnames=["bairro", "grau"])
+        w = csv.DictWriter(f, fieldnames=colunas)
         w.writeheader()
         w.writerows(linhas)
     print(f"✓ Graus salvos em '{caminho_saida}'")
     return linhas
 
 
-def gerar_rankings_json(path_graus: str, path_ego: str, path_out: str):
+def gerar_rankings_json(path_graus: str, path_ego: str, path_out: str, graus=None, ego=None):
     """
     Cria out/rankings.json com:
       - maior_grau: argmax(grau) com desempate (densidade_ego, ordem_ego, bairro)
       - maior_densidade_ego: argmax(densidade_ego) com desempate (ordem_ego, grau, bairro)
+      - maior_intermediacao / maior_proximidade / maior_harmonica, se graus.csv
+        tiver as colunas de centralidade: argmax com desempate (grau, bairro)
+    'graus' e 'ego' (linhas como as de calcular_graus / calcular_metricas_ego)
+    evitam reler os CSVs quando já estão em memória.
     """
     import pandas as pd, json
 
-    df_g = pd.read_csv(path_graus)             
-    df_e = pd.read_csv(path_ego)               
+    # round_trip: os floats relidos são os mesmos que foram gravados
+    df_g = pd.read_csv(path_graus, float_precision="round_trip") if graus is None else pd.DataFrame(graus)
+    df_e = pd.read_csv(path_ego, float_precision="round_trip") if ego is None else pd.DataFrame(ego)
 
     gmax = df_g["grau"].max()
     top_g = df_g[df_g["grau"] == gmax].merge(
@@ -182,6 +300,15 @@ def gerar_rankings_json(path_graus: str, path_ego: str, path_out: str):
             "ordem_ego": int(linha_d["ordem_ego"])
         }
     }
+    for coluna in COLUNAS_CENTRALIDADE:
+        if coluna not in df_g.columns:
+            continue
+        linha_c = df_g.sort_values([coluna, "grau", "bairro"], ascending=[False, False, True]).iloc[0]
+        rankings[f"maior_{coluna}"] = {
+            "bairro": linha_c["bairro"],
+            coluna: float(linha_c[coluna]),
+            "grau": int(linha_c["grau"])
+        }
 
     with open(path_out, "w", encoding="utf-8") as f:
         json.dump(rankings, f, ensure_ascii=False, indent=2)
@@ -193,68 +320,217 @@ def carregar_grafo_ponderado(caminho_csv: str) -> Graph:
     """
     Lê adjacencias_bairros.csv e cria um grafo ponderado (arestas com pesos).
     """
-    grafo = Graph()
-    df = pd.read_csv(caminho_csv)
-
-    for _, row in df.iterrows():
-        u = row["bairro_origem"].strip()
-        v = row["bairro_destino"].strip()
-        peso = float(row["peso"])
-
-        grafo.add_node(u)
-        grafo.add_node(v)
+    import numpy as np
+    import pandas as pd
 
-        if u not in grafo.adj:
-            grafo.adj[u] = []
-        if v not in grafo.adj:
-            grafo.adj[v] = []
+    df = pd.read_csv(caminho_csv)
+    origem = df["bairro_origem"].astype(str).str.strip()
+    destino = df["bairro_destino"].astype(str).str.strip()
 
-        grafo.adj[u].append((v, peso))
-        grafo.adj[v].append((u, peso))
+    # nós na ordem da primeira aparição (origem, destino, origem, ...)
+    bairros = pd.unique(np.column_stack([origem, destino]).ravel())
+    grafo, _ = construir_grafo(bairros, [None] * len(bairros), origem, destino, df["peso"])
 
-    print(f"Grafo ponderado carregado com {len(grafo)} nós e {grafo.size()} arestas.")
+    print(f"Grafo ponderado carregado com {grafo.get_ordem()} nós e {grafo.get_tamanho()} arestas.")
     return grafo
 
-def calcular_distancias_enderecos(caminho_adj: str, caminho_enderecos: str, saida_csv: str, saida_json: str):
+def calcular_distancias_enderecos(caminho_adj: str, caminho_enderecos: str, saida_csv: str, saida_json: str,
+                                  processos: int | None = None, colunas=("origem", "destino"),
+                                  grafo: Graph | None = None):
     """
-    Calcula o menor caminho entre pares de endereços (origem, destino) usando Dijkstra.
+    Calcula o menor caminho entre pares de endereços (origem, destino) usando Dijkstra,
+    com um único Dijkstra de fonte única por origem distinta (rotas_em_lote).
+    Com processos > 1, as origens são repartidas num pool (parallel.RoteadorParalelo).
+    'colunas' nomeia as colunas de origem e destino; um 'grafo' já carregado
+    dispensa a leitura de 'caminho_adj'.
     """
-    from .algorithms import dijkstra
+    import pandas as pd
+    from .algorithms import rotas_em_lote
 
-    grafo = carregar_grafo_ponderado(caminho_adj)
+    if grafo is None:
+        grafo = carregar_grafo_ponderado(caminho_adj)
     df = pd.read_csv(caminho_enderecos)
     resultados = []
 
-    for _, row in df.iterrows():
-        origem = str(row["origem"]).strip()
-        destino = str(row["destino"]).strip()
+    pares = [
+        (str(o).strip(), str(d).strip())
+        for o, d in zip(df[colunas[0]], df[colunas[1]])
+    ]
+    bairros = _resolver_pares(ResolvedorBairros(grafo.nodes, limiar=None), pares)
+    if processos and processos > 1:
+        from .parallel import rotas_em_lote_paralelo
+        rotas = rotas_em_lote_paralelo(grafo, bairros, processos)
+    else:
+        rotas = rotas_em_lote(grafo, bairros)
+
+    for (origem, destino), par, (custo, caminho) in zip(pares, bairros, rotas):
+        resultados.append(_linha_distancia(origem, destino, custo, caminho))
+        if _e_percurso_obrigatorio(*par):
+            _salvar_percurso_json(saida_json, origem, destino, custo, caminho)
+
+    pd.DataFrame(resultados).to_csv(saida_csv, index=False)
+    print(f"Distâncias calculadas e salvas em '{saida_csv}'")
+    return resultados
+
+def _linha_distancia(origem, destino, custo, caminho) -> dict:
+    return {
+        "origem": origem,
+        "destino": destino,
+        "custo": round(custo, 3),
+        "caminho": " -> ".join(caminho)
+    }
 
-        custo, caminho = dijkstra(grafo, origem, destino)
-        resultados.append({
+def _resolver_pares(resolvedor: ResolvedorBairros, pares) -> list[tuple[str, str]]:
+    # texto -> nó do grafo só por chave exata ou apelido (sem palpite por
+    # trigramas: a saída não registra o nome resolvido); o que não resolve
+    # segue como veio e vira rota inf
+    pares = list(pares)
+    origens = resolvedor.resolver_muitos(o for o, _ in pares)
+    destinos = resolvedor.resolver_muitos(d for _, d in pares)
+    return [
+        (ro or o, rd or d) for (o, d), ro, rd in zip(pares, origens, destinos)
+    ]
+
+def _e_percurso_obrigatorio(origem: str, destino: str) -> bool:
+    # recebe nomes já resolvidos (Setúbal -> Boa Viagem)
+    return origem == "Nova Descoberta" and destino == "Boa Viagem"
+
+def _salvar_percurso_json(saida_json, origem, destino, custo, caminho) -> None:
+    with open(saida_json, "w", encoding="utf-8") as fjson:
+        json.dump({
             "origem": origem,
             "destino": destino,
-            "custo": round(custo, 3),
-            "caminho": " -> ".join(caminho)
-        })
+            "caminho": caminho,
+            "custo": custo
+        }, fjson, indent=2, ensure_ascii=False)
 
-        if origem.lower() == "nova descoberta" and "boa viagem" in destino.lower():
-            with open(saida_json, "w", encoding="utf-8") as fjson:
-                json.dump({
-                    "origem": origem,
-                    "destino": destino,
-                    "caminho": caminho,
-                    "custo": custo
-                }, fjson, indent=2, ensure_ascii=False)
+def _ler_pares_com_offset(f, colunas):
+    """
+    Gera (origem, destino, offset) de um CSV aberto em modo binário, onde
+    offset é a posição logo após o registro (ponto de retomada). O csv.reader
+    puxa uma linha por vez, então f.tell() é exato mesmo com campos entre aspas.
+    Registros curtos não interrompem o fluxo: o campo que falta vira "nan".
+    """
+    import csv
 
-    pd.DataFrame(resultados).to_csv(saida_csv, index=False)
-    print(f"Distâncias calculadas e salvas em '{saida_csv}'")
-    return resultados
+    def _linhas():
+        while True:
+            linha = f.readline()
+            if not linha:
+                return
+            yield linha.decode("utf-8")
+
+    def _campo(registro, i):
+        # campo ausente ou vazio: o pandas lê NaN e str(NaN) == "nan"; mesmo
+        # texto aqui, para a linha sair igual (rota inf) e a retomada seguir
+        valor = registro[i].strip() if i < len(registro) else ""
+        return valor or "nan"
+
+    leitor = csv.reader(_linhas())
+    for registro in leitor:
+        if registro:
+            yield _campo(registro, colunas[0]), _campo(registro, colunas[1]), f.tell()
+
+def calcular_distancias_enderecos_stream(caminho_adj: str, caminho_enderecos: str, saida_csv: str,
+                                         saida_json: str | None = None, tamanho_lote: int = 100_000,
+                                         colunas=("origem", "destino"), checkpoint: str | None = None,
+                                         processos: int | None = None):
+    """
+    Versão em fluxo de calcular_distancias_enderecos para arquivos que não cabem
+    na memória: lê os pares em lotes de 'tamanho_lote', roteia cada lote com
+    rotas_em_lote e anexa as linhas ao CSV de saída (mesmas colunas).
+
+    Após cada lote, grava em 'checkpoint' (padrão: saida_csv + ".ckpt") o
+    offset já consumido da entrada e o tamanho da saída. Se o checkpoint
+    existir, retoma dali (descartando linhas de saída de um lote incompleto);
+    ao terminar, o checkpoint é removido. Com processos > 1, cada lote é
+    roteado num mesmo pool (parallel.RoteadorParalelo), aberto uma vez.
+    Retorna o número de pares processados.
+    """
+    import csv
+    import os
+    from contextlib import nullcontext
+    from .algorithms import rotas_em_lote
+
+    checkpoint = checkpoint or saida_csv + ".ckpt"
+    estado = {"entrada": 0, "saida": 0, "pares": 0}
+    if os.path.exists(checkpoint):
+        with open(checkpoint, "r", encoding="utf-8") as f:
+            estado = json.load(f)
+        print(f"Retomando após {estado['pares']} pares (checkpoint '{checkpoint}').")
+
+    grafo = carregar_grafo_ponderado(caminho_adj)
+    resolvedor = ResolvedorBairros(grafo.nodes, limiar=None)
+
+    def _gravar_estado():
+        tmp = checkpoint + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(estado, f)
+        os.replace(tmp, checkpoint)
+
+    # a saída volta ao tamanho do último lote confirmado (0 numa execução nova)
+    if os.path.exists(saida_csv):
+        os.truncate(saida_csv, estado["saida"])
+
+    if processos and processos > 1:
+        from .parallel import RoteadorParalelo
+        roteador = RoteadorParalelo(grafo, processos)
+        rotear = roteador.rotas
+    else:
+        roteador = nullcontext()
+        rotear = lambda lote: rotas_em_lote(grafo, lote)
+
+    with roteador, open(caminho_enderecos, "rb") as entrada, \
+            open(saida_csv, "a", encoding="utf-8", newline="") as saida:
+        escritor = csv.DictWriter(
+            saida, fieldnames=["origem", "destino", "custo", "caminho"], lineterminator="\n"
+        )
+
+        if estado["entrada"] == 0:
+            cabecalho = next(csv.reader([entrada.readline().decode("utf-8-sig")]))
+            idx = tuple(cabecalho.index(c) for c in colunas)
+            escritor.writeheader()
+            estado["colunas"] = idx
+        else:
+            idx = tuple(estado["colunas"])
+            entrada.seek(estado["entrada"])
+
+        lote = []
+        fluxo = _ler_pares_com_offset(entrada, idx)
+        while True:
+            lote.clear()
+            for origem, destino, fim in fluxo:
+                lote.append((origem, destino))
+                if len(lote) >= tamanho_lote:
+                    break
+            if not lote:
+                break
+
+            bairros = _resolver_pares(resolvedor, lote)
+            for (origem, destino), par, (custo, caminho) in zip(lote, bairros, rotear(bairros)):
+                escritor.writerow(_linha_distancia(origem, destino, custo, caminho))
+                if saida_json and _e_percurso_obrigatorio(*par):
+                    _salvar_percurso_json(saida_json, origem, destino, custo, caminho)
+            saida.flush()
+            os.fsync(saida.fileno())
+
+            estado["entrada"] = fim
+            estado["saida"] = os.fstat(saida.fileno()).st_size
+            estado["pares"] += len(lote)
+            _gravar_estado()
+
+    if os.path.exists(checkpoint):
+        os.remove(checkpoint)
+    print(f"Distâncias de {estado['pares']} pares salvas em '{saida_csv}'")
+    return estado["pares"]
 
 def carregar_grafo_recife(path_unique, path_adjacencias):
     """
     Lê os arquivos CSV e retorna um objeto Graph populado
     e um dicionário de mapeamento bairro -> microrregiao.
     """
+    import pandas as pd
+
     print("Carregando nós (bairros)...")
     try:
         df_nodes = pd.read_csv(path_unique)
@@ -266,16 +542,86 @@ def carregar_grafo_recife(path_unique, path_adjacencias):
         print(f"Erro ao ler {path_unique}: {e}")
         return None, None
 
-    G = Graph()
+    print("Carregando arestas (adjacências)...")
+    try:
+        df_edges = pd.read_csv(path_adjacencias)
+    except FileNotFoundError:
+        print(f"Erro: Arquivo de adjacências não encontrado em {path_adjacencias}")
+        return None, None
+    except Exception as e:
+        print(f"Erro ao ler {path_adjacencias}: {e}")
+        return None, None
+
+    G, rejeitadas = construir_grafo(
+        bairro_para_micro.keys(), bairro_para_micro.values(),
+        df_edges['bairro_origem'], df_edges['bairro_destino'],
+        df_edges['peso'] if 'peso' in df_edges.columns else None,
+    )
+    print(f"Carregados {G.get_ordem()} nós.")
+    _avisar_rejeitadas(G, zip(rejeitadas["origem"], rejeitadas["destino"]))
+        
+    print(f"Carregadas {G.get_tamanho()} arestas.")
+    
+    return G, bairro_para_micro
+
 
+def _float_ou_nan(valor) -> float:
+    # mesmo efeito de pd.to_numeric(errors="coerce")
+    try:
+        return float(valor)
+    except (TypeError, ValueError):
+        return float("nan")
+
+
+def _campo(linha: dict, coluna: str) -> str:
+    # linhas curtas do csv.DictReader trazem None nas colunas que faltam
+    return (linha.get(coluna) or "").strip()
+
+
+def carregar_grafo_recife_csv(path_unique, path_adjacencias):
+    """
+    Mesmo resultado de carregar_grafo_recife, lido só com o módulo csv
+    (sem pandas/NumPy). Para processos que apenas roteiam sobre o grafo
+    e não devem pagar a importação do pandas.
+    Linhas curtas são toleradas: nó sem nome é pulado, microrregião vazia
+    vira None e aresta sem origem/destino é rejeitada como desconhecida.
+    """
+    import csv
+
+    print("Carregando nós (bairros)...")
+    try:
+        with open(path_unique, newline="", encoding="utf-8") as f:
+            bairro_para_micro = {}
+            for linha in csv.DictReader(f):
+                bairro, micro = linha.get("bairro"), _campo(linha, "microrregiao")
+                if bairro is None or not bairro.strip():
+                    continue
+                bairro_para_micro[bairro] = int(micro) if micro else None
+    except FileNotFoundError:
+        print(f"Erro: Arquivo de nós não encontrado em {path_unique}")
+        return None, None
+    except Exception as e:
+        print(f"Erro ao ler {path_unique}: {e}")
+        return None, None
+
+    G = Graph()
     for bairro, microrregiao in bairro_para_micro.items():
         G.adicionar_no(bairro, microrregiao)
-        
     print(f"Carregados {G.get_ordem()} nós.")
 
     print("Carregando arestas (adjacências)...")
+    rejeitadas = []
     try:
-        df_edges = pd.read_csv(path_adjacencias)
+        with open(path_adjacencias, newline="", encoding="utf-8") as f:
+            leitor = csv.DictReader(f)
+            tem_peso = "peso" in (leitor.fieldnames or [])
+            for linha in leitor:
+                u = _campo(linha, "bairro_origem")
+                v = _campo(linha, "bairro_destino")
+                if u not in G.nodes or v not in G.nodes:
+                    rejeitadas.append((u, v))
+                    continue
+                G.adicionar_aresta(u, v, _float_ou_nan(linha.get("peso")) if tem_peso else 1.0)
     except FileNotFoundError:
         print(f"Erro: Arquivo de adjacências não encontrado em {path_adjacencias}")
         return None, None
@@ -283,13 +629,7 @@ def carregar_grafo_recife(path_unique, path_adjacencias):
         print(f"Erro ao ler {path_adjacencias}: {e}")
         return None, None
 
-    for _, linha in df_edges.iterrows():
-        u = str(linha['bairro_origem']).strip()
-        v = str(linha['bairro_destino']).strip()
-        peso = float(linha.get('peso', 1.0))
-        G.adicionar_aresta(u, v, peso)
-
-        
+    _avisar_rejeitadas(G, rejeitadas)
     print(f"Carregadas {G.get_tamanho()} arestas.")
-    
+
     return G, bairro_para_micro
@@ -0,0 +1,96 @@
+from .graph import _densidade
+
+
+def contar_triangulos(G) -> dict[str, int]:
+    """
+    Número de triângulos que passam por cada nó.
+    Algoritmo 'forward': cada aresta é orientada do nó de menor para o de
+    maior (grau, posição) e cada triângulo é achado uma única vez pela
+    interseção dos conjuntos de saída — O(m^1.5), sem montar subgrafos.
+    """
+    nos = list(G.nodes.keys())
+    pos = {n: i for i, n in enumerate(nos)}
+    chave = {n: (G.get_grau(n), pos[n]) for n in nos}
+
+    saida = {
+        u: {v for v in G.get_vizinhos(u) if v != u and chave[v] > chave[u]}
+        for u in nos
+    }
+
+    tri = dict.fromkeys(nos, 0)
+    for u in nos:
+        su = saida[u]
+        for v in su:
+            for w in su & saida[v]:
+                tri[u] += 1
+                tri[v] += 1
+                tri[w] += 1
+    return tri
+
+
+def metricas_ego(G) -> list[dict]:
+    """
+    Métricas da ego-subrede (nó + vizinhos) de todos os nós numa passada:
+      ordem_ego   = |vizinhos ∪ {nó}|
+      tamanho_ego = arestas nó–vizinho + triângulos no nó
+      densidade_ego pela fórmula de Graph.get_densidade.
+    Equivale a criar_subgrafo_induzido por nó, sem construir os subgrafos.
+    Linhas na ordem de G.nodes, com as colunas de ego_bairro.csv.
+    """
+    tri = contar_triangulos(G)
+    linhas = []
+    for bairro in G.nodes.keys():
+        vizinhos = G.get_vizinhos(bairro)
+        laco = bairro in vizinhos
+        ordem = len(vizinhos) + (0 if laco else 1)
+        tamanho = len(vizinhos) - (1 if laco else 0) + tri[bairro]
+        linhas.append({
+            "bairro": bairro,
+            "grau": G.get_grau(bairro),
+            "ordem_ego": ordem,
+            "tamanho_ego": tamanho,
+            "densidade_ego": _densidade(ordem, tamanho)
+        })
+    return linhas
+
+
+_SEM_GRUPO = object()
+
+
+def metricas_por_grupo(G, grupo_de) -> dict:
+    """
+    Métricas de todos os grupos de uma partição numa única varredura de G.edges.
+    'grupo_de' é qualquer mapeamento nó -> grupo (ex.: bairro -> microrregião);
+    nós fora do mapeamento não pertencem a grupo algum.
+
+    Retorna dict grupo -> {"ordem", "tamanho", "corte", "densidade"}, com os
+    grupos na ordem em que aparecem em 'grupo_de':
+      - ordem: nós do grupo presentes em G
+      - tamanho: arestas internas (mesmo valor do subgrafo induzido)
+      - corte: arestas com exatamente um extremo no grupo
+    """
+    res: dict = {}
+    for no, g in grupo_de.items():
+        m = res.get(g)
+        if m is None:
+            m = res[g] = {"ordem": 0, "tamanho": 0, "corte": 0, "densidade": 0.0}
+        if no in G.nodes:
+            m["ordem"] += 1
+
+    for u, v in G.edges:
+        if u == v:
+            continue
+        gu = grupo_de.get(u, _SEM_GRUPO)
+        gv = grupo_de.get(v, _SEM_GRUPO)
+        if gu == gv:
+            if gu is not _SEM_GRUPO:
+                res[gu]["tamanho"] += 1
+            continue
+        if gu is not _SEM_GRUPO:
+            res[gu]["corte"] += 1
+        if gv is not _SEM_GRUPO:
+            res[gv]["corte"] += 1
+
+    for m in res.values():
+        m["densidade"] = _densidade(m["ordem"], m["tamanho"])
+    return res
@@ -0,0 +1,180 @@
+import heapq
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from .csr import CSRGraph
+
+# (nome do array, formato de memoryview.cast, dtype)
+_ARRAYS = (("indptr", "q", np.int64), ("indices", "i", np.int32), ("weights", "d", np.float64))
+
+# estado de cada processo trabalhador (preenchido por _iniciar_trabalhador)
+_TRABALHADOR: dict = {}
+
+
+def _dijkstra_ids(indptr, indices, weights, s: int, alvos: set):
+    """
+    Dijkstra sobre os arrays CSR (memoryviews) até fixar todos os 'alvos'.
+    Arestas com peso NaN são ignoradas, como em dijkstra. Retorna (dist, prev).
+    """
+    dist = {s: 0.0}
+    prev = {s: -1}
+    fixados = set()
+    faltam = set(alvos)
+    pq = [(0.0, s)]
+    while pq and faltam:
+        d, u = heapq.heappop(pq)
+        if u in fixados:
+            continue
+        fixados.add(u)
+        faltam.discard(u)
+        for k in range(indptr[u], indptr[u + 1]):
+            v = indices[k]
+            nd = d + weights[k]
+            if nd < dist.get(v, float("inf")):
+                dist[v] = nd
+                prev[v] = u
+                heapq.heappush(pq, (nd, v))
+    return dist, prev
+
+
+def publicar_csr(C: CSRGraph):
+    """
+    Copia indptr/indices/weights de 'C' para blocos de shared_memory.
+    Retorna (blocos, publicados): os blocos ficam com o chamador (ver
+    liberar_blocos); 'publicados' é o argumento de _iniciar_trabalhador.
+    """
+    blocos: list[shared_memory.SharedMemory] = []
+    publicados = {}
+    try:
+        for nome, _, dtype in _ARRAYS:
+            arr = np.ascontiguousarray(getattr(C, nome), dtype=dtype)
+            shm = shared_memory.SharedMemory(create=True, size=max(1, arr.nbytes))
+            blocos.append(shm)
+            np.ndarray(arr.shape, dtype=dtype, buffer=shm.buf)[:] = arr
+            publicados[nome] = (shm.name, arr.nbytes)
+    except BaseException:
+        liberar_blocos(blocos)
+        raise
+    return blocos, publicados
+
+
+def liberar_blocos(blocos) -> None:
+    for shm in blocos:
+        shm.close()
+        shm.unlink()
+
+
+def _iniciar_trabalhador(blocos: dict) -> None:
+    # anexa os blocos publicados pelo processo pai; nada é copiado
+    for nome, fmt, _ in _ARRAYS:
+        shm_nome, nbytes = blocos[nome]
+        shm = shared_memory.SharedMemory(name=shm_nome)
+        _TRABALHADOR[nome + "_shm"] = shm
+        _TRABALHADOR[nome] = shm.buf[:nbytes].cast(fmt)
+
+
+def _rotear_tarefa(tarefa):
+    """tarefa: [(origem_id, [(posicao, destino_id), ...]), ...] -> [(posicao, custo, caminho_ids)]"""
+    indptr, indices, weights = _TRABALHADOR["indptr"], _TRABALHADOR["indices"], _TRABALHADOR["weights"]
+    saida = []
+    for s, destinos in tarefa:
+        dist, prev = _dijkstra_ids(indptr, indices, weights, s, {t for _, t in destinos})
+        for pos, t in destinos:
+            if t not in dist:
+                saida.append((pos, float("inf"), []))
+                continue
+            caminho = []
+            x = t
+            while x != -1:
+                caminho.append(x)
+                x = prev[x]
+            caminho.reverse()
+            saida.append((pos, float(dist[t]), caminho))
+    return saida
+
+
+class RoteadorParalelo:
+    """
+    Roteamento em lote num pool de processos sobre um grafo publicado uma
+    única vez em multiprocessing.shared_memory.
+
+    Os arrays CSR (indptr, indices, weights) são copiados para blocos de
+    memória compartilhada; cada trabalhador os anexa no início e lê por
+    memoryview.cast, sem pickling do grafo por tarefa. Os pares são
+    agrupados por origem (um Dijkstra por origem distinta, como em
+    rotas_em_lote) e as origens repartidas entre as tarefas; os resultados
+    voltam na ordem dos pares, independente da ordem de conclusão.
+
+    Uso:
+        with RoteadorParalelo(G, processos=8) as R:
+            rotas = R.rotas(pares)
+    """
+
+    def __init__(self, G, processos: int | None = None, tarefas_por_processo: int = 4, mp_context=None):
+        C = G if isinstance(G, CSRGraph) else CSRGraph.from_graph(G)
+        self.nomes = C.nomes
+        self.ids = C.ids
+        self.processos = processos or os.cpu_count() or 1
+        self.tarefas_por_processo = tarefas_por_processo
+
+        self._blocos, publicados = publicar_csr(C)
+        try:
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.processos, mp_context=mp_context,
+                initializer=_iniciar_trabalhador, initargs=(publicados,),
+            )
+        except BaseException:
+            liberar_blocos(self._blocos)
+            raise
+
+    def rotas(self, pares) -> list:
+        """Mesmo contrato de rotas_em_lote: lista de (custo_total, caminho) na ordem de 'pares'."""
+        ids = self.ids
+        por_origem: dict[int, list] = {}
+        n = 0
+        for pos, (origem, destino) in enumerate(pares):
+            n += 1
+            s, t = ids.get(origem), ids.get(destino)
+            if s is None or t is None:
+                continue
+            por_origem.setdefault(s, []).append((pos, t))
+        resultados = [(float("inf"), []) for _ in range(n)]
+
+        tarefas = self._repartir(por_origem)
+        nomes = self.nomes
+        for saida in self._pool.map(_rotear_tarefa, tarefas):
+            for pos, custo, caminho in saida:
+                resultados[pos] = (custo, [nomes[i] for i in caminho])
+        return resultados
+
+    def _repartir(self, por_origem: dict) -> list:
+        """Origens (com todos os seus pares) em tarefas de carga parecida, ordem determinística."""
+        n_tarefas = max(1, min(len(por_origem), self.processos * self.tarefas_por_processo))
+        tarefas = [[] for _ in range(n_tarefas)]
+        carga = [(0, i) for i in range(n_tarefas)]
+        # maiores grupos primeiro, cada um na tarefa menos carregada
+        for s in sorted(por_origem, key=lambda s: (-len(por_origem[s]), s)):
+            c, i = heapq.heappop(carga)
+            tarefas[i].append((s, por_origem[s]))
+            heapq.heappush(carga, (c + 1 + len(por_origem[s]), i))
+        return [t for t in tarefas if t]
+
+    def fechar(self) -> None:
+        self._pool.shutdown()
+        liberar_blocos(self._blocos)
+        self._blocos = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.fechar()
+
+
+def rotas_em_lote_paralelo(G, pares, processos: int | None = None):
+    """rotas_em_lote em 'processos' processos (padrão: um por CPU)."""
+    with RoteadorParalelo(G, processos) as R:
+        return R.rotas(pares)
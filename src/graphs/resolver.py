@@ -0,0 +1,101 @@
+import re
+import unicodedata
+
+# apelidos (já normalizados) -> bairro canônico; "Boa Viagem (Setúbal)" é a
+# grafia usada nas saídas do passo 6
+ALIASES = {"setubal": "Boa Viagem", "boa viagem setubal": "Boa Viagem"}
+
+_NAO_ALNUM = re.compile(r"[^a-z0-9]+")
+
+
+def normalizar(nome) -> str:
+    """
+    Chave de busca de um nome: sem acentos, casefold, com qualquer pontuação
+    ou hífen virando um espaço só. "Água-Fria " e "agua fria" dão a mesma chave.
+    """
+    t = unicodedata.normalize("NFKD", str(nome)).encode("ASCII", "ignore").decode("ASCII")
+    return _NAO_ALNUM.sub(" ", t.casefold()).strip()
+
+
+def padronizar_nome(nome) -> str:
+    """
+    Forma de exibição usada em bairros_unique.csv: Title Case, sem acentos,
+    hífen como espaço; Setúbal vira Boa Viagem.
+    """
+    nome_padronizado = str(nome).strip().title()
+    nome_padronizado = unicodedata.normalize("NFKD", nome_padronizado).encode("ASCII", "ignore").decode("ASCII")
+    nome_padronizado = nome_padronizado.replace("-", " ")
+    return ALIASES.get(normalizar(nome_padronizado), nome_padronizado)
+
+
+def _trigramas(chave: str) -> set[str]:
+    t = f"  {chave} "
+    return {t[i:i + 3] for i in range(len(t) - 2)}
+
+
+class ResolvedorBairros:
+    """
+    Resolve texto livre para o nome canônico de um nó, com índice pré-computado.
+
+      1. chave normalizada (ver normalizar) -> nome canônico, incluindo ALIASES;
+      2. sem acerto exato, índice de trigramas: o candidato de maior
+         similaridade de Jaccard, se >= 'limiar'; senão None. Com
+         limiar=None não há palpite: só o passo 1.
+
+    Cada texto distinto é normalizado uma única vez: os resultados ficam num
+    memo (até 'max_memo' entradas), e resolver_muitos deduplica o lote antes.
+    """
+
+    def __init__(self, nomes, aliases: dict | None = None, limiar: float | None = 0.5,
+                 max_memo: int = 1_000_000):
+        nomes = list(nomes)
+        self.limiar = limiar
+        self.max_memo = max_memo
+        self._indice: dict[str, str] = {}
+        for n in nomes:
+            self._indice.setdefault(normalizar(n), n)
+        conhecidos = set(nomes)
+        for apelido, canonico in (ALIASES if aliases is None else aliases).items():
+            if canonico in conhecidos:
+                self._indice.setdefault(normalizar(apelido), canonico)
+
+        self._trigramas = {chave: _trigramas(chave) for chave in self._indice}
+        self._por_trigrama: dict[str, list[str]] = {}
+        for chave, tris in self._trigramas.items():
+            for t in tris:
+                self._por_trigrama.setdefault(t, []).append(chave)
+        self._memo: dict[str, str | None] = {}
+
+    def resolver(self, texto) -> str | None:
+        """Nome canônico para 'texto', ou None se nada for parecido o bastante."""
+        achado = self._memo.get(texto, self)
+        if achado is not self:
+            return achado
+        chave = normalizar(texto)
+        achado = self._indice.get(chave)
+        if achado is None and chave and self.limiar is not None:
+            achado = self._aproximado(chave)
+        if len(self._memo) >= self.max_memo:
+            self._memo.clear()
+        self._memo[texto] = achado
+        return achado
+
+    def resolver_muitos(self, textos) -> list[str | None]:
+        """resolver() para um lote, resolvendo cada texto distinto uma vez."""
+        textos = list(textos)
+        distintos = {t: self.resolver(t) for t in dict.fromkeys(textos)}
+        return [distintos[t] for t in textos]
+
+    def _aproximado(self, chave: str) -> str | None:
+        tris = _trigramas(chave)
+        comuns: dict[str, int] = {}
+        for t in tris:
+            for candidata in self._por_trigrama.get(t, ()):
+                comuns[candidata] = comuns.get(candidata, 0) + 1
+        melhor, melhor_sim = None, self.limiar
+        # desempate determinístico: maior similaridade, depois menor chave
+        for candidata, n in sorted(comuns.items()):
+            sim = n / (len(tris) + len(self._trigramas[candidata]) - n)
+            if sim > melhor_sim or (sim == melhor_sim and melhor is None):
+                melhor, melhor_sim = candidata, sim
+        return None if melhor is None else self._indice[melhor]
@@ -0,0 +1,163 @@
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+
+import numpy as np
+
+from .csr import CSRGraph
+
+VERSAO_FORMATO = 2   # 2: arrays numa geração (subdiretório) nomeada no meta.json
+ARQ_META = "meta.json"
+ARRAYS = ("indptr", "indices", "weights", "microrregioes")
+
+
+def _impressao(caminho: str, com_hash: bool = True) -> dict:
+    """Identidade de um arquivo-fonte: tamanho, mtime e (opcional) sha256 do conteúdo."""
+    st = os.stat(caminho)
+    info = {"caminho": os.path.abspath(caminho), "tamanho": st.st_size, "mtime_ns": st.st_mtime_ns}
+    if com_hash:
+        h = hashlib.sha256()
+        with open(caminho, "rb") as f:
+            for bloco in iter(lambda: f.read(1 << 20), b""):
+                h.update(bloco)
+        info["sha256"] = h.hexdigest()
+    return info
+
+
+def _fontes_conferem(gravadas: list[dict], caminhos: list[str]) -> tuple[bool, bool]:
+    """
+    Compara as fontes atuais com as gravadas no snapshot.
+    Retorna (confere, so_hash): so_hash indica que tamanho/mtime mudaram
+    mas o conteúdo (sha256) é o mesmo.
+    """
+    if len(gravadas) != len(caminhos):
+        return False, False
+    so_hash = False
+    for g, caminho in zip(gravadas, caminhos):
+        if g["caminho"] != os.path.abspath(caminho) or not os.path.exists(caminho):
+            return False, False
+        atual = _impressao(caminho, com_hash=False)
+        if atual["tamanho"] == g["tamanho"] and atual["mtime_ns"] == g["mtime_ns"]:
+            continue
+        if atual["tamanho"] != g["tamanho"] or _impressao(caminho)["sha256"] != g.get("sha256"):
+            return False, False
+        so_hash = True
+    return True, so_hash
+
+
+def _gravar_meta(meta_path: str, meta: dict) -> None:
+    # arquivo temporário + os.replace: leitores veem o meta.json antigo ou o novo, inteiro
+    tmp = f"{meta_path}.{os.getpid()}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(meta, f, ensure_ascii=False)
+    os.replace(tmp, meta_path)
+
+
+def salvar_snapshot(C: CSRGraph, diretorio: str, fontes: list[str] = (),
+                    impressoes: list[dict] | None = None) -> str:
+    """
+    Grava o CSRGraph em 'diretorio': um .npy por array (indptr, indices,
+    weights, microrregioes) numa geração nova (subdiretório próprio) e
+    meta.json com nomes dos nós, a geração e a identidade das fontes.
+
+    Nenhum .npy publicado é reescrito: processos que já mapearam uma geração
+    antiga continuam lendo arrays coerentes com os seus nomes/ids. meta.json
+    é trocado atomicamente por último e marca o snapshot completo; gerações
+    antigas são apagadas depois (em POSIX, mapeamentos abertos sobrevivem).
+    'impressoes' são as identidades das fontes tomadas ANTES de lê-las (ver
+    carregar_grafo_recife_cache); sem elas, são calculadas agora.
+    """
+    if impressoes is None:
+        impressoes = [_impressao(f) for f in fontes]
+    os.makedirs(diretorio, exist_ok=True)
+    geracao = tempfile.mkdtemp(prefix="g-", dir=diretorio)
+    for nome in ARRAYS:
+        np.save(os.path.join(geracao, f"{nome}.npy"), getattr(C, nome))
+
+    meta = {
+        "versao": VERSAO_FORMATO,
+        "geracao": os.path.basename(geracao),
+        "nomes": C.nomes,
+        "fontes": list(impressoes),
+    }
+    _gravar_meta(os.path.join(diretorio, ARQ_META), meta)
+    _apagar_geracoes_antigas(diretorio, manter=meta["geracao"])
+    return diretorio
+
+
+def _apagar_geracoes_antigas(diretorio: str, manter: str) -> None:
+    atual = _ler_meta(os.path.join(diretorio, ARQ_META))
+    vivas = {manter, (atual or {}).get("geracao")}
+    for nome in os.listdir(diretorio):
+        if nome.startswith("g-") and nome not in vivas:
+            shutil.rmtree(os.path.join(diretorio, nome), ignore_errors=True)
+
+
+def _ler_meta(meta_path: str) -> dict | None:
+    try:
+        with open(meta_path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (FileNotFoundError, ValueError):
+        return None
+
+
+def carregar_snapshot(diretorio: str, fontes: list[str] | None = None) -> CSRGraph | None:
+    """
+    Abre um snapshot com os arrays mapeados em memória (mmap, somente leitura).
+    Se 'fontes' for dado, só reaproveita se elas conferirem (tamanho+mtime,
+    ou sha256 do conteúdo). Retorna None se ausente, incompleto ou obsoleto.
+    """
+    meta_path = os.path.join(diretorio, ARQ_META)
+    meta = _ler_meta(meta_path)
+    if meta is None or meta.get("versao") != VERSAO_FORMATO:
+        return None
+
+    if fontes is not None:
+        confere, so_hash = _fontes_conferem(meta["fontes"], list(fontes))
+        if not confere:
+            return None
+        if so_hash:
+            # conteúdo igual com mtime novo: atualiza a identidade gravada
+            meta["fontes"] = [_impressao(f) for f in fontes]
+            _gravar_meta(meta_path, meta)
+
+    geracao = os.path.join(diretorio, meta["geracao"])
+    try:
+        arrays = {
+            nome: np.load(os.path.join(geracao, f"{nome}.npy"), mmap_mode="r")
+            for nome in ARRAYS
+        }
+    except FileNotFoundError:
+        return None
+    return CSRGraph(meta["nomes"], arrays["indptr"], arrays["indices"],
+                    arrays["weights"], arrays["microrregioes"])
+
+
+def carregar_grafo_recife_cache(path_unique, path_adjacencias, diretorio: str | None = None):
+    """
+    Como carregar_grafo_recife, mas reaproveita um snapshot binário quando os
+    CSVs de origem não mudaram. Retorna (CSRGraph, bairro_para_micro).
+    Sem snapshot válido, lê os CSVs, grava o snapshot e segue.
+    """
+    if diretorio is None:
+        diretorio = os.path.join(os.path.dirname(path_adjacencias) or ".", ".snapshot", "grafo_recife")
+    fontes = [path_unique, path_adjacencias]
+
+    C = carregar_snapshot(diretorio, fontes)
+    if C is None:
+        from .io import carregar_grafo_recife_csv
+
+        # identidade tomada antes da leitura: se um CSV mudar durante a
+        # reconstrução, o snapshot fica carimbado como obsoleto
+        impressoes = [_impressao(f) for f in fontes]
+        G, _ = carregar_grafo_recife_csv(path_unique, path_adjacencias)
+        if G is None:
+            return None, None
+        salvar_snapshot(CSRGraph.from_graph(G), diretorio, impressoes=impressoes)
+        C = carregar_snapshot(diretorio)
+
+    micro = C.microrregioes.tolist()
+    bairro_para_micro = {n: (None if m < 0 else m) for n, m in zip(C.nomes, micro)}
+    return C, bairro_para_micro
@@ -0,0 +1,338 @@
+# src/pipeline.py
+"""
+Pipeline incremental dos artefatos em out/.
+
+Cada Etapa declara de quais etapas depende, quais arquivos lê de fora
+(data/...) e quais artefatos grava. A impressão digital de uma etapa é o
+sha256 de: nome, versão, conteúdo das entradas e a assinatura das
+dependências (o hash do conteúdo dos artefatos delas). Uma etapa só roda
+se a impressão mudou desde a última execução registrada no manifesto, ou
+se algum artefato seu sumiu ou foi alterado à mão. Como a assinatura de
+uma dependência é o conteúdo do que ela gravou, uma etapa refeita que
+produz os mesmos bytes não força as seguintes a rodar.
+
+Dentro de uma execução os valores passam de uma etapa para a seguinte em
+memória (ex.: o Graph carregado uma vez, as linhas de graus.csv para os
+rankings); só uma etapa pulada precisa reler o seu artefato ('carregar').
+Ramos independentes rodam ao mesmo tempo num pool de threads — o valor em
+memória não cruza processos; etapas com o mesmo 'recurso' (ex.: matplotlib,
+que não é thread-safe) nunca rodam juntas.
+
+Uso:
+    python -m src.pipeline                    # tudo o que estiver desatualizado
+    python -m src.pipeline rankings --forcar  # só rankings.json (e o que ele exige)
+"""
+import argparse
+import hashlib
+import json
+import os
+import threading
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from .graphs.snapshot import _impressao as _identidade_arquivo
+
+DATA_DIR = 'data'
+OUT_DIR = 'out'
+MANIFESTO = os.path.join(OUT_DIR, ".manifesto.json")
+
+
+class Etapa:
+    """
+    Um nó do pipeline.
+
+      funcao(*valores_das_dependencias) -> valor; grava os 'saidas'.
+      carregar() -> valor, relido dos 'saidas' quando a etapa é pulada
+        mas uma seguinte que roda precisa dele; sem 'carregar', isso é erro
+        (a etapa não é refeita por fora do manifesto).
+      versao: mude ao alterar a lógica da etapa, para forçar a reexecução.
+
+    Uma etapa sem 'saidas' é virtual: não grava nada, não entra no
+    manifesto e só é calculada quando alguma etapa que roda precisa dela.
+    """
+
+    def __init__(self, nome: str, funcao, depende=(), entradas=(), saidas=(), carregar=None,
+                 versao: str = "1", recurso: str | None = None):
+        self.nome = nome
+        self.funcao = funcao
+        self.depende = tuple(depende)
+        self.entradas = tuple(entradas)
+        self.saidas = tuple(saidas)
+        self.carregar = carregar
+        self.versao = versao
+        self.recurso = recurso
+
+
+class Pipeline:
+    """
+    Executa um DAG de Etapas refazendo só o que está desatualizado.
+    rodar() devolve nome -> "executada" | "atualizada" para as etapas
+    com artefatos; o estado fica em 'manifesto' (JSON).
+    """
+
+    def __init__(self, etapas, manifesto: str = MANIFESTO, trabalhadores: int = 4):
+        self.etapas: dict[str, Etapa] = {}
+        for e in etapas:
+            if e.nome in self.etapas:
+                raise ValueError(f"etapa repetida: {e.nome!r}")
+            self.etapas[e.nome] = e
+        for e in self.etapas.values():
+            for d in e.depende:
+                if d not in self.etapas:
+                    raise ValueError(f"{e.nome!r} depende de etapa inexistente {d!r}")
+        self.ordem = self._ordenar()
+        self.manifesto = manifesto
+        self.trabalhadores = trabalhadores
+
+    def _ordenar(self) -> list[str]:
+        ordem, estado = [], {}
+
+        def visitar(nome, pilha):
+            if estado.get(nome) == 2:
+                return
+            if estado.get(nome) == 1:
+                raise ValueError("ciclo no pipeline: " + " -> ".join(pilha + [nome]))
+            estado[nome] = 1
+            for d in self.etapas[nome].depende:
+                visitar(d, pilha + [nome])
+            estado[nome] = 2
+            ordem.append(nome)
+
+        for nome in self.etapas:
+            visitar(nome, [])
+        return ordem
+
+    def _necessarias(self, alvos) -> list[str]:
+        if alvos is None:
+            return list(self.ordem)
+        faltam, vistas = list(alvos), set()
+        while faltam:
+            nome = faltam.pop()
+            if nome not in self.etapas:
+                raise KeyError(f"etapa desconhecida: {nome!r}")
+            if nome not in vistas:
+                vistas.add(nome)
+                faltam.extend(self.etapas[nome].depende)
+        return [n for n in self.ordem if n in vistas]
+
+
+    # ---- execução ----
+
+    def rodar(self, alvos=None, forcar: bool = False) -> dict[str, str]:
+        """Atualiza 'alvos' (padrão: todas as etapas) e o que eles exigem."""
+        nomes = self._necessarias(alvos)
+        self._estado = self._ler_manifesto()
+        self._trava = threading.Lock()
+        self._travas = {n: threading.RLock() for n in nomes}
+        self._recursos = {e.recurso: threading.Lock() for e in self.etapas.values() if e.recurso}
+        self._valores: dict = {}
+        self._assinaturas: dict[str, str] = {}
+        self._forcar = forcar
+        resultado: dict[str, str] = {}
+
+        pendentes = {n: set(self.etapas[n].depende) for n in nomes}
+        try:
+            with ThreadPoolExecutor(max_workers=self.trabalhadores) as pool:
+                em_curso = {}
+                while pendentes or em_curso:
+                    for n in [n for n, deps in pendentes.items() if not deps]:
+                        del pendentes[n]
+                        em_curso[pool.submit(self._decidir, self.etapas[n])] = n
+                    feitas, _ = wait(em_curso, return_when=FIRST_COMPLETED)
+                    for fut in feitas:
+                        n = em_curso.pop(fut)
+                        status = fut.result()   # repassa a exceção da etapa
+                        if status is not None:
+                            resultado[n] = status
+                        for deps in pendentes.values():
+                            deps.discard(n)
+        finally:
+            self._gravar_manifesto()
+            self._valores = {}
+        return {n: resultado[n] for n in nomes if n in resultado}
+
+    def _decidir(self, e: Etapa) -> str | None:
+        impressao = self._impressao(e)
+        if not e.saidas:
+            self._assinaturas[e.nome] = impressao
+            return None
+
+        registro = self._estado["etapas"].get(e.nome)
+        if (not self._forcar and registro is not None and registro["impressao"] == impressao
+                and all(self._hash(s) == registro["saidas"].get(s) for s in e.saidas)):
+            self._assinaturas[e.nome] = self._assinar(registro["saidas"])
+            return "atualizada"
+
+        self._executar(e)
+        saidas = {s: self._hash(s) for s in e.saidas}
+        with self._trava:
+            self._estado["etapas"][e.nome] = {"impressao": impressao, "saidas": saidas}
+            self._gravar_manifesto()
+        self._assinaturas[e.nome] = self._assinar(saidas)
+        return "executada"
+
+    def _executar(self, e: Etapa):
+        with self._travas[e.nome]:
+            args = [self._valor(d) for d in e.depende]
+            for s in e.saidas:
+                os.makedirs(os.path.dirname(s) or ".", exist_ok=True)
+            if e.recurso:
+                with self._recursos[e.recurso]:
+                    valor = e.funcao(*args)
+            else:
+                valor = e.funcao(*args)
+            self._valores[e.nome] = valor
+            return valor
+
+    def _valor(self, nome: str):
+        """Valor da etapa 'nome' nesta execução: em memória, relido do disco ou (se virtual) calculado."""
+        with self._travas[nome]:
+            if nome in self._valores:
+                return self._valores[nome]
+            e = self.etapas[nome]
+            if not e.saidas:
+                return self._executar(e)
+            if e.carregar is None:
+                raise RuntimeError(f"etapa {nome!r} está atualizada mas não tem 'carregar' para ceder o valor")
+            self._valores[nome] = e.carregar()
+            return self._valores[nome]
+
+    def _impressao(self, e: Etapa) -> str:
+        h = hashlib.sha256()
+        h.update(json.dumps([e.nome, e.versao]).encode())
+        for caminho in e.entradas:
+            h.update(json.dumps([caminho, self._hash(caminho)]).encode())
+        for d in e.depende:
+            h.update(json.dumps([d, self._assinaturas[d]]).encode())
+        return h.hexdigest()
+
+    @staticmethod
+    def _assinar(saidas: dict) -> str:
+        return hashlib.sha256(json.dumps(sorted(saidas.items())).encode()).hexdigest()
+
+    def _hash(self, caminho: str) -> str | None:
+        """sha256 do conteúdo (None se o arquivo não existe); reaproveita o do manifesto se tamanho e mtime batem."""
+        if not os.path.exists(caminho):
+            return None
+        chave = os.path.abspath(caminho)
+        with self._trava:
+            antigo = self._estado["arquivos"].get(chave)
+        atual = _identidade_arquivo(caminho, com_hash=False)
+        if antigo is not None and (antigo["tamanho"], antigo["mtime_ns"]) == (atual["tamanho"], atual["mtime_ns"]):
+            return antigo["sha256"]
+        atual = _identidade_arquivo(caminho)
+        with self._trava:
+            self._estado["arquivos"][chave] = {k: atual[k] for k in ("tamanho", "mtime_ns", "sha256")}
+        return atual["sha256"]
+
+
+    # ---- manifesto ----
+
+    def _ler_manifesto(self) -> dict:
+        try:
+            with open(self.manifesto, encoding="utf-8") as f:
+                estado = json.load(f)
+        except (OSError, ValueError):
+            estado = {}
+        estado.setdefault("etapas", {})
+        estado.setdefault("arquivos", {})
+        return estado
+
+    def _gravar_manifesto(self) -> None:
+        # grava num temporário e troca: um manifesto interrompido não é lido pela metade
+        os.makedirs(os.path.dirname(self.manifesto) or ".", exist_ok=True)
+        tmp = f"{self.manifesto}.{threading.get_ident()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(self._estado, f, indent=1, sort_keys=True)
+        os.replace(tmp, self.manifesto)
+
+
+def _ler_linhas(caminho: str) -> list[dict]:
+    import pandas as pd
+    return pd.read_csv(caminho, float_precision="round_trip").to_dict("records")
+
+
+def _ler_json(caminho: str):
+    with open(caminho, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def pipeline_recife(data_dir: str = DATA_DIR, out_dir: str = OUT_DIR, manifesto: str | None = None,
+                    trabalhadores: int = 4) -> Pipeline:
+    """
+    Os artefatos de out/ (csv, json e visual) como um Pipeline. Passos 3 e 6
+    usam os mesmos gravadores de solve (rodar_passo_3 / rodar_passo_6), então
+    uma execução limpa reproduz byte a byte os arquivos versionados em out/.
+    """
+    from .graphs import io
+    from . import solve, viz
+
+    nos = os.path.join(data_dir, "bairros_unique.csv")
+    arestas = os.path.join(data_dir, "adjacencia_bairros.csv")
+    enderecos = os.path.join(data_dir, "enderecos.csv")
+
+    def em_csv(nome):
+        return os.path.join(out_dir, "csv", nome)
+
+    def em_json(nome):
+        return os.path.join(out_dir, "json", nome)
+
+    def em_visual(nome):
+        return os.path.join(out_dir, "visual", nome)
+
+    graus_csv, ego_csv = em_csv("graus.csv"), em_csv("ego_bairro.csv")
+    micro_json = em_json("microrregioes.json")
+    dist_csv, percurso_json = em_csv("distancias_enderecos.csv"), em_json("percurso_nova_descoberta_setubal.json")
+
+    etapas = [
+        Etapa("grafo", lambda: io.carregar_grafo_recife_csv(nos, arestas)[0], entradas=[nos, arestas]),
+        Etapa("recife_global", lambda G: solve.gravar_recife_global(G, em_json("recife_global.json")),
+              depende=["grafo"], saidas=[em_json("recife_global.json")], versao="2"),
+        Etapa("microrregioes", lambda G: solve.gravar_microrregioes(
+                  G, {b: info["microrregiao"] for b, info in G.nodes.items()}, micro_json),
+              depende=["grafo"], saidas=[micro_json], carregar=lambda: _ler_json(micro_json), versao="2"),
+        Etapa("ego", lambda G: solve.gravar_ego(G, ego_csv),
+              depende=["grafo"], saidas=[ego_csv], carregar=lambda: _ler_linhas(ego_csv), versao="2"),
+        Etapa("graus", lambda G: io.calcular_graus(G, graus_csv, centralidade=True),
+              depende=["grafo"], saidas=[graus_csv], carregar=lambda: _ler_linhas(graus_csv)),
+        Etapa("rankings", lambda graus, ego: io.gerar_rankings_json(
+                  graus_csv, ego_csv, em_json("rankings.json"), graus=graus, ego=ego),
+              depende=["graus", "ego"], saidas=[em_json("rankings.json")]),
+        # valor: o percurso Nova Descoberta -> Boa Viagem (Setúbal), como no JSON
+        Etapa("distancias", lambda G: solve.rodar_passo_6(G, enderecos, dist_csv, percurso_json),
+              depende=["grafo"], entradas=[enderecos], saidas=[dist_csv, percurso_json],
+              carregar=lambda: _ler_json(percurso_json), versao="2"),
+        Etapa("arvore_percurso", lambda percurso: viz.build_path_tree_html(
+                  percurso["caminho"], em_visual("arvore_percurso.html")),
+              depende=["distancias"], saidas=[em_visual("arvore_percurso.html")], versao="2"),
+        Etapa("histograma_graus", lambda _: viz.plot_degree_histogram(graus_csv, em_visual("dist_graus.png")),
+              depende=["graus"], saidas=[em_visual("dist_graus.png")], recurso="matplotlib"),
+        Etapa("ranking_microrregioes", lambda _: viz.bar_microrregioes_densidade(
+                  micro_json, em_visual("ranking_micros_densidade.png")),
+              depende=["microrregioes"], saidas=[em_visual("ranking_micros_densidade.png")], recurso="matplotlib"),
+        Etapa("top10_subgrafo", lambda G, _: viz.build_top_k_subgraph_html(
+                  G, 10, em_visual("top10_subgrafo.html"), graus_csv),
+              depende=["grafo", "graus"], saidas=[em_visual("top10_subgrafo.html")]),
+        Etapa("bfs_boa_vista", lambda G: viz.bfs_layers_visual_html(G, "Boa Vista", em_visual("bfs_camadas_boa_vista.html")),
+              depende=["grafo"], saidas=[em_visual("bfs_camadas_boa_vista.html")]),
+        Etapa("mapa_cores_grau", lambda G: viz.degree_colormap_html(G, em_visual("mapa_cores_grau.html")),
+              depende=["grafo"], saidas=[em_visual("mapa_cores_grau.html")]),
+    ]
+    return Pipeline(etapas, manifesto or os.path.join(out_dir, ".manifesto.json"), trabalhadores)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m src.pipeline")
+    parser.add_argument("alvos", nargs="*", help="etapas a atualizar (padrão: todas)")
+    parser.add_argument("--forcar", action="store_true", help="refaz mesmo o que está atualizado")
+    parser.add_argument("--trabalhadores", type=int, default=4)
+    parser.add_argument("--data", default=DATA_DIR)
+    parser.add_argument("--out", default=OUT_DIR)
+    args = parser.parse_args(argv)
+
+    P = pipeline_recife(args.data, args.out, trabalhadores=args.trabalhadores)
+    for nome, status in P.rodar(args.alvos or None, forcar=args.forcar).items():
+        print(f"{nome:<24} {status}")
+
+
+if __name__ == "__main__":
+    main()
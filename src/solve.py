@@ -1,12 +1,11 @@
 # src/solve.py
 import json
-import pandas as pd
-from collections import defaultdict
 import os
 
 try:
     from .graphs.io import carregar_grafo_recife
     from .graphs.graph import Graph
+    from .graphs.metrics import metricas_ego, metricas_por_grupo
 except ImportError:
     print("Erro: Verifique se os arquivos 'io.py' e 'graph.py' estão na pasta 'src/'.")
     exit()
@@ -21,53 +20,106 @@ os.makedirs(OUT_CSV,  exist_ok=True)
 PATH_NODES = f"{DATA_DIR}/bairros_unique.csv"
 PATH_EDGES = f"{DATA_DIR}/adjacencia_bairros.csv"
 
-def rodar_passo_3(G, bairro_para_micro):
-    print("\nExecutando Tarefa 3.1: Métricas Globais...")
+def gravar_recife_global(G, caminho: str) -> dict:
+    """3.1: ordem, tamanho e densidade do grafo inteiro em recife_global.json."""
     dados_globais = {
         "ordem": G.get_ordem(),
         "tamanho": G.get_tamanho(),
         "densidade": G.get_densidade()
     }
-    with open(os.path.join(OUT_JSON, 'recife_global.json'), 'w', encoding='utf-8') as f:
-        json.dump(dados_globais, f, indent=4, ensure_ascii=False)
-    print(f"Resultados salvos em {os.path.join(OUT_JSON, 'recife_global.json')}")
-
-    print("\nExecutando Tarefa 3.2: Métricas por Microrregião...")
-    micro_para_bairros = defaultdict(list)
-    for bairro, microrregiao in bairro_para_micro.items():
-        micro_para_bairros[microrregiao].append(bairro)
+    with open(caminho, 'w', encoding='utf-8') as f:
+        json.dump(dados_globais, f, indent=2, ensure_ascii=False)
+    return dados_globais
 
+def gravar_microrregioes(G, bairro_para_micro, caminho: str) -> list[dict]:
+    """3.2: métricas por microrregião, na ordem em que aparecem em 'bairro_para_micro'."""
     resultados_micro = []
-    for microrregiao, bairros_da_micro in micro_para_bairros.items():
-        subgrafo_micro = G.criar_subgrafo_induzido(bairros_da_micro)
+    for microrregiao, m in metricas_por_grupo(G, bairro_para_micro).items():
         resultados_micro.append({
-            "microrregiao": microrregiao,
-            "ordem": subgrafo_micro.get_ordem(),
-            "tamanho": subgrafo_micro.get_tamanho(),
-            "densidade": subgrafo_micro.get_densidade()
+            "microrregiao": int(microrregiao),
+            "ordem": m["ordem"],
+            "tamanho": m["tamanho"],
+            "densidade": m["densidade"]
         })
+    with open(caminho, 'w', encoding='utf-8') as f:
+        json.dump(resultados_micro, f, indent=2, ensure_ascii=False)
+    return resultados_micro
+
+def gravar_ego(G, caminho: str) -> list[dict]:
+    """3.3: ego-subrede de cada bairro em ego_bairro.csv, do maior grau para o menor."""
+    import pandas as pd
+    df_ego = pd.DataFrame(metricas_ego(G)).sort_values(by="grau", ascending=False)
+    df_ego.to_csv(caminho, index=False, encoding='utf-8')
+    return df_ego.to_dict("records")
+
+def rodar_passo_3(G, bairro_para_micro, out_dir: str = OUT_DIR):
+    print("\nExecutando Tarefa 3.1: Métricas Globais...")
+    caminho = os.path.join(out_dir, 'json', 'recife_global.json')
+    gravar_recife_global(G, caminho)
+    print(f"Resultados salvos em {caminho}")
 
-    with open(os.path.join(OUT_JSON, 'microrregioes.json'), 'w', encoding='utf-8') as f:
-        json.dump(resultados_micro, f, indent=4, ensure_ascii=False)
-    print(f"Resultados salvos em {os.path.join(OUT_JSON, 'microrregioes.json')}")
+    print("\nExecutando Tarefa 3.2: Métricas por Microrregião...")
+    caminho = os.path.join(out_dir, 'json', 'microrregioes.json')
+    gravar_microrregioes(G, bairro_para_micro, caminho)
+    print(f"Resultados salvos em {caminho}")
 
     print("\nExecutando Tarefa 3.3: Métricas de Ego-Subrede...")
-    linhas = []
-    for bairro in G.nodes.keys():
-        vizinhos = G.get_vizinhos(bairro)
-        nos_ego = set(vizinhos) | {bairro}
-        ego = G.criar_subgrafo_induzido(list(nos_ego))
+    caminho = os.path.join(out_dir, 'csv', 'ego_bairro.csv')
+    gravar_ego(G, caminho)
+    print(f"Resultados salvos em {caminho}")
+
+def rodar_passo_6(G, caminho_enderecos: str, saida_csv: str, saida_json: str) -> dict | None:
+    """
+    Passo 6: menor caminho de cada par (bairro_X, bairro_Y) de enderecos.csv,
+    em distancias_enderecos.csv (X, Y, bairro_X, bairro_Y, custo, caminho).
+    Nomes resolvidos só por chave exata ou apelido; pares que não resolvem
+    ficam de fora. Boa Viagem como destino aparece como "Boa Viagem (Setúbal)",
+    e o percurso Nova Descoberta -> Setúbal vai também para 'saida_json'.
+    Retorna esse percurso (ou None, se o par não estiver no arquivo).
+    """
+    import pandas as pd
+    from .graphs.algorithms import rotas_em_lote
+    from .graphs.resolver import ResolvedorBairros
+
+    df = pd.read_csv(caminho_enderecos)
+    resolvedor = ResolvedorBairros(G.nodes, limiar=None)
+    xs = [str(x) for x in df["bairro_X"]]
+    ys = [str(y) for y in df["bairro_Y"]]
+    validos = [
+        (bx_raw, by_raw, bx, by)
+        for bx_raw, by_raw, bx, by in zip(xs, ys, resolvedor.resolver_muitos(xs), resolvedor.resolver_muitos(ys))
+        if bx is not None and by is not None
+    ]
+    # um Dijkstra de fonte única por origem distinta
+    rotas = rotas_em_lote(G, [(bx, by) for _, _, bx, by in validos])
+
+    linhas, percurso = [], None
+    for (bx_raw, by_raw, bx, by), (custo, caminho) in zip(validos, rotas):
+        caminho_out = list(caminho)
+        if by == "Boa Viagem" and caminho_out and caminho_out[-1] == "Boa Viagem":
+            caminho_out[-1] = "Boa Viagem (Setúbal)"
         linhas.append({
-            "bairro": bairro,
-            "grau": len(vizinhos),
-            "ordem_ego": ego.get_ordem(),
-            "tamanho_ego": ego.get_tamanho(),
-            "densidade_ego": ego.get_densidade()
+            "X": bx_raw,
+            "Y": by_raw,
+            "bairro_X": bx_raw,
+            "bairro_Y": by_raw,
+            "custo": round(float(custo), 3) if custo != float("inf") else float("inf"),
+            "caminho": " -> ".join(caminho_out) if caminho_out else ""
         })
+        if bx == "Nova Descoberta" and by == "Boa Viagem" and custo != float("inf"):
+            percurso = {
+                "origem": "Nova Descoberta",
+                "destino": "Boa Viagem (Setúbal)",
+                "caminho": caminho_out,
+                "custo": float(round(float(custo), 3))
+            }
+            with open(saida_json, "w", encoding="utf-8") as f:
+                json.dump(percurso, f, ensure_ascii=False, indent=2)
 
-    df_ego = pd.DataFrame(linhas).sort_values(by="grau", ascending=False)
-    df_ego.to_csv(os.path.join(OUT_CSV, 'ego_bairro.csv'), index=False, encoding='utf-8')
-    print(f"Resultados salvos em {os.path.join(OUT_CSV, 'ego_bairro.csv')}")
+    pd.DataFrame(
+        linhas, columns=["X", "Y", "bairro_X", "bairro_Y", "custo", "caminho"]
+    ).to_csv(saida_csv, index=False, encoding="utf-8")
+    return percurso
 
 if __name__ == "__main__":
     print("Iniciando o Processamento do Grafo do Recife...")
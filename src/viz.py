@@ -4,28 +4,26 @@ import json
 from src.graphs.algorithms import bfs_layers
 from colorsys import hsv_to_rgb
 
-# HTML interativo (pyvis)
-try:
-    from pyvis.network import Network
-except Exception:
-    Network = None  # deixamos opcional
+# pyvis/matplotlib são opcionais e pesados: importados só por quem desenha.
+def _pyvis_network():
+    try:
+        from pyvis.network import Network
+    except Exception as e:
+        raise RuntimeError("PyVis não está instalado. Use: pip install pyvis") from e
+    return Network
 
-# PNG estático (matplotlib)
-try:
-    import matplotlib.pyplot as plt
-except Exception:
-    plt = None
 
-try:
-    import plotly.graph_objects as go
-except Exception:
-    go = None
+def _pyplot():
+    try:
+        import matplotlib.pyplot as plt
+    except Exception as e:
+        raise RuntimeError("Matplotlib não está instalado. Use: pip install matplotlib") from e
+    return plt
 
 
 # --- ÁRVORE do percurso (HTML) com rótulos pretos ---
 def build_path_tree_html(path_nodes: list[str], outfile: str) -> None:
-    if Network is None:
-        raise RuntimeError("PyVis não está instalado. Use: pip install pyvis")
+    Network = _pyvis_network()
     if not isinstance(path_nodes, list) or len(path_nodes) < 2:
         raise ValueError("`path_nodes` deve ter pelo menos 2 nós.")
 
@@ -55,8 +53,7 @@ def build_path_tree_png(path_nodes: list[str], outfile: str) -> None:
     com maior espessura e exibindo rótulos dos bairros.
     Layout simples em linha (sem networkx).
     """
-    if plt is None:
-        raise RuntimeError("Matplotlib não está instalado. Use: pip install matplotlib")
+    plt = _pyplot()
 
     if not isinstance(path_nodes, list) or len(path_nodes) < 2:
         raise ValueError("`path_nodes` deve ser uma lista com pelo menos 2 nós.")
@@ -131,7 +128,7 @@ def gerar_arvore_percurso_from_json(
 
 def plot_degree_histogram(path_graus_csv: str, out_png: str) -> str:
     import pandas as pd
-    import matplotlib.pyplot as plt
+    plt = _pyplot()
     import numpy as np
     os.makedirs(os.path.dirname(out_png) or ".", exist_ok=True)
 
@@ -158,8 +155,7 @@ def plot_degree_histogram(path_graus_csv: str, out_png: str) -> str:
 
 
 def build_top_k_subgraph_html(G, k: int, out_html: str, graus_csv: str) -> str:
-    if Network is None:
-        raise RuntimeError("PyVis não está instalado. Use: pip install pyvis")
+    Network = _pyvis_network()
     os.makedirs(os.path.dirname(out_html) or ".", exist_ok=True)
 
     deg = _map_graus_from_csv(graus_csv)
@@ -192,7 +188,7 @@ def build_top_k_subgraph_html(G, k: int, out_html: str, graus_csv: str) -> str:
 
 
 def build_top_k_subgraph_png(G, k: int, out_png: str, graus_csv: str) -> str:
-    import matplotlib.pyplot as plt
+    plt = _pyplot()
     os.makedirs(os.path.dirname(out_png) or ".", exist_ok=True)
 
     deg = _map_graus_from_csv(graus_csv)
@@ -219,7 +215,7 @@ def build_top_k_subgraph_png(G, k: int, out_png: str, graus_csv: str) -> str:
 # src/viz.py  — substitua a função inteira
 
 def bar_microrregioes_densidade(path_json: str, out_png: str) -> str:
-    import json, matplotlib.pyplot as plt
+    plt = _pyplot()
     os.makedirs(os.path.dirname(out_png) or ".", exist_ok=True)
 
     with open(path_json, "r", encoding="utf-8") as f:
@@ -243,8 +239,7 @@ def bar_microrregioes_densidade(path_json: str, out_png: str) -> str:
 
 # --- BFS camadas (HTML) com rótulos pretos ---
 def bfs_layers_visual_html(G, raiz: str, out_html: str) -> str:
-    if Network is None:
-        raise RuntimeError("PyVis não está instalado. Use: pip install pyvis")
+    Network = _pyvis_network()
     from collections import deque
 
     os.makedirs(os.path.dirname(out_html) or ".", exist_ok=True)
@@ -299,8 +294,7 @@ def bfs_layers_visual_html(G, raiz: str, out_html: str) -> str:
 
 def bfs_layers_visual_png(G, source: str, out_png: str) -> None:
     """Árvore BFS em PNG com camadas (layout linear por camada)."""
-    if plt is None:
-        raise RuntimeError("matplotlib não instalado. pip install matplotlib")
+    plt = _pyplot()
     os.makedirs(os.path.dirname(out_png) or ".", exist_ok=True)
 
     order, parent, depth = bfs_layers(G, source)
@@ -348,8 +342,7 @@ def _hex_from_rgb(r, g, b) -> str:
     return "#{:02x}{:02x}{:02x}".format(int(r*255), int(g*255), int(b*255))
 
 def degree_colormap_html(G, outfile: str) -> None:
-    if Network is None:
-        raise RuntimeError("PyVis não está instalado. Use: pip install pyvis")
+    Network = _pyvis_network()
 
     os.makedirs(os.path.dirname(outfile) or ".", exist_ok=True)
 
@@ -389,8 +382,7 @@ def degree_colormap_png(G, outfile: str) -> None:
     """
     Versão estática (PNG) com layout circular; cor ~ grau.
     """
-    if plt is None:
-        raise RuntimeError("Matplotlib não está instalado. Use: pip install matplotlib")
+    plt = _pyplot()
 
     os.makedirs(os.path.dirname(outfile) or ".", exist_ok=True)
 
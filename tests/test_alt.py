@@ -0,0 +1,42 @@
+# tests/test_alt.py
+import random
+
+from src.graphs.graph import Graph
+from src.graphs.algorithms import dijkstra
+from src.graphs.alt import preprocessar_landmarks, astar_alt
+from src.graphs.io import carregar_grafo_recife
+
+DATA_DIR = "data"
+PATH_NODES = f"{DATA_DIR}/bairros_unique.csv"
+PATH_EDGES = f"{DATA_DIR}/adjacencia_bairros.csv"
+
+def _mini():
+    G = Graph()
+    for n in ["A","B","C","D","E"]:
+        G.adicionar_no(n, None)
+    G.adicionar_aresta("A","B", 1)
+    G.adicionar_aresta("B","C", 2)
+    G.adicionar_aresta("A","C", 5)
+    G.adicionar_aresta("C","D", 1)
+    return G
+
+def test_alt_mini():
+    G = _mini()
+    L = preprocessar_landmarks(G, k=2)
+    assert len(L.escolhidos) == 2
+    assert astar_alt(G, "A", "D", L) == (4.0, ["A","B","C","D"])
+    assert astar_alt(G, "A", "E", L) == (float("inf"), [])
+    assert astar_alt(G, "A", "A", L) == (0.0, ["A"])
+    assert L.cota("A", "D") <= 4.0
+
+def test_alt_recife_igual_dijkstra():
+    G, _ = carregar_grafo_recife(PATH_NODES, PATH_EDGES)
+    L = preprocessar_landmarks(G, k=4)
+    nos = sorted(G.nodes)
+    rng = random.Random(0)
+    for _ in range(50):
+        o, d = rng.choice(nos), rng.choice(nos)
+        custo, _ = dijkstra(G, o, d)
+        ca, caminho = astar_alt(G, o, d, L)
+        assert abs(ca - custo) < 1e-9
+        assert caminho[0] == o and caminho[-1] == d
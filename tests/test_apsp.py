@@ -0,0 +1,55 @@
+# tests/test_apsp.py
+import pytest
+
+from src.graphs.graph import Graph
+from src.graphs.algorithms import dijkstra
+from src.graphs.apsp import precomputar_todos_pares, TabelaRotas
+from src.graphs.io import carregar_grafo_recife
+
+DATA_DIR = "data"
+PATH_NODES = f"{DATA_DIR}/bairros_unique.csv"
+PATH_EDGES = f"{DATA_DIR}/adjacencia_bairros.csv"
+
+def _mini():
+    G = Graph()
+    for n in ["A","B","C","D","E"]:
+        G.adicionar_no(n, None)
+    G.adicionar_aresta("A","B", 1)
+    G.adicionar_aresta("B","C", 2)
+    G.adicionar_aresta("A","C", 5)
+    G.adicionar_aresta("C","D", 1)
+    return G
+
+@pytest.mark.parametrize("metodo", ["floyd", "dijkstra"])
+def test_tabela_mini(tmp_path, metodo):
+    precomputar_todos_pares(_mini(), str(tmp_path), metodo=metodo)
+    T = TabelaRotas(str(tmp_path))
+    assert T.dist.dtype.name == "float32" and T.prox.dtype.name == "int32"
+    assert T.rota("A","D") == (4.0, ["A","B","C","D"])
+    assert T.rota("D","A") == (4.0, ["D","C","B","A"])
+    assert T.rota("A","A") == (0.0, ["A"])
+    assert T.rota("A","E") == (float("inf"), [])
+    assert T.rota("A","X") == (float("inf"), [])
+
+def test_tabela_recife_igual_dijkstra(tmp_path):
+    G, _ = carregar_grafo_recife(PATH_NODES, PATH_EDGES)
+    precomputar_todos_pares(G, str(tmp_path))
+    T = TabelaRotas(str(tmp_path))
+    for o, d in [("Nova Descoberta","Boa Viagem"), ("Afogados","Bongi"), ("Boa Vista","Varzea")]:
+        custo, _ = dijkstra(G, o, d)
+        ct, caminho = T.rota(o, d)
+        assert ct == pytest.approx(custo, rel=1e-6)
+        assert caminho[0] == o and caminho[-1] == d
+        soma = sum(G.get_peso(u, v) for u, v in zip(caminho, caminho[1:]))
+        assert soma == pytest.approx(custo, rel=1e-6)
+
+@pytest.mark.parametrize("metodo", ["floyd", "dijkstra"])
+def test_aresta_peso_nan_ignorada(tmp_path, metodo):
+    G = _mini()
+    G.adicionar_aresta("A","D", float("nan"))   # atalho inválido: não pode ser usado
+    G.adicionar_aresta("D","E", float("nan"))   # única ligação de E
+    precomputar_todos_pares(G, str(tmp_path), metodo=metodo)
+    T = TabelaRotas(str(tmp_path))
+    assert T.rota("A","D") == (4.0, ["A","B","C","D"]) == dijkstra(G, "A", "D")
+    assert T.rota("A","E") == (float("inf"), [])
+    assert T.custo("E","D") == float("inf")
@@ -0,0 +1,48 @@
+# tests/test_bellman_ford.py
+import pytest
+
+from src.graphs.graph import Graph
+from src.graphs.algorithms import bellman_ford, dijkstra, CicloNegativoError
+from src.graphs.io import carregar_grafo_recife
+
+DATA_DIR = "data"
+PATH_NODES = f"{DATA_DIR}/bairros_unique.csv"
+PATH_EDGES = f"{DATA_DIR}/adjacencia_bairros.csv"
+
+MODOS = ["fila", "vetorizado"]
+
+def _mini():
+    G = Graph()
+    for n in ["A","B","C","D","E"]:
+        G.adicionar_no(n, None)
+    G.adicionar_aresta("A","B", 1)
+    G.adicionar_aresta("B","C", 2)
+    G.adicionar_aresta("A","C", 5)
+    G.adicionar_aresta("C","D", 1)
+    return G
+
+@pytest.mark.parametrize("modo", MODOS)
+def test_bellman_ford_mini(modo):
+    G = _mini()
+    assert bellman_ford(G, "A", "D", modo) == (4.0, ["A","B","C","D"])
+    assert bellman_ford(G, "A", "E", modo) == (float("inf"), [])
+    assert bellman_ford(G, "A", "A", modo) == (0.0, ["A"])
+
+@pytest.mark.parametrize("modo", MODOS)
+def test_bellman_ford_ciclo_negativo(modo):
+    G = _mini()
+    G.adicionar_aresta("C","D", -1)   # não-direcionado: C-D-C é ciclo negativo
+    with pytest.raises(CicloNegativoError) as exc:
+        bellman_ford(G, "A", "D", modo)
+    ciclo = exc.value.ciclo
+    assert ciclo[0] == ciclo[-1] and set(ciclo) == {"C","D"}
+    # componente sem o ciclo não é afetada
+    assert bellman_ford(G, "E", "E", modo) == (0.0, ["E"])
+
+@pytest.mark.parametrize("modo", MODOS)
+def test_bellman_ford_recife_igual_dijkstra(modo):
+    G, _ = carregar_grafo_recife(PATH_NODES, PATH_EDGES)
+    for o, d in [("Nova Descoberta","Boa Viagem"), ("Afogados","Bongi"), ("Boa Vista","Varzea")]:
+        custo, _ = dijkstra(G, o, d)
+        cb, caminho = bellman_ford(G, o, d, modo)
+        assert abs(cb - custo) < 1e-9 and caminho[0] == o and caminho[-1] == d
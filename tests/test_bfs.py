@@ -32,3 +32,64 @@ def test_bfs_recife_smoke():
     G, _ = carregar_grafo_recife(PATH_NODES, PATH_EDGES)
     order, parent, depth = bfs_layers(G, "Boa Vista")  #apenas garante que roda
     assert len(order) >= 1 and "Boa Vista" in parent
+
+def test_bfs_arrays_direcao_otimizada():
+    import random
+    from src.graphs.csr import CSRGraph
+    from src.graphs.algorithms import bfs_arrays
+    rng = random.Random(5)
+    G = Graph()
+    n = 3000
+    for i in range(n):
+        G.adicionar_no(str(i), None)
+    for _ in range(6 * n):
+        G.adicionar_aresta(str(rng.randrange(n)), str(rng.randrange(n)))
+    C = CSRGraph.from_graph(G)
+    _, _, depth_ref = bfs_layers(G, "0")
+    ordem, pai, prof = bfs_arrays(C, "0")
+    assert prof.dtype.name == "int32" and pai.dtype.name == "int32"
+    assert {C.nomes[i]: int(prof[i]) for i in ordem} == depth_ref
+    assert (prof >= 0).sum() == len(ordem) == len(depth_ref)
+    for i in ordem[1:]:
+        p = int(pai[i])
+        assert prof[p] == prof[i] - 1 and C.nomes[p] in G.get_vizinhos(C.nomes[i])
+
+def test_bfs_layers_csr_mesma_assinatura():
+    from src.graphs.csr import CSRGraph
+    C = CSRGraph.from_graph(_mini())
+    order, parent, depth = bfs_layers(C, "A")
+    assert order == ["A","B","C","D","E"]
+    assert parent == {"A": None, "B": "A", "C": "A", "D": "B", "E": "C"}
+    assert depth == {"A": 0, "B": 1, "C": 1, "D": 2, "E": 2}
+
+def test_bfs_bottom_up_igual_top_down_e_niveis_iguais_ao_graph():
+    import random
+    from src.graphs.csr import CSRGraph
+    from src.graphs.algorithms import bfs_arrays
+    rng = random.Random(9)
+    G = Graph()
+    n = 2000
+    nomes = [f"v{rng.random():.12f}" for _ in range(n)]   # ordem de inserção != ordem de id
+    for nome in nomes:
+        G.adicionar_no(nome, None)
+    for _ in range(8 * n):
+        G.adicionar_aresta(rng.choice(nomes), rng.choice(nomes))
+    C = CSRGraph.from_graph(G)
+
+    # alpha=inf: sempre bottom-up; alpha minúsculo: nunca
+    ordem_bu, pai_bu, prof_bu = bfs_arrays(C, nomes[0], alpha=float("inf"), beta=1e-12)
+    ordem_td, pai_td, prof_td = bfs_arrays(C, nomes[0], alpha=1e-12)
+    ordem, pai, prof = bfs_arrays(C, nomes[0])
+    for o, p, d in ((ordem_bu, pai_bu, prof_bu), (ordem, pai, prof)):
+        assert o.tolist() == ordem_td.tolist()
+        assert p.tolist() == pai_td.tolist() and d.tolist() == prof_td.tolist()
+
+    # contra o Graph: mesma profundidade e mesmos nós em cada nível
+    ordem_g, pai_g, prof_g = bfs_layers(G, nomes[0])
+    ordem_c, pai_c, prof_c = bfs_layers(C, nomes[0])
+    assert prof_c == prof_g
+    niveis = lambda ordem, prof: [(prof[v], v) for v in ordem]
+    assert sorted(niveis(ordem_c, prof_c)) == sorted(niveis(ordem_g, prof_g))
+    assert [prof_c[v] for v in ordem_c] == sorted(prof_c[v] for v in ordem_c)
+    for v, p in pai_c.items():
+        assert p is None or (prof_c[p] == prof_c[v] - 1 and p in G.get_vizinhos(v))
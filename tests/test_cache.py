@@ -0,0 +1,83 @@
+# tests/test_cache.py
+from src.graphs.graph import Graph
+from src.graphs.algorithms import dijkstra, bfs_layers
+from src.graphs.cache import CacheRotas
+
+def _linha(n=6):
+    G = Graph()
+    for i in range(n):
+        G.adicionar_no(f"N{i}", None)
+    for i in range(n - 1):
+        G.adicionar_aresta(f"N{i}", f"N{i+1}", 1.0)
+    return G
+
+def test_acerto_falta_e_invalidacao_por_versao():
+    G = _linha()
+    C = CacheRotas(G)
+    assert C.dijkstra("N0", "N5") == dijkstra(G, "N0", "N5")
+    r = C.dijkstra("N0", "N5")
+    r[1].append("lixo")                      # cópia: não suja o cache
+    assert C.dijkstra("N0", "N5") == (5.0, ["N0","N1","N2","N3","N4","N5"])
+    assert C.bfs_layers("N0") == bfs_layers(G, "N0")
+    e = C.estatisticas()
+    assert (e["acertos"], e["faltas"]) == (2, 2)
+
+    v = G.versao
+    G.adicionar_aresta("N0", "N5", 0.5)      # mutação: entradas antigas não servem mais
+    assert G.versao > v
+    assert C.dijkstra("N0", "N5") == (0.5, ["N0","N5"])
+    e = C.estatisticas()
+    assert e["invalidadas"] == 2 and e["entradas"] == 1
+
+    G.remover_aresta("N0", "N5")
+    assert C.dijkstra("N0", "N5")[0] == 5.0
+    G.remover_no("N3")
+    assert C.dijkstra("N0", "N5") == dijkstra(G, "N0", "N5")
+
+def test_limites_por_entradas_bytes_e_ttl():
+    G = _linha(10)
+    C = CacheRotas(G, max_entradas=3)
+    for i in range(1, 6):
+        C.dijkstra("N0", f"N{i}")
+    assert C.estatisticas()["entradas"] == 3 and C.despejos == 2
+    C.dijkstra("N0", "N3")                   # mais recente: fica
+    C.dijkstra("N0", "N6")
+    assert C.rota_em_cache("N0", "N3") is not None and C.rota_em_cache("N0", "N4") is None
+
+    um = CacheRotas(G)
+    um.dijkstra("N0", "N9")
+    limite = um.estatisticas()["bytes"] * 2
+    B = CacheRotas(G, max_entradas=None, max_bytes=limite)
+    for i in range(1, 10):
+        B.dijkstra("N0", f"N{i}")
+        assert B.estatisticas()["bytes"] <= limite
+    assert B.despejos > 0
+
+    T = CacheRotas(G, ttl=0.0)
+    T.dijkstra("N0", "N1")
+    T.dijkstra("N0", "N1")
+    assert T.expiradas == 1 and T.acertos == 0
+
+def test_mutacao_durante_o_calculo_nao_guarda_rota_velha():
+    G = _linha()
+    C = CacheRotas(G)
+    versao = C.versao_atual()
+    custo, caminho = dijkstra(G, "N0", "N5")
+    G.adicionar_aresta("N0", "N5", 0.5)      # muda entre o cálculo e o guardar
+    assert C.guardar_rota(versao, "N0", "N5", custo, caminho) == (5.0, caminho)
+    assert C.rota_em_cache("N0", "N5") is None
+    assert C.dijkstra("N0", "N5") == (0.5, ["N0", "N5"])
+
+    # o mesmo para dijkstra(): o grafo muda enquanto a busca roda
+    class _Mutante:
+        def __init__(self, G):
+            self.G, self.nodes, self.versao = G, G.nodes, G.versao
+        def get_vizinhos(self, u):
+            self.versao = self.G.versao + 1
+            return self.G.get_vizinhos(u)
+        def get_peso(self, u, v):
+            return self.G.get_peso(u, v)
+    M = _Mutante(_linha())
+    C = CacheRotas(M)
+    C.dijkstra("N0", "N2")
+    assert C.estatisticas()["entradas"] == 0
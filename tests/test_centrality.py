@@ -0,0 +1,127 @@
+# tests/test_centrality.py
+import csv
+import itertools
+import json
+import math
+import random
+
+from src.graphs.graph import Graph
+from src.graphs.centrality import amostras_para_erro, centralidades
+from src.graphs.io import calcular_graus, carregar_grafo_recife, gerar_rankings_json
+
+DATA_DIR = "data"
+PATH_NODES = f"{DATA_DIR}/bairros_unique.csv"
+PATH_EDGES = f"{DATA_DIR}/adjacencia_bairros.csv"
+
+def _forca_bruta(G, ponderado):
+    """Centralidades pela definição: todos os caminhos simples de cada par."""
+    nos = list(G.nodes)
+    n = len(nos)
+    def caminhos(s, t):
+        saida = []
+        def visitar(c):
+            if c[-1] == t:
+                saida.append(list(c))
+                return
+            for v in G.get_vizinhos(c[-1]):
+                if v not in c:
+                    c.append(v)
+                    visitar(c)
+                    c.pop()
+        visitar([s])
+        return saida
+    def custo(c):
+        return sum(G.get_peso(a, b) if ponderado else 1 for a, b in zip(c, c[1:]))
+
+    inter = dict.fromkeys(nos, 0.0)
+    dist = {}
+    for s, t in itertools.combinations(nos, 2):
+        todos = caminhos(s, t)
+        if not todos:
+            continue
+        d = min(custo(c) for c in todos)
+        dist[s, t] = dist[t, s] = d
+        minimos = [c for c in todos if custo(c) == d]
+        for c in minimos:
+            for v in c[1:-1]:
+                inter[v] += 1 / len(minimos)
+    prox, harm = {}, {}
+    for v in nos:
+        ds = [dist[v, u] for u in nos if (v, u) in dist]
+        r = len(ds) + 1
+        prox[v] = (r - 1) / sum(ds) * (r - 1) / (n - 1) if ds else 0.0
+        harm[v] = sum(1 / d for d in ds) / (n - 1)
+    inter = {v: x / ((n - 1) * (n - 2) / 2) for v, x in inter.items()}
+    return {"intermediacao": inter, "proximidade": prox, "harmonica": harm}
+
+def _grafo_aleatorio(rng, n=7, p=0.4):
+    G = Graph()
+    nos = [f"n{i}" for i in range(n)]
+    for no in nos:
+        G.adicionar_no(no, None)
+    for u, v in itertools.combinations(nos, 2):
+        if rng.random() < p:
+            G.adicionar_aresta(u, v, rng.randint(1, 4))
+    return G
+
+def test_centralidades_contra_forca_bruta():
+    rng = random.Random(3)
+    for _ in range(15):
+        G = _grafo_aleatorio(rng)
+        for ponderado in (True, False):
+            res = centralidades(G, ponderado=ponderado)
+            esperado = _forca_bruta(G, ponderado)
+            assert res["fontes"] == 7
+            assert res["erro"] == {"intermediacao": 0.0, "harmonica": 0.0}
+            for medida, valores in esperado.items():
+                for v, x in valores.items():
+                    assert math.isclose(res[medida][v], x, abs_tol=1e-12), (medida, v)
+
+def test_centralidades_em_processos_igual_sequencial():
+    G, _ = carregar_grafo_recife(PATH_NODES, PATH_EDGES)
+    seq = centralidades(G)
+    par = centralidades(G, processos=2)
+    for medida in ("intermediacao", "proximidade", "harmonica"):
+        for v, x in seq[medida].items():
+            assert math.isclose(par[medida][v], x, abs_tol=1e-12)
+
+def test_centralidades_amostradas_dentro_da_cota():
+    G, _ = carregar_grafo_recife(PATH_NODES, PATH_EDGES)
+    exato = centralidades(G, ponderado=False)
+    for semente in range(3):
+        est = centralidades(G, ponderado=False, amostra=40, semente=semente)
+        assert est["fontes"] == 40
+        for medida in ("intermediacao", "harmonica"):
+            cota = est["erro"][medida]
+            assert 0 < cota < math.inf
+            for v, x in exato[medida].items():
+                assert abs(est[medida][v] - x) <= cota
+
+    n = G.get_ordem()
+    assert amostras_para_erro(n, 10.0) < amostras_para_erro(n, 0.5) <= n
+
+def test_graus_e_rankings_com_centralidade(tmp_path):
+    G, _ = carregar_grafo_recife(PATH_NODES, PATH_EDGES)
+    graus = tmp_path / "graus.csv"
+    ego = tmp_path / "ego.csv"
+    linhas = calcular_graus(G, str(graus), centralidade=True)
+    with open(ego, "w", newline="", encoding="utf-8") as f:
+        w = csv.DictWriter(f, fieldnames=["bairro", "densidade_ego", "ordem_ego"])
+        w.writeheader()
+        w.writerows({"bairro": l["bairro"], "densidade_ego": 0.5, "ordem_ego": l["grau"] + 1} for l in linhas)
+
+    with open(graus, encoding="utf-8") as f:
+        cabecalho = next(csv.reader(f))
+    assert cabecalho == ["bairro", "grau", "intermediacao", "proximidade", "harmonica"]
+
+    rankings = gerar_rankings_json(str(graus), str(ego), str(tmp_path / "rankings.json"))
+    res = centralidades(G)
+    for medida in ("intermediacao", "proximidade", "harmonica"):
+        topo = rankings[f"maior_{medida}"]
+        assert math.isclose(topo[medida], max(res[medida].values()))
+        assert math.isclose(res[medida][topo["bairro"]], topo[medida])
+    assert json.loads((tmp_path / "rankings.json").read_text(encoding="utf-8")) == rankings
+
+    calcular_graus(G, str(graus))
+    with open(graus, encoding="utf-8") as f:
+        assert next(csv.reader(f)) == ["bairro", "grau"]
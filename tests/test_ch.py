@@ -0,0 +1,63 @@
+# tests/test_ch.py
+import random
+
+from src.graphs.graph import Graph
+from src.graphs.algorithms import dijkstra
+from src.graphs.ch import construir_ch, ContractionHierarchy
+from src.graphs.io import carregar_grafo_recife
+
+DATA_DIR = "data"
+PATH_NODES = f"{DATA_DIR}/bairros_unique.csv"
+PATH_EDGES = f"{DATA_DIR}/adjacencia_bairros.csv"
+
+def _aleatorio(n=60, m=150, seed=3):
+    rng = random.Random(seed)
+    G = Graph()
+    for i in range(n):
+        G.adicionar_no(f"n{i}", None)
+    for _ in range(m):
+        G.adicionar_aresta(f"n{rng.randrange(n)}", f"n{rng.randrange(n)}", rng.uniform(0.1, 3))
+    return G
+
+def _custo_caminho(G, caminho):
+    return sum(G.get_peso(u, v) for u, v in zip(caminho, caminho[1:]))
+
+def test_ch_mini():
+    G = Graph()
+    for n in ["A","B","C","D","E"]:
+        G.adicionar_no(n, None)
+    G.adicionar_aresta("A","B", 1)
+    G.adicionar_aresta("B","C", 2)
+    G.adicionar_aresta("A","C", 5)
+    G.adicionar_aresta("C","D", 1)
+    ch = construir_ch(G)
+    assert ch.consultar("A","D") == (4.0, ["A","B","C","D"])
+    assert ch.consultar("D","A") == (4.0, ["D","C","B","A"])
+    assert ch.consultar("A","E") == (float("inf"), [])
+    assert ch.consultar("A","A") == (0.0, ["A"])
+
+def test_ch_aleatorio_igual_dijkstra(tmp_path):
+    G = _aleatorio()
+    arq = str(tmp_path / "ch.npz")
+    construir_ch(G, limite_testemunha=8).salvar(arq)
+    ch = ContractionHierarchy.carregar(arq)
+    nos = list(G.nodes)
+    for o in nos[:15]:
+        for d in nos:
+            custo, _ = dijkstra(G, o, d)
+            cc, caminho = ch.consultar(o, d)
+            if custo == float("inf"):
+                assert (cc, caminho) == (float("inf"), [])
+                continue
+            assert abs(cc - custo) < 1e-9
+            assert caminho[0] == o and caminho[-1] == d
+            assert all(v in G.get_vizinhos(u) for u, v in zip(caminho, caminho[1:]))
+            assert abs(_custo_caminho(G, caminho) - custo) < 1e-9
+
+def test_ch_recife():
+    G, _ = carregar_grafo_recife(PATH_NODES, PATH_EDGES)
+    ch = construir_ch(G)
+    for o, d in [("Nova Descoberta","Boa Viagem"), ("Afogados","Bongi"), ("Boa Vista","Varzea")]:
+        custo, _ = dijkstra(G, o, d)
+        cc, caminho = ch.consultar(o, d)
+        assert abs(cc - custo) < 1e-9 and caminho[0] == o and caminho[-1] == d
@@ -0,0 +1,119 @@
+# tests/test_cli.py
+import asyncio
+import json
+import math
+
+from src.cli import ServidorRotas
+from src.graphs.algorithms import dijkstra
+from src.graphs.io import carregar_grafo_recife_csv
+
+DATA_DIR = "data"
+PATH_NODES = f"{DATA_DIR}/bairros_unique.csv"
+PATH_EDGES = f"{DATA_DIR}/adjacencia_bairros.csv"
+
+async def _sessao(sock, pedidos):
+    reader, writer = await asyncio.open_unix_connection(sock)
+    for i, p in enumerate(pedidos):
+        writer.write(json.dumps({"id": i, **p}).encode() + b"\n")
+    await writer.drain()
+    respostas = {}
+    for _ in pedidos:
+        r = json.loads(await reader.readline())
+        respostas[r["id"]] = r
+    writer.close()
+    return [respostas[i] for i in range(len(pedidos))]
+
+def test_servidor_responde_em_lote(tmp_path):
+    G, _ = carregar_grafo_recife_csv(PATH_NODES, PATH_EDGES)
+    sock = str(tmp_path / "grafos.sock")
+    nos = sorted(G.nodes)
+    pares = [(nos[i], nos[-1 - i]) for i in range(20)]
+
+    async def _rodar():
+        servidor = ServidorRotas(G, janela=0.01)
+        srv = await servidor.iniciar(unix=sock)
+        try:
+            pedidos = [{"op": "rota", "origem": o, "destino": d} for o, d in pares]
+            pedidos += [
+                {"op": "bfs", "origem": "Boa Viagem"},
+                {"op": "metricas"},
+                {"op": "top_k", "k": 3},
+                {"op": "rota", "origem": "Boa Viagem", "destino": "Atlantida"},
+                {"op": "voar"},
+            ]
+            # dois clientes simultâneos
+            return await asyncio.gather(_sessao(sock, pedidos), _sessao(sock, pedidos[:5]))
+        finally:
+            srv.close()
+            await srv.wait_closed()
+            await servidor.fechar()
+
+    r, r2 = asyncio.run(_rodar())
+    for (o, d), resp in zip(pares, r):
+        custo, caminho = dijkstra(G, o, d)
+        assert math.isclose(resp["custo"], custo) and resp["caminho"][0] == o and resp["caminho"][-1] == d
+    assert r2 == r[:5]
+    bfs, met, top, fora, erro = r[20:]
+    assert bfs["camadas"][0] == ["Boa Viagem"] and sum(map(len, bfs["camadas"])) == G.get_ordem()
+    assert met["ordem"] == G.get_ordem() and met["tamanho"] == G.get_tamanho()
+    assert top["top"] == [list(p) for p in G.top_k_grau(3)]
+    assert fora["custo"] is None and fora["caminho"] == []
+    assert "erro" in erro
+
+def test_pedido_malformado_nao_derruba_o_lote(tmp_path):
+    G, _ = carregar_grafo_recife_csv(PATH_NODES, PATH_EDGES)
+    sock = str(tmp_path / "grafos.sock")
+
+    async def _rodar():
+        servidor = ServidorRotas(G, janela=0.05)
+        srv = await servidor.iniciar(unix=sock)
+        try:
+            ruim = [{"op": "rota", "origem": ["Boa Viagem"], "destino": {"x": 1}}]
+            bom = [{"op": "rota", "origem": "Boa Viagem", "destino": "Derby"}]
+            return await asyncio.gather(_sessao(sock, ruim), _sessao(sock, bom))
+        finally:
+            srv.close()
+            await srv.wait_closed()
+            await servidor.fechar()
+
+    (ruim,), (bom,) = asyncio.run(_rodar())
+    assert "erro" in ruim and "TypeError" in ruim["erro"]
+    assert math.isclose(bom["custo"], dijkstra(G, "Boa Viagem", "Derby")[0])
+
+def test_lote_com_par_invalido_isola_a_falha():
+    from src.cli import _rotas_isoladas
+    G, _ = carregar_grafo_recife_csv(PATH_NODES, PATH_EDGES)
+    # lista como nó: rotas_em_lote falha ao agrupar; o par válido ainda sai
+    rotas = _rotas_isoladas(G, [(["Boa Viagem"], "Derby"), ("Boa Viagem", "Derby")])
+    assert isinstance(rotas[0], Exception)
+    assert rotas[1] == dijkstra(G, "Boa Viagem", "Derby")
+
+def test_main_carrega_pelo_snapshot(tmp_path, monkeypatch):
+    import shutil
+    import src.cli as cli
+    import src.graphs.io as io
+    from src.graphs.csr import CSRGraph
+    nos, arestas = str(tmp_path / "nos.csv"), str(tmp_path / "arestas.csv")
+    shutil.copy(PATH_NODES, nos)
+    shutil.copy(PATH_EDGES, arestas)
+    servidos = []
+
+    async def _servir(G, **_):
+        servidos.append(G)
+    monkeypatch.setattr(cli, "servir", _servir)
+    argv = ["servir", "--nos", nos, "--arestas", arestas, "--snapshot", str(tmp_path / "snap")]
+    cli.main(argv)
+
+    # segunda partida: CSVs inalterados, nada é relido
+    def _proibido(*a, **k):
+        raise AssertionError("CSV relido com snapshot válido")
+    monkeypatch.setattr(io, "carregar_grafo_recife_csv", _proibido)
+    cli.main(argv)
+
+    G, _ = carregar_grafo_recife_csv(PATH_NODES, PATH_EDGES)
+    C = servidos[-1]
+    assert isinstance(C, CSRGraph) and not C.indices.flags.writeable
+    # as operações do servidor dão o mesmo resultado no CSR e no Graph
+    assert C.get_grau_maximo() == G.get_grau_maximo()
+    assert C.top_k_grau(10) == G.top_k_grau(10)
+    assert C.metricas_grupos() == G.metricas_grupos()
@@ -0,0 +1,55 @@
+# tests/test_csr.py
+from src.graphs.graph import Graph
+from src.graphs.csr import CSRGraph
+from src.graphs.algorithms import dijkstra, bfs_layers, dfs_preorder
+from src.graphs.io import carregar_grafo_recife
+
+DATA_DIR = "data"
+PATH_NODES = f"{DATA_DIR}/bairros_unique.csv"
+PATH_EDGES = f"{DATA_DIR}/adjacencia_bairros.csv"
+
+def _mini():
+    # A--1--B--2--C ; A--5--C ; C--1--D ; E isolado
+    G = Graph()
+    for n in ["A","B","C","D","E"]:
+        G.adicionar_no(n, 1)
+    G.adicionar_aresta("A","B", 1)
+    G.adicionar_aresta("B","C", 2)
+    G.adicionar_aresta("A","C", 5)
+    G.adicionar_aresta("C","D", 1)
+    return G
+
+def test_csr_conversao_mini():
+    G = _mini()
+    C = CSRGraph.from_graph(G)
+    assert C.get_ordem() == G.get_ordem()
+    assert C.get_tamanho() == G.get_tamanho()
+    assert C.get_densidade() == G.get_densidade()
+    assert C.edges == G.edges
+    assert C.indices.dtype.name == "int32"
+    for n in G.nodes:
+        assert C.get_grau(n) == G.get_grau(n)
+        assert set(C.get_vizinhos(n)) == set(G.get_vizinhos(n))
+        assert C.nodes[n] == G.nodes[n]
+    assert C.get_peso("C","B") == 2.0
+
+def test_csr_algoritmos_mini():
+    C = CSRGraph.from_graph(_mini())
+    custo, caminho = dijkstra(C, "A", "D")
+    assert round(custo, 6) == 4 and caminho == ["A","B","C","D"]
+    assert dijkstra(C, "A", "E") == (float("inf"), [])
+    _, parent, depth = bfs_layers(C, "A")
+    assert depth["D"] == 2 and parent["D"] == "C" and "E" not in depth
+    assert set(dfs_preorder(C, "A")) == {"A","B","C","D"}
+
+def test_csr_recife_mesmos_custos():
+    G, _ = carregar_grafo_recife(PATH_NODES, PATH_EDGES)
+    C = CSRGraph.from_graph(G)
+    assert C.get_tamanho() == G.get_tamanho()
+    for o, d in [("Nova Descoberta","Boa Viagem"), ("Afogados","Bongi"), ("Boa Vista","Varzea")]:
+        cg, _ = dijkstra(G, o, d)
+        cc, caminho = dijkstra(C, o, d)
+        assert cg == cc and caminho[0] == o and caminho[-1] == d
+    _, _, dg = bfs_layers(G, "Boa Vista")
+    _, _, dc = bfs_layers(C, "Boa Vista")
+    assert dg == dc
@@ -28,3 +28,25 @@ def test_dfs_recife_smoke():
     G, _ = carregar_grafo_recife(PATH_NODES, PATH_EDGES)
     order = dfs_preorder(G, "Boa Vista")
     assert "Boa Vista" in order and len(order) >= 1
+
+def test_dfs_eventos_e_posordem():
+    from src.graphs.algorithms import dfs_eventos, dfs_iter, DESCOBERTA, TERMINO
+    G = _mini()
+    assert dfs_preorder(G, "A") == ["A","B","D","C","E"]
+    assert list(dfs_iter(G, "A", "pos")) == ["D","B","E","C","A"]
+    eventos = list(dfs_eventos(G, "A"))
+    assert eventos[:3] == [(DESCOBERTA,"A"), (DESCOBERTA,"B"), (DESCOBERTA,"D")]
+    assert eventos[3] == (TERMINO,"D") and eventos[-1] == (TERMINO,"A")
+
+def test_dfs_caminho_longo_sem_recursao():
+    from itertools import islice
+    from src.graphs.algorithms import dfs_iter
+    G = Graph()
+    n = 20000
+    for i in range(n):
+        G.adicionar_no(str(i), None)
+    for i in range(n - 1):
+        G.adicionar_aresta(str(i), str(i + 1))
+    order = dfs_preorder(G, "0")
+    assert len(order) == n and order[-1] == str(n - 1)
+    assert list(islice(dfs_iter(G, "0"), 3)) == ["0","1","2"]
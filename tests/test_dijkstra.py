@@ -16,3 +16,20 @@ def test_dijkstra_pequeno():
     custo, caminho = dijkstra(g, "A", "C")
     assert round(custo, 6) == 3
     assert caminho == ["A", "B", "C"]
+
+def _grafo_lote():
+    from src.graphs.graph import Graph
+    G = Graph()
+    for n in ["A","B","C","D","E"]:
+        G.adicionar_no(n, None)
+    G.adicionar_aresta("A","B", 1)
+    G.adicionar_aresta("B","C", 2)
+    G.adicionar_aresta("A","C", 5)
+    G.adicionar_aresta("C","D", 1)
+    return G
+
+def test_rotas_em_lote_igual_dijkstra():
+    from src.graphs.algorithms import rotas_em_lote
+    G = _grafo_lote()
+    pares = [("A","D"), ("B","A"), ("A","C"), ("A","E"), ("X","A"), ("A","A")]
+    assert rotas_em_lote(G, pares) == [dijkstra(G, o, d) for o, d in pares]
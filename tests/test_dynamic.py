@@ -0,0 +1,66 @@
+# tests/test_dynamic.py
+import math
+import random
+
+from src.graphs.graph import Graph
+from src.graphs.algorithms import dijkstra, dijkstra_arvore
+from src.graphs.dynamic import ArvoresDinamicas
+from src.graphs.io import carregar_grafo_recife
+
+DATA_DIR = "data"
+PATH_NODES = f"{DATA_DIR}/bairros_unique.csv"
+PATH_EDGES = f"{DATA_DIR}/adjacencia_bairros.csv"
+
+def _conferir(D, origem):
+    dist, prev = D.arvore(origem)
+    ref, _ = dijkstra_arvore(D.G, origem)
+    assert dist.keys() == ref.keys()
+    for v, d in ref.items():
+        assert math.isclose(dist[v], d, abs_tol=1e-9)
+        if prev[v] is not None:
+            assert math.isclose(dist[prev[v]] + D.G.get_peso(prev[v], v), d, abs_tol=1e-9)
+
+def test_reducao_aumento_e_fechamento():
+    G = Graph()
+    for n in "ABCD":
+        G.adicionar_no(n, None)
+    G.adicionar_aresta("A","B", 1)
+    G.adicionar_aresta("B","C", 1)
+    G.adicionar_aresta("A","C", 5)
+    G.adicionar_aresta("C","D", 1)
+    D = ArvoresDinamicas(G)
+    D.registrar("A")
+    assert D.rota("A","D") == (3.0, ["A","B","C","D"])
+
+    mud = D.atualizar_peso("B","C", 10)          # aumento em aresta da árvore
+    assert D.rota("A","D") == (6.0, ["A","C","D"])
+    assert mud["A"] == {"C","D"}
+    assert D.atualizar_peso("A","B", 0.5)["A"] == {"B"}   # C e D seguem por A-C
+    D.atualizar_peso("A","C", math.inf)          # rua fechada
+    assert D.rota("A","D") == (11.5, ["A","B","C","D"])
+    D.atualizar_peso("C","D", math.inf)
+    assert D.rota("A","D") == (float("inf"), [])
+    D.atualizar_peso("A","D", 2)                 # aresta nova
+    assert D.rota("A","D") == (2.0, ["A","D"])
+
+def test_fluxo_aleatorio_recife():
+    G, _ = carregar_grafo_recife(PATH_NODES, PATH_EDGES)
+    rnd = random.Random(3)
+    nos = sorted(G.nodes)
+    D = ArvoresDinamicas(G)
+    origens = rnd.sample(nos, 4)
+    for o in origens:
+        D.registrar(o)
+    arestas = sorted(G.edges)
+    for passo in range(300):
+        u, v = rnd.choice(arestas)
+        r = rnd.random()
+        novo = math.inf if r < 0.1 else rnd.uniform(0.05, 3.0)
+        D.atualizar_peso(u, v, novo)
+        if passo % 25 == 0:
+            for o in origens:
+                _conferir(D, o)
+    for o in origens:
+        _conferir(D, o)
+        destino = nos[len(nos) // 2]
+        assert math.isclose(D.rota(o, destino)[0], dijkstra(G, o, destino)[0], abs_tol=1e-9)
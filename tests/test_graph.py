@@ -0,0 +1,128 @@
+# tests/test_graph.py
+from src.graphs.graph import Graph
+
+def _mini():
+    G = Graph()
+    for n in ["A","B","C"]:
+        G.adicionar_no(n, None)
+    G.adicionar_aresta("A","B", 2)
+    G.adicionar_aresta("B","C", 3)
+    return G
+
+def test_aresta_repetida_atualiza_peso():
+    G = _mini()
+    G.adicionar_aresta("B","A", 7)
+    assert G.get_tamanho() == 2
+    assert G.get_grau("A") == 1 and G.get_grau("B") == 2
+    assert G.get_peso("A","B") == G.get_peso("B","A") == 7.0
+    assert G.edges == {("A","B"), ("B","C")}
+
+def test_peso_padrao_e_no_inexistente():
+    G = _mini()
+    assert G.get_peso("A","C") == 1.0
+    assert G.get_peso("X","A") == 1.0
+    G.adicionar_aresta("A","X")  # nó desconhecido: ignorada
+    assert G.get_tamanho() == 2 and list(G.get_vizinhos("X")) == []
+
+def test_vizinhos_em_ordem_de_insercao():
+    G = _mini()
+    assert list(G.get_vizinhos("B")) == ["A","C"]
+    assert "C" in G.get_vizinhos("B") and len(G.get_vizinhos("B")) == 2
+
+def test_visao_induzida_igual_subgrafo():
+    from src.graphs.io import carregar_grafo_recife
+    G, bairro_para_micro = carregar_grafo_recife("data/bairros_unique.csv", "data/adjacencia_bairros.csv")
+    for micro in set(bairro_para_micro.values()):
+        nos = [b for b, m in bairro_para_micro.items() if m == micro]
+        H = G.criar_subgrafo_induzido(nos)
+        V = G.visao_induzida(nos)
+        assert (V.get_ordem(), V.get_tamanho(), V.get_densidade()) == \
+            (H.get_ordem(), H.get_tamanho(), H.get_densidade())
+        assert set(V.edges) == H.edges
+        for n in nos:
+            assert V.get_grau(n) == H.get_grau(n)
+            assert set(V.get_vizinhos(n)) == set(H.get_vizinhos(n))
+
+def test_visao_e_copia_concordam_com_laco():
+    G = _mini()
+    G.adicionar_aresta("A", "A", 1)     # laço: fica fora dos dois subgrafos
+    nos = ["A", "B", "C"]
+    H = G.criar_subgrafo_induzido(nos)
+    V = G.visao_induzida(nos)
+    assert V.get_tamanho() == H.get_tamanho() == len(V.edges) == len(H.edges)
+    assert V.edges == H.edges                 # reiterável: compara como set
+    assert list(V.edges) == list(V.edges)
+    assert ("A", "A") not in V.edges and ("A", "B") in V.edges and ("B", "A") not in V.edges
+    assert V.get_grau("A") == H.get_grau("A") and "A" not in V.get_vizinhos("A")
+    assert V.get_densidade() == H.get_densidade()
+
+def test_visao_com_algoritmos_e_sem_copia():
+    from src.graphs.algorithms import dijkstra, bfs_layers
+    G = _mini()
+    G.adicionar_no("D", None)
+    G.adicionar_aresta("A","D", 1)
+    G.adicionar_aresta("D","C", 1)
+    V = G.visao_induzida(["A","B","C"])
+    assert dijkstra(V, "A", "C") == (5.0, ["A","B","C"])
+    assert "D" not in V.nodes and V.get_peso("A","D") == 1.0
+    _, _, depth = bfs_layers(V, "A")
+    assert depth == {"A": 0, "B": 1, "C": 2}
+    G.adicionar_aresta("A","C", 1)   # mudança no pai aparece na visão
+    assert dijkstra(V, "A", "C") == (1.0, ["A","C"])
+
+def _conferir_estatisticas(G):
+    from collections import Counter
+    from src.graphs.metrics import metricas_por_grupo
+    graus = Counter(G.get_grau(n) for n in G.nodes)
+    assert G.histograma_graus() == dict(sorted(graus.items()))
+    assert G.get_grau_maximo() == max(graus, default=0)
+    assert G._graus == sorted(graus)
+    esperado = sorted(((n, G.get_grau(n)) for n in G.nodes), key=lambda kv: (-kv[1], kv[0]))
+    assert G.top_k_grau(5) == esperado[:5]
+    grupo_de = {n: info["microrregiao"] for n, info in G.nodes.items() if info["microrregiao"] is not None}
+    assert G.metricas_grupos() == {g: m for g, m in metricas_por_grupo(G, grupo_de).items()}
+
+def test_estatisticas_incrementais_fluxo_aleatorio():
+    import random
+    rnd = random.Random(7)
+    G = Graph()
+    nomes = [f"N{i}" for i in range(30)]
+    for i, n in enumerate(nomes):
+        G.adicionar_no(n, None if i % 7 == 0 else i % 4)
+    for passo in range(2000):
+        op = rnd.random()
+        u, v = rnd.choice(nomes), rnd.choice(nomes)
+        if op < 0.55:
+            G.adicionar_aresta(u, v, rnd.random())
+        elif op < 0.9:
+            G.remover_aresta(u, v)
+        elif op < 0.95:
+            G.remover_no(u)
+        elif op < 0.98:
+            G.adicionar_no(u, rnd.randrange(4))   # nó novo ou troca de microrregião
+        else:
+            G.adicionar_no(u)
+        if passo % 50 == 0:
+            _conferir_estatisticas(G)
+    _conferir_estatisticas(G)
+
+def test_estatisticas_no_carregamento_em_lote():
+    from src.graphs.io import carregar_grafo_recife
+    G, _ = carregar_grafo_recife("data/bairros_unique.csv", "data/adjacencia_bairros.csv")
+    _conferir_estatisticas(G)
+    n, g = G.top_k_grau(1)[0]
+    G.remover_no(n)
+    assert n not in G.nodes and G.get_grau_maximo() <= g
+    _conferir_estatisticas(G)
+
+def test_top_k_grau_pula_graus_vazios():
+    G = Graph()
+    G.adicionar_no("hub", None)
+    for i in range(1000):
+        G.adicionar_no(f"f{i:04d}", None)
+        G.adicionar_aresta("hub", f"f{i:04d}", 1.0)
+    G.adicionar_no("isolado", None)
+    # só os graus 1000, 1 e 0 têm nós; k maior que a ordem devolve todos
+    top = G.top_k_grau(2000)
+    assert len(top) == G.get_ordem()
+    assert top[:2] == [("hub", 1000), ("f0000", 1)] and top[-1] == ("isolado", 0)
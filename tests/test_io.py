@@ -0,0 +1,197 @@
+# tests/test_io.py
+from src.graphs.graph import Graph
+from src.graphs.io import construir_grafo, adicionar_arestas_vetorizado
+
+def _sequencial(bairros, origens, destinos, pesos):
+    G = Graph()
+    for b in bairros:
+        G.adicionar_no(b, None)
+    for u, v, w in zip(origens, destinos, pesos):
+        G.adicionar_aresta(u.strip(), v.strip(), w)
+    return G
+
+def test_lote_igual_sequencial():
+    bairros = ["A","B","C","D"]
+    origens  = [" A", "B ", "A", "C", "X", "B", "D"]
+    destinos = ["B",  "C",  "C", "A", "A", "A", "D"]
+    pesos    = [1.0,  2.0,  5.0, 7.0, 3.0, 9.0, 0.5]
+    G, rejeitadas = construir_grafo(bairros, [None] * 4, origens, destinos, pesos)
+    R = _sequencial(bairros, origens, destinos, pesos)
+    assert G.edges == R.edges
+    for n in bairros:
+        assert list(G.adjacencia[n].items()) == list(R.adjacencia[n].items())
+    assert list(rejeitadas.index) == [4]
+    assert rejeitadas.iloc[0]["origem"] == "X"
+
+def test_lote_sobre_grafo_existente_e_peso_padrao():
+    G = Graph()
+    for n in ["A","B","C"]:
+        G.adicionar_no(n, None)
+    G.adicionar_aresta("A","B", 4)
+    rej = adicionar_arestas_vetorizado(G, ["B","C"], ["C","Z"])
+    assert len(rej) == 1
+    assert list(G.get_vizinhos("B")) == ["A","C"]
+    assert G.get_peso("B","C") == 1.0 and G.get_peso("A","B") == 4.0
+    assert G.get_tamanho() == 2
+
+def test_leitor_csv_igual_ao_pandas():
+    import math
+    from src.graphs.io import carregar_grafo_recife, carregar_grafo_recife_csv
+    nodes, edges = "data/bairros_unique.csv", "data/adjacencia_bairros.csv"
+    G, micro = carregar_grafo_recife(nodes, edges)
+    C, micro_csv = carregar_grafo_recife_csv(nodes, edges)
+    assert micro_csv == micro
+    assert C.edges == G.edges
+    for n in G.nodes:
+        assert list(C.adjacencia[n]) == list(G.adjacencia[n])
+        for v, w in G.adjacencia[n].items():
+            assert C.get_peso(n, v) == w or (math.isnan(w) and math.isnan(C.get_peso(n, v)))
+
+def test_leitor_csv_tolera_linhas_curtas(tmp_path):
+    import math
+    from src.graphs.io import carregar_grafo_recife, carregar_grafo_recife_csv
+    nodes, edges = tmp_path / "nos.csv", tmp_path / "arestas.csv"
+    nodes.write_text("bairro,microrregiao\nA,1\nB\nC,2\n", encoding="utf-8")
+    edges.write_text("bairro_origem,bairro_destino,peso\nA,B,2\nB,C\nC\n\nA,C,1\n", encoding="utf-8")
+    C, micro = carregar_grafo_recife_csv(str(nodes), str(edges))
+    assert micro == {"A": 1, "B": None, "C": 2}
+    assert C.edges == {("A", "B"), ("B", "C"), ("A", "C")}
+    assert math.isnan(C.get_peso("B", "C"))
+    G, _ = carregar_grafo_recife(str(nodes), str(edges))
+    assert C.edges == G.edges
+
+def test_rotas_sem_importar_pandas():
+    import subprocess, sys
+    codigo = (
+        "import sys\n"
+        "from src.graphs.io import carregar_grafo_recife_csv\n"
+        "from src.graphs.algorithms import dijkstra\n"
+        "import src.viz\n"
+        "G, _ = carregar_grafo_recife_csv('data/bairros_unique.csv', 'data/adjacencia_bairros.csv')\n"
+        "assert dijkstra(G, 'Nova Descoberta', 'Boa Viagem')[1]\n"
+        "pesados = {'pandas', 'numpy', 'matplotlib', 'pyvis'} & set(sys.modules)\n"
+        "assert not pesados, pesados\n"
+    )
+    subprocess.run([sys.executable, "-c", codigo], check=True, capture_output=True)
+
+def _od_sintetico(caminho, n):
+    import random
+    rnd = random.Random(5)
+    with open("data/bairros_unique.csv", encoding="utf-8") as f:
+        nomes = [l.split(",")[0] for l in f.read().splitlines()[1:]]
+    with open(caminho, "w", encoding="utf-8") as f:
+        f.write("id,origem,destino\n")
+        for i in range(n):
+            f.write(f'{i},"{rnd.choice(nomes)} ", {rnd.choice(nomes)}\n')
+
+def test_distancias_stream_igual_e_retoma(tmp_path, monkeypatch):
+    import pytest
+    import src.graphs.algorithms as alg
+    from src.graphs.io import calcular_distancias_enderecos, calcular_distancias_enderecos_stream
+    adj = "data/adjacencia_bairros.csv"
+    od = str(tmp_path / "od.csv")
+    _od_sintetico(od, 1000)
+
+    ref = str(tmp_path / "ref.csv")
+    calcular_distancias_enderecos(adj, od, ref, str(tmp_path / "ref.json"))
+    with open(ref, encoding="utf-8") as f:
+        esperado = f.read()
+
+    saida = str(tmp_path / "saida.csv")
+    assert calcular_distancias_enderecos_stream(adj, od, saida, tamanho_lote=128) == 1000
+    with open(saida, encoding="utf-8") as f:
+        assert f.read() == esperado
+
+    # queda no 4º lote, com uma linha parcial já escrita na saída
+    original, chamadas = alg.rotas_em_lote, []
+    def _cai(G, pares):
+        chamadas.append(1)
+        if len(chamadas) == 4:
+            with open(saida, "a", encoding="utf-8") as f:
+                f.write("Linha,parcial")
+            raise RuntimeError("queda")
+        return original(G, pares)
+    monkeypatch.setattr(alg, "rotas_em_lote", _cai)
+    with pytest.raises(RuntimeError):
+        calcular_distancias_enderecos_stream(adj, od, saida, tamanho_lote=128)
+    monkeypatch.undo()
+
+    assert calcular_distancias_enderecos_stream(adj, od, saida, tamanho_lote=128) == 1000
+    with open(saida, encoding="utf-8") as f:
+        assert f.read() == esperado
+    assert not (tmp_path / "saida.csv.ckpt").exists()
+
+def test_distancias_stream_linhas_curtas_e_retoma(tmp_path, monkeypatch):
+    import pytest
+    import src.graphs.algorithms as alg
+    from src.graphs.io import calcular_distancias_enderecos, calcular_distancias_enderecos_stream
+    adj = "data/adjacencia_bairros.csv"
+    od = tmp_path / "od.csv"
+    _od_sintetico(str(od), 1000)
+    linhas = od.read_text(encoding="utf-8").splitlines()
+    # registros curtos / com campo vazio, um deles dentro do lote que cai
+    for pos, curta in [(900, "c,,Derby"), (450, "b"), (10, "a,Derby")]:
+        linhas.insert(pos, curta)
+    od.write_text("\n".join(linhas) + "\n", encoding="utf-8")
+
+    ref = str(tmp_path / "ref.csv")
+    calcular_distancias_enderecos(adj, str(od), ref, str(tmp_path / "ref.json"))
+    with open(ref, encoding="utf-8") as f:
+        esperado = f.read()
+    assert esperado.count(",inf,") == 3
+
+    saida = str(tmp_path / "saida.csv")
+    original, chamadas = alg.rotas_em_lote, []
+    def _cai(G, pares):
+        chamadas.append(1)
+        if len(chamadas) == 4:
+            raise RuntimeError("queda")
+        return original(G, pares)
+    monkeypatch.setattr(alg, "rotas_em_lote", _cai)
+    with pytest.raises(RuntimeError):
+        calcular_distancias_enderecos_stream(adj, str(od), saida, tamanho_lote=128)
+    monkeypatch.undo()
+
+    assert calcular_distancias_enderecos_stream(adj, str(od), saida, tamanho_lote=128) == 1003
+    with open(saida, encoding="utf-8") as f:
+        assert f.read() == esperado
+
+def test_distancias_nome_desconhecido_nao_vira_palpite(tmp_path):
+    import csv
+    from src.graphs.io import calcular_distancias_enderecos, calcular_distancias_enderecos_stream
+    adj = "data/adjacencia_bairros.csv"
+    od = tmp_path / "od.csv"
+    # "Boa Viajem" é parecido com Boa Viagem, mas não é um bairro nem um apelido
+    od.write_text("origem,destino\nboa vista,SETÚBAL\nBoa Viajem,Derby\n", encoding="utf-8")
+
+    for calcular in (calcular_distancias_enderecos, calcular_distancias_enderecos_stream):
+        saida = tmp_path / f"{calcular.__name__}.csv"
+        calcular(adj, str(od), str(saida), str(tmp_path / "p.json"))
+        with open(saida, encoding="utf-8") as f:
+            linhas = list(csv.DictReader(f))
+        assert linhas[0]["caminho"].startswith("Boa Vista") and linhas[0]["caminho"].endswith("Boa Viagem")
+        assert linhas[1]["custo"] == "inf" and linhas[1]["caminho"] == ""
+
+def test_resolvedor_sem_palpite():
+    from src.graphs.resolver import ResolvedorBairros
+    R = ResolvedorBairros(["Boa Viagem", "Derby"], limiar=None)
+    assert R.resolver("boa viagem") == "Boa Viagem" and R.resolver("Setúbal") == "Boa Viagem"
+    assert R.resolver("Boa Viajem") is None
+    assert R.resolver("Boa Viagem (Setúbal)") == "Boa Viagem"
+    assert ResolvedorBairros(["Boa Viagem", "Derby"]).resolver("Boa Viajem") == "Boa Viagem"
+
+def test_distancias_resolvem_boa_viagem_setubal(tmp_path):
+    import csv, json
+    from src.graphs.io import calcular_distancias_enderecos, calcular_distancias_enderecos_stream
+    adj = "data/adjacencia_bairros.csv"
+    od = tmp_path / "od.csv"
+    od.write_text("origem,destino\nNova Descoberta,Boa Viagem (Setúbal)\n", encoding="utf-8")
+
+    for calcular in (calcular_distancias_enderecos, calcular_distancias_enderecos_stream):
+        saida, percurso = tmp_path / f"{calcular.__name__}.csv", tmp_path / f"{calcular.__name__}.json"
+        calcular(adj, str(od), str(saida), str(percurso))
+        with open(saida, encoding="utf-8") as f:
+            (linha,) = list(csv.DictReader(f))
+        assert linha["custo"] != "inf" and linha["caminho"].endswith("Boa Viagem")
+        # o par obrigatório é reconhecido pelo nome resolvido
+        assert json.loads(percurso.read_text(encoding="utf-8"))["caminho"][-1] == "Boa Viagem"
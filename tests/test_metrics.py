@@ -0,0 +1,77 @@
+# tests/test_metrics.py
+import random
+
+from src.graphs.graph import Graph
+from src.graphs.metrics import metricas_ego, contar_triangulos
+from src.graphs.io import carregar_grafo_recife
+
+DATA_DIR = "data"
+PATH_NODES = f"{DATA_DIR}/bairros_unique.csv"
+PATH_EDGES = f"{DATA_DIR}/adjacencia_bairros.csv"
+
+def _ego_por_subgrafo(G):
+    linhas = []
+    for bairro in G.nodes.keys():
+        ego = G.criar_subgrafo_induzido(list(set(G.get_vizinhos(bairro)) | {bairro}))
+        linhas.append({
+            "bairro": bairro,
+            "grau": G.get_grau(bairro),
+            "ordem_ego": ego.get_ordem(),
+            "tamanho_ego": ego.get_tamanho(),
+            "densidade_ego": ego.get_densidade()
+        })
+    return linhas
+
+def test_triangulos_mini():
+    G = Graph()
+    for n in ["A","B","C","D"]:
+        G.adicionar_no(n, None)
+    for u, v in [("A","B"), ("B","C"), ("A","C"), ("C","D")]:
+        G.adicionar_aresta(u, v)
+    assert contar_triangulos(G) == {"A": 1, "B": 1, "C": 1, "D": 0}
+
+def test_ego_igual_subgrafo_aleatorio():
+    rng = random.Random(11)
+    G = Graph()
+    for i in range(80):
+        G.adicionar_no(f"n{i}", None)
+    for _ in range(400):
+        G.adicionar_aresta(f"n{rng.randrange(80)}", f"n{rng.randrange(80)}")
+    G.adicionar_aresta("n0", "n0")  # laço
+    assert metricas_ego(G) == _ego_por_subgrafo(G)
+
+def test_ego_igual_subgrafo_recife():
+    G, _ = carregar_grafo_recife(PATH_NODES, PATH_EDGES)
+    assert metricas_ego(G) == _ego_por_subgrafo(G)
+
+def test_grupos_igual_subgrafo_recife():
+    from src.graphs.metrics import metricas_por_grupo
+    G, bairro_para_micro = carregar_grafo_recife(PATH_NODES, PATH_EDGES)
+    grupos = metricas_por_grupo(G, bairro_para_micro)
+    corte_total = 0
+    for micro, m in grupos.items():
+        sub = G.criar_subgrafo_induzido([b for b, g in bairro_para_micro.items() if g == micro])
+        assert (m["ordem"], m["tamanho"], m["densidade"]) == \
+            (sub.get_ordem(), sub.get_tamanho(), sub.get_densidade())
+        corte_total += m["corte"]
+    internas = sum(m["tamanho"] for m in grupos.values())
+    assert internas + corte_total // 2 == G.get_tamanho()
+
+def test_grupos_particao_qualquer(tmp_path):
+    import json
+    from src.graphs.metrics import metricas_por_grupo
+    from src.graphs.io import calcular_metricas_microrregioes
+    G = Graph()
+    for n in ["A","B","C","D"]:
+        G.adicionar_no(n, None)
+    for u, v in [("A","B"), ("B","C"), ("C","D")]:
+        G.adicionar_aresta(u, v)
+    r = metricas_por_grupo(G, {"A": "x", "B": "x", "C": "y"})   # D sem grupo
+    assert r["x"] == {"ordem": 2, "tamanho": 1, "corte": 1, "densidade": 1.0}
+    assert r["y"] == {"ordem": 1, "tamanho": 0, "corte": 2, "densidade": 0.0}
+
+    saida = tmp_path / "micro.json"
+    G2, _ = carregar_grafo_recife(PATH_NODES, PATH_EDGES)
+    lista = calcular_metricas_microrregioes(G2, PATH_NODES, str(saida))
+    assert [m["microrregiao"] for m in lista] == sorted(m["microrregiao"] for m in lista)
+    assert json.loads(saida.read_text()) == lista
@@ -0,0 +1,45 @@
+# tests/test_parallel.py
+import math
+import random
+
+from src.graphs.algorithms import rotas_em_lote
+from src.graphs.io import carregar_grafo_recife
+from src.graphs.parallel import RoteadorParalelo, rotas_em_lote_paralelo
+
+DATA_DIR = "data"
+PATH_NODES = f"{DATA_DIR}/bairros_unique.csv"
+PATH_EDGES = f"{DATA_DIR}/adjacencia_bairros.csv"
+
+def test_paralelo_igual_ao_sequencial():
+    G, _ = carregar_grafo_recife(PATH_NODES, PATH_EDGES)
+    nos = sorted(G.nodes)
+    rnd = random.Random(11)
+    pares = [(rnd.choice(nos), rnd.choice(nos)) for _ in range(2000)]
+    pares += [("Inexistente", nos[0]), (nos[0], "Inexistente"), (nos[1], nos[1])]
+
+    esperado = rotas_em_lote(G, pares)
+    obtido = rotas_em_lote_paralelo(G, pares, processos=3)
+    assert len(obtido) == len(pares)
+    for (o, d), (c1, p1), (c2, p2) in zip(pares, esperado, obtido):
+        assert c1 == c2 or math.isclose(c1, c2)
+        if p2:
+            assert p2[0] == o and p2[-1] == d
+            custo = sum(G.get_peso(u, v) for u, v in zip(p2, p2[1:]))
+            assert math.isclose(custo, c2, abs_tol=1e-9)
+        else:
+            assert p1 == []
+
+def test_roteador_reaproveita_o_pool():
+    G, _ = carregar_grafo_recife(PATH_NODES, PATH_EDGES)
+    with RoteadorParalelo(G, processos=2) as R:
+        a = R.rotas([("Nova Descoberta", "Boa Viagem")])
+        b = R.rotas([("Boa Viagem", "Nova Descoberta"), ("Nova Descoberta", "Boa Viagem")])
+    assert a[0] == b[1]
+    assert math.isclose(a[0][0], b[0][0])   # grafo não-direcionado
+
+def test_rotas_nao_resolvidas_nao_compartilham_caminho():
+    G, _ = carregar_grafo_recife(PATH_NODES, PATH_EDGES)
+    with RoteadorParalelo(G, processos=1) as R:
+        rotas = R.rotas([("Inexistente", "Boa Viagem"), ("Boa Viagem", "Outro")])
+    rotas[0][1].append("lixo")
+    assert rotas[1] == (float("inf"), [])
@@ -15,9 +15,9 @@ os.makedirs(OUT_CSV,  exist_ok=True)
 # (1) carrega grafo
 G, _ = carregar_grafo_recife(PATH_NODES, PATH_EDGES)
 
-# (2) gera graus.csv conforme o PDF
+# (2) gera graus.csv conforme o PDF (+ centralidades para os rankings)
 GRAUS_CSV = os.path.join(OUT_CSV, "graus.csv")
-calcular_graus(G, GRAUS_CSV)
+calcular_graus(G, GRAUS_CSV, centralidade=True)
 
 # sanidade: soma dos graus = 2*|E|
 df_graus = pd.read_csv(GRAUS_CSV)
@@ -1,9 +1,10 @@
 # tests/test_passo6.py
-import os, json, unicodedata
+import os, json
 import pandas as pd
 
 from src.graphs.io import carregar_grafo_recife
-from src.graphs.algorithms import dijkstra
+from src.graphs.algorithms import rotas_em_lote
+from src.graphs.resolver import ResolvedorBairros
 
 DATA_DIR = "data"
 OUT_DIR  = "out"
@@ -21,20 +22,6 @@ CSV_OUT   = os.path.join(OUT_CSV,  "distancias_enderecos.csv")
 JSON_MAND = os.path.join(OUT_JSON, "percurso_nova_descoberta_setubal.json")
 
 
-def _norm(s: str) -> str:
-    if not isinstance(s, str):
-        return ""
-    t = unicodedata.normalize("NFKD", s).encode("ASCII", "ignore").decode("ASCII")
-    return t.strip().title()
-
-
-def _is_boa_viagem(s: str) -> bool:
-    if not isinstance(s, str):
-        return False
-    t = unicodedata.normalize("NFKD", s).encode("ASCII", "ignore").decode("ASCII")
-    return "boa viagem" in t.lower()
-
-
 def test_passo6():
     # 1) Carrega o grafo ponderado dos bairros
     G, _ = carregar_grafo_recife(PATH_NODES, PATH_EDGES)
@@ -56,30 +43,33 @@ def test_passo6():
     salvou_json_obrigatorio = False
     total_processados = 0
 
-    for _, r in df.iterrows():
-        bx_raw = str(r["bairro_X"])
-        by_raw = str(r["bairro_Y"])
-
-        bx = _norm(bx_raw)
-        by = _norm(by_raw)
-        by_node = "Boa Viagem" if _is_boa_viagem(by_raw) else by
+    # só nome exato ou apelido (ALIASES): nada de palpite por trigramas
+    resolvedor = ResolvedorBairros(G.nodes, limiar=None)
+    xs = [str(x) for x in df["bairro_X"]]
+    ys = [str(y) for y in df["bairro_Y"]]
 
-        if bx == "Nova Descoberta" and _is_boa_viagem(by_raw):
+    validos = []
+    for bx_raw, by_raw, bx, by_node in zip(xs, ys, resolvedor.resolver_muitos(xs), resolvedor.resolver_muitos(ys)):
+        if bx == "Nova Descoberta" and by_node == "Boa Viagem":
             tem_par_obrigatorio = True
 
-        if bx not in G.nodes or by_node not in G.nodes:
+        if bx is None or by_node is None:
             continue
 
         total_processados += 1
-        custo, caminho = dijkstra(G, bx, by_node)
+        validos.append((bx_raw, by_raw, bx, by_node))
+
+    # um Dijkstra de fonte única por origem distinta
+    rotas = rotas_em_lote(G, [(bx, by_node) for _, _, bx, by_node in validos])
 
+    for (bx_raw, by_raw, bx, by_node), (custo, caminho) in zip(validos, rotas):
         assert custo >= 0, "Custo negativo encontrado – verifique os pesos."
         if custo != float("inf"):
             assert caminho[0] == bx and caminho[-1] == by_node, \
                 "Caminho não inicia/termina nos bairros esperados."
 
         caminho_out = list(caminho)
-        if _is_boa_viagem(by_raw) and caminho_out and caminho_out[-1] == "Boa Viagem":
+        if by_node == "Boa Viagem" and caminho_out and caminho_out[-1] == "Boa Viagem":
             caminho_out[-1] = "Boa Viagem (Setúbal)"
 
         linhas.append({
@@ -91,7 +81,7 @@ def test_passo6():
             "caminho": " -> ".join(caminho_out) if caminho_out else ""
         })
 
-        if bx == "Nova Descoberta" and _is_boa_viagem(by_raw) and custo != float("inf"):
+        if bx == "Nova Descoberta" and by_node == "Boa Viagem" and custo != float("inf"):
             with open(JSON_MAND, "w", encoding="utf-8") as f:
                 json.dump({
                     "origem": "Nova Descoberta",
@@ -0,0 +1,189 @@
+# tests/test_pipeline.py
+import json
+import os
+import shutil
+import threading
+from pathlib import Path
+
+import pytest
+
+from src.pipeline import Etapa, Pipeline, pipeline_recife
+from src.graphs.io import gerar_rankings_json
+
+def _pipeline_contado(tmp_path, chamadas, barreira=None):
+    """entrada.txt -> base (virtual) -> a.txt, b.txt (independentes) -> c.txt"""
+    entrada = tmp_path / "entrada.txt"
+
+    def gravar(nome, texto):
+        (tmp_path / nome).write_text(texto, encoding="utf-8")
+
+    def base():
+        chamadas.append("base")
+        return entrada.read_text(encoding="utf-8").strip()
+
+    def a(v):
+        chamadas.append("a")
+        if barreira is not None:
+            barreira.wait()
+        gravar("a.txt", v.upper())
+        return v.upper()
+
+    def b(v):
+        chamadas.append("b")
+        if barreira is not None:
+            barreira.wait()
+        gravar("b.txt", str(len(v)))
+        return len(v)
+
+    def c(va, vb):
+        chamadas.append("c")
+        gravar("c.txt", f"{va}:{vb}")
+        return None
+
+    etapas = [
+        Etapa("base", base, entradas=[str(entrada)]),
+        Etapa("a", a, depende=["base"], saidas=[str(tmp_path / "a.txt")],
+              carregar=lambda: (tmp_path / "a.txt").read_text(encoding="utf-8")),
+        Etapa("b", b, depende=["base"], saidas=[str(tmp_path / "b.txt")],
+              carregar=lambda: int((tmp_path / "b.txt").read_text(encoding="utf-8"))),
+        Etapa("c", c, depende=["a", "b"], saidas=[str(tmp_path / "c.txt")]),
+    ]
+    return Pipeline(etapas, str(tmp_path / "manifesto.json"), trabalhadores=2)
+
+def test_pipeline_so_refaz_o_desatualizado(tmp_path):
+    (tmp_path / "entrada.txt").write_text("abc\n", encoding="utf-8")
+    chamadas = []
+    P = _pipeline_contado(tmp_path, chamadas)
+
+    assert P.rodar() == {"a": "executada", "b": "executada", "c": "executada"}
+    assert sorted(chamadas) == ["a", "b", "base", "c"]   # base calculada uma vez, em memória
+    assert (tmp_path / "c.txt").read_text(encoding="utf-8") == "ABC:3"
+
+    chamadas.clear()
+    assert P.rodar() == {"a": "atualizada", "b": "atualizada", "c": "atualizada"}
+    assert chamadas == []
+
+    # mesmo tamanho: b refaz e grava os mesmos bytes; c só roda por causa de a
+    (tmp_path / "entrada.txt").write_text("xyz\n", encoding="utf-8")
+    chamadas.clear()
+    assert P.rodar() == {"a": "executada", "b": "executada", "c": "executada"}
+    assert (tmp_path / "c.txt").read_text(encoding="utf-8") == "XYZ:3"
+
+    # artefato apagado: só ele é refeito; c relê a.txt e b.txt do disco
+    os.remove(tmp_path / "c.txt")
+    chamadas.clear()
+    assert P.rodar() == {"a": "atualizada", "b": "atualizada", "c": "executada"}
+    assert chamadas == ["c"]
+    assert (tmp_path / "c.txt").read_text(encoding="utf-8") == "XYZ:3"
+
+    # só o alvo pedido (e suas dependências)
+    chamadas.clear()
+    assert P.rodar(["a"], forcar=True) == {"a": "executada"}
+    assert chamadas == ["base", "a"]
+
+def test_pipeline_corte_cedo(tmp_path):
+    (tmp_path / "entrada.txt").write_text("abc\n", encoding="utf-8")
+    chamadas = []
+    P = _pipeline_contado(tmp_path, chamadas)
+    P.rodar()
+
+    # a entrada muda, mas a.txt e b.txt saem iguais: c não roda
+    (tmp_path / "entrada.txt").write_text("abc\n\n", encoding="utf-8")
+    chamadas.clear()
+    assert P.rodar() == {"a": "executada", "b": "executada", "c": "atualizada"}
+    assert "c" not in chamadas
+
+def test_pipeline_ramos_independentes_em_paralelo(tmp_path):
+    (tmp_path / "entrada.txt").write_text("abc\n", encoding="utf-8")
+    # a e b só passam da barreira se estiverem rodando ao mesmo tempo
+    barreira = threading.Barrier(2, timeout=10)
+    P = _pipeline_contado(tmp_path, [], barreira)
+    assert P.rodar() == {"a": "executada", "b": "executada", "c": "executada"}
+
+def test_pipeline_recife(tmp_path):
+    data = tmp_path / "data"
+    shutil.copytree("data", data)
+    out = tmp_path / "out"
+    alvos = ["recife_global", "microrregioes", "rankings", "distancias"]
+
+    P = pipeline_recife(str(data), str(out))
+    status = P.rodar(alvos)
+    assert set(status) == {"recife_global", "microrregioes", "ego", "graus", "rankings", "distancias"}
+    assert set(status.values()) == {"executada"}
+
+    # rankings em memória == rankings relendo os CSVs
+    em_memoria = json.loads((out / "json" / "rankings.json").read_text(encoding="utf-8"))
+    relidos = gerar_rankings_json(str(out / "csv" / "graus.csv"), str(out / "csv" / "ego_bairro.csv"),
+                                  str(tmp_path / "rankings.json"))
+    assert em_memoria == relidos
+    percurso = json.loads((out / "json" / "percurso_nova_descoberta_setubal.json").read_text(encoding="utf-8"))
+    assert percurso["caminho"][0] == "Nova Descoberta" and percurso["caminho"][-1] == "Boa Viagem (Setúbal)"
+
+    assert set(pipeline_recife(str(data), str(out)).rodar(alvos).values()) == {"atualizada"}
+
+    # endereços mudam: só as distâncias são refeitas
+    with open(data / "enderecos.csv", "a", encoding="utf-8") as f:
+        f.write("Boa Vista,Derby\n")
+    status = pipeline_recife(str(data), str(out)).rodar(alvos)
+    assert [n for n, s in status.items() if s == "executada"] == ["distancias"]
+
+# PNGs carregam a versão do matplotlib nos metadados e mapa_cores_grau.html
+# segue a ordem (por hash) do conjunto de arestas: ficam fora da comparação
+ARTEFATOS_DETERMINISTICOS = [
+    "csv/distancias_enderecos.csv", "csv/ego_bairro.csv", "csv/graus.csv",
+    "json/microrregioes.json", "json/percurso_nova_descoberta_setubal.json",
+    "json/rankings.json", "json/recife_global.json",
+    "visual/arvore_percurso.html", "visual/bfs_camadas_boa_vista.html", "visual/top10_subgrafo.html",
+]
+
+def test_pipeline_recife_reproduz_out_versionado(tmp_path):
+    out = tmp_path / "out"
+    P = pipeline_recife("data", str(out))
+    alvos = [n for n, e in P.etapas.items() if e.recurso is None and n != "mapa_cores_grau"]
+    P.rodar(alvos)
+    for artefato in ARTEFATOS_DETERMINISTICOS:
+        assert (out / artefato).read_bytes() == (Path("out") / artefato).read_bytes(), artefato
+
+def test_pipeline_dependencia_atualizada_sem_carregar(tmp_path):
+    entrada = tmp_path / "entrada.txt"
+    entrada.write_text("abc", encoding="utf-8")
+    chamadas = []
+
+    def a():
+        chamadas.append("a")
+        (tmp_path / "a.txt").write_text(entrada.read_text(encoding="utf-8"), encoding="utf-8")
+        return 1
+
+    def b(_):
+        chamadas.append("b")
+        (tmp_path / "b.txt").write_text("b", encoding="utf-8")
+
+    P = Pipeline([
+        Etapa("a", a, entradas=[str(entrada)], saidas=[str(tmp_path / "a.txt")]),
+        Etapa("b", b, depende=["a"], saidas=[str(tmp_path / "b.txt")]),
+    ], str(tmp_path / "manifesto.json"))
+    P.rodar()
+
+    # b precisa rodar, a está atualizada e não sabe se reler: erro, sem refazer 'a' por fora
+    os.remove(tmp_path / "b.txt")
+    chamadas.clear()
+    with pytest.raises(RuntimeError, match="'a'"):
+        P.rodar()
+    assert chamadas == []
+
+def test_pipeline_recife_nao_refaz_dependencia_atualizada(tmp_path):
+    data = tmp_path / "data"
+    shutil.copytree("data", data)
+    out = tmp_path / "out"
+    P = pipeline_recife(str(data), str(out))
+    # toda etapa com artefatos que alimenta outra sabe se reler
+    consumidas = {d for e in P.etapas.values() for d in e.depende}
+    assert all(P.etapas[n].carregar is not None for n in consumidas if P.etapas[n].saidas)
+
+    P.rodar(["ranking_microrregioes"])
+    micro = out / "json" / "microrregioes.json"
+    antes = micro.stat().st_mtime_ns
+    os.remove(out / "visual" / "ranking_micros_densidade.png")
+    status = pipeline_recife(str(data), str(out)).rodar(["ranking_microrregioes"])
+    assert status == {"microrregioes": "atualizada", "ranking_microrregioes": "executada"}
+    assert micro.stat().st_mtime_ns == antes
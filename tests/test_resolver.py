@@ -0,0 +1,33 @@
+# tests/test_resolver.py
+from src.graphs.resolver import ResolvedorBairros, normalizar, padronizar_nome
+
+NOMES = ["Boa Viagem", "Nova Descoberta", "Agua Fria", "Alto Jose Do Pinho", "Recife", "Ibura"]
+
+def test_normalizacao_e_padronizacao():
+    assert normalizar("  Água-Fria ") == normalizar("agua fria") == "agua fria"
+    assert padronizar_nome(" alto josé do pinho") == "Alto Jose Do Pinho"
+    assert padronizar_nome("Setúbal") == "Boa Viagem"
+
+def test_exato_apelido_e_aproximado():
+    R = ResolvedorBairros(NOMES)
+    assert R.resolver("ÁGUA FRIA") == "Agua Fria"
+    assert R.resolver("Alto José do Pinho") == "Alto Jose Do Pinho"
+    assert R.resolver("Setúbal") == "Boa Viagem"
+    assert R.resolver("Boa Viagem (Setúbal)") == "Boa Viagem"
+    assert R.resolver("Nova Descobrta") == "Nova Descoberta"
+    assert R.resolver("Alto do Pinho") == "Alto Jose Do Pinho"
+    assert R.resolver("Olinda") is None and R.resolver("") is None
+
+def test_resolver_muitos_preserva_ordem_e_deduplica(monkeypatch):
+    import src.graphs.resolver as mod
+    R = ResolvedorBairros(NOMES)
+    chamadas = []
+    original = mod.normalizar
+    monkeypatch.setattr(mod, "normalizar", lambda t: chamadas.append(t) or original(t))
+    textos = ["recife", "Setubal", "recife", "???", "Setubal"] * 1000
+    out = R.resolver_muitos(textos)
+    assert out[:5] == ["Recife", "Boa Viagem", "Recife", None, "Boa Viagem"]
+    assert len(out) == len(textos)
+    assert len(chamadas) == 3          # um normalizar por texto distinto
+    R.resolver_muitos(textos)
+    assert len(chamadas) == 3          # segunda vez: tudo do memo
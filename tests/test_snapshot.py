@@ -0,0 +1,99 @@
+# tests/test_snapshot.py
+import os
+import shutil
+
+import src.graphs.io as io
+from src.graphs.algorithms import dijkstra
+from src.graphs.snapshot import carregar_grafo_recife_cache
+
+DATA_DIR = "data"
+PATH_NODES = f"{DATA_DIR}/bairros_unique.csv"
+PATH_EDGES = f"{DATA_DIR}/adjacencia_bairros.csv"
+
+def _copiar(tmp_path):
+    nodes = str(tmp_path / "bairros_unique.csv")
+    edges = str(tmp_path / "adjacencia_bairros.csv")
+    shutil.copy(PATH_NODES, nodes)
+    shutil.copy(PATH_EDGES, edges)
+    return nodes, edges
+
+def test_snapshot_reaproveita_e_invalida(tmp_path, monkeypatch):
+    nodes, edges = _copiar(tmp_path)
+    snap = str(tmp_path / "snap")
+    G, b2m = io.carregar_grafo_recife(nodes, edges)
+
+    C, micro = carregar_grafo_recife_cache(nodes, edges, snap)
+    assert micro == b2m
+    # arrays mapeados do disco (somente leitura), sem cópia
+    assert not C.indices.flags.owndata and not C.indices.flags.writeable
+    assert C.get_tamanho() == G.get_tamanho()
+    assert dijkstra(C, "Nova Descoberta", "Boa Viagem")[0] == dijkstra(G, "Nova Descoberta", "Boa Viagem")[0]
+
+    # snapshot quente: não relê os CSVs
+    def _proibido(*a, **k):
+        raise AssertionError("CSV relido com snapshot válido")
+    monkeypatch.setattr(io, "carregar_grafo_recife_csv", _proibido)
+    carregar_grafo_recife_cache(nodes, edges, snap)
+
+    # mtime novo, mesmo conteúdo: confere pelo sha256
+    st = os.stat(edges)
+    os.utime(edges, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+    carregar_grafo_recife_cache(nodes, edges, snap)
+
+    # conteúdo novo: reconstrói
+    monkeypatch.undo()
+    with open(edges, "a", encoding="utf-8") as f:
+        f.write("\nAflitos,Afogados,Rua Teste,,2.5")
+    C2, _ = carregar_grafo_recife_cache(nodes, edges, snap)
+    assert C2.get_tamanho() == G.get_tamanho() + 1
+
+def test_reconstrucao_nao_altera_snapshot_ja_mapeado(tmp_path):
+    import numpy as np
+    nodes, edges = _copiar(tmp_path)
+    snap = str(tmp_path / "snap")
+    C1, _ = carregar_grafo_recife_cache(nodes, edges, snap)
+    pesos = np.array(C1.weights)
+    nomes = list(C1.nomes)
+
+    # CSV bem menor e com pesos diferentes: a reconstrução não pode tocar
+    # nos arquivos que C1 mapeou (nem encolhê-los)
+    with open(edges, encoding="utf-8") as f:
+        linhas = f.read().splitlines()
+    cab = linhas[0].split(",")
+    i_peso = cab.index("peso")
+    novas = [linhas[0]]
+    for l in linhas[1:len(linhas) // 2]:
+        campos = l.split(",")
+        if campos[i_peso]:
+            campos[i_peso] = str(float(campos[i_peso]) * 10)
+        novas.append(",".join(campos))
+    with open(edges, "w", encoding="utf-8") as f:
+        f.write("\n".join(novas) + "\n")
+
+    C2, _ = carregar_grafo_recife_cache(nodes, edges, snap)
+    assert C2.get_tamanho() < C1.get_tamanho()
+    assert C1.nomes == nomes
+    assert np.array_equal(np.asarray(C1.weights), pesos, equal_nan=True)
+    # só a geração publicada fica no diretório
+    assert len([n for n in os.listdir(snap) if n.startswith("g-")]) == 1
+
+def test_impressao_tomada_antes_da_leitura(tmp_path, monkeypatch):
+    nodes, edges = _copiar(tmp_path)
+    snap = str(tmp_path / "snap")
+    ler = io.carregar_grafo_recife_csv
+    leituras = []
+
+    def _editar_durante(*a, **k):
+        res = ler(*a, **k)
+        if not leituras:
+            # CSV editado depois de lido, antes de o snapshot ser gravado
+            with open(edges, "a", encoding="utf-8") as f:
+                f.write("\nAflitos,Afogados,Rua Teste,,2.5")
+        leituras.append(1)
+        return res
+    monkeypatch.setattr(io, "carregar_grafo_recife_csv", _editar_durante)
+
+    C1, _ = carregar_grafo_recife_cache(nodes, edges, snap)
+    C2, _ = carregar_grafo_recife_cache(nodes, edges, snap)
+    assert len(leituras) == 2
+    assert C2.get_tamanho() == C1.get_tamanho() + 1
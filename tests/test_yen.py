@@ -0,0 +1,96 @@
+# tests/test_yen.py
+import itertools
+import math
+import random
+
+from src.graphs.graph import Graph
+from src.graphs.algorithms import dijkstra, k_menores_caminhos
+from src.graphs.io import carregar_grafo_recife
+
+DATA_DIR = "data"
+PATH_NODES = f"{DATA_DIR}/bairros_unique.csv"
+PATH_EDGES = f"{DATA_DIR}/adjacencia_bairros.csv"
+
+def _custo(G, caminho):
+    return sum(G.get_peso(a, b) for a, b in zip(caminho, caminho[1:]))
+
+def _todos_simples(G, origem, destino):
+    """Força bruta: todos os caminhos simples, em ordem de custo."""
+    saida = []
+    def visitar(caminho):
+        u = caminho[-1]
+        if u == destino:
+            saida.append((_custo(G, caminho), list(caminho)))
+            return
+        for v in G.get_vizinhos(u):
+            if v not in caminho:
+                caminho.append(v)
+                visitar(caminho)
+                caminho.pop()
+    visitar([origem])
+    return sorted(saida, key=lambda x: x[0])
+
+def test_yen_exemplo_pequeno():
+    G = Graph()
+    for n in "CDEFGH":
+        G.adicionar_no(n, None)
+    for u, v, w in [("C","D",3), ("C","E",2), ("D","F",4), ("E","D",1),
+                    ("E","F",2), ("E","G",3), ("F","G",2), ("F","H",1), ("G","H",2)]:
+        G.adicionar_aresta(u, v, w)
+
+    rotas = list(k_menores_caminhos(G, "C", "H", 3))
+    assert rotas[0] == dijkstra(G, "C", "H")
+    assert [c for c, _ in rotas] == [5.0, 7.0, 7.0]
+    assert rotas[0][1] == ["C", "E", "F", "H"]
+
+def test_yen_contra_forca_bruta():
+    rng = random.Random(7)
+    for _ in range(20):
+        G = Graph()
+        nos = [f"n{i}" for i in range(7)]
+        for n in nos:
+            G.adicionar_no(n, None)
+        for u, v in itertools.combinations(nos, 2):
+            if rng.random() < 0.5:
+                G.adicionar_aresta(u, v, rng.randint(1, 9))
+        origem, destino = rng.sample(nos, 2)
+
+        esperado = _todos_simples(G, origem, destino)
+        rotas = list(k_menores_caminhos(G, origem, destino))   # k=None: todos
+        assert len(rotas) == len(esperado)
+        assert [c for c, _ in rotas] == [c for c, _ in esperado]
+        assert len({tuple(p) for _, p in rotas}) == len(rotas)
+        for c, p in rotas:
+            assert p[0] == origem and p[-1] == destino
+            assert len(set(p)) == len(p)
+            assert math.isclose(c, _custo(G, p))
+
+def test_yen_preguicoso_e_casos_limite():
+    G = Graph()
+    for n in "ABCX":
+        G.adicionar_no(n, None)
+    G.adicionar_aresta("A", "B", 1)
+    G.adicionar_aresta("B", "C", 1)
+    G.adicionar_aresta("A", "C", 3)
+
+    gen = k_menores_caminhos(G, "A", "C", 10)
+    assert next(gen) == (2.0, ["A", "B", "C"])
+    assert next(gen) == (3.0, ["A", "C"])
+    assert list(gen) == []
+
+    assert list(k_menores_caminhos(G, "A", "X", 3)) == []
+    assert list(k_menores_caminhos(G, "A", "Nada", 3)) == []
+    assert list(k_menores_caminhos(G, "A", "C", 0)) == []
+    assert list(k_menores_caminhos(G, "A", "A", 3)) == [(0.0, ["A"])]
+
+def test_yen_recife():
+    G = carregar_grafo_recife(PATH_NODES, PATH_EDGES)[0]
+    rotas = list(k_menores_caminhos(G, "Nova Descoberta", "Boa Viagem", 5))
+    assert len(rotas) == 5
+    assert rotas[0] == dijkstra(G, "Nova Descoberta", "Boa Viagem")
+    custos = [c for c, _ in rotas]
+    assert custos == sorted(custos)
+    assert len({tuple(p) for _, p in rotas}) == 5
+    for c, p in rotas:
+        assert len(set(p)) == len(p)
+        assert math.isclose(c, _custo(G, p))